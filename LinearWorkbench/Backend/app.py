@@ -1,19 +1,47 @@
-from typing import List, Optional, Literal
-from fastapi import FastAPI
-from pydantic import BaseModel
-
-from core.matrixOperations import (
-    add_matrices_with_steps,
-    subtract_matrices_with_steps,
-    multiply_matrices_with_steps,
-    scalar_multiply_with_steps,
-    transpose_with_steps,
-    inverse_with_steps,
+import json
+from typing import Annotated, Any, Callable, Dict, List, Optional, Literal, Tuple, Union
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field, WrapValidator
+
+from core.matrixOperations import iter_matrix_operation, matrix_operation
+from core.linearSystems import iter_gauss_jordan, solve_linear_system_gauss_jordan
+from core.vectorLab import check_independence, check_basis, combination_batch, orthonormalize
+from core.determinants import determinant_with_steps, iter_determinant
+
+from core.common import StepResult, Verbosity, finished_stream
+from core.budget import (
+    SYMBOLIC_COST,
+    determinant_cost,
+    elimination_cost,
+    iterative_cost,
+    polynomial_cost,
+    matrix_operation_cost,
+    vectors_cost,
 )
-from core.linearSystems import solve_linear_system_gauss_jordan
-from core.vectorLab import check_independence, check_basis
-from core.determinants import determinant_with_steps
-
+from core.executor import compute_executor, policy_for
+from core.stepStreaming import NDJSON_MEDIA_TYPE, SSE_MEDIA_TYPE, ndjson_lines, sse_lines, stream_events
+from core.matrixTransport import (
+    MSGPACK_MEDIA_TYPE,
+    NPY_MEDIA_TYPE,
+    MatrixFormatError,
+    accept_format,
+    body_format,
+    decode_matrix,
+    encode_matrix,
+    encode_npy,
+    msgpack,
+    pack_msgpack,
+    read_npy,
+    unpack_msgpack,
+)
+from core.rootJobs import MAX_JOB_TIMEOUT, stream_batch
+from core.responseCache import response_cache
+from core.derivativeCache import derivative_cache, jacobian_cache
+from core.expressionCompiler import expression_cache_info
+from core.nonlinearSystems import solve_nonlinear_system
 from core.numericalConcepts import (
     decompose_base10,
     decompose_base2,
@@ -24,10 +52,25 @@ from core.numericalConcepts import (
     solve_false_position,
     solve_newton_raphson,
     solve_secant,
+    solve_all_roots,
+    solve_bracket_sweep,
+    solve_brent,
+    solve_newton_bisection,
+    compare_root_methods,
+    solve_accelerated,
+    solve_polynomial_roots,
 )
 
 
-app = FastAPI(title="Numerical Lab API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # trabajadores del pool de cálculo arrancados antes de la primera petición
+    compute_executor.warm()
+    yield
+    compute_executor.shutdown()
+
+
+app = FastAPI(title="Numerical Lab API", lifespan=lifespan)
 
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -41,8 +84,35 @@ app.add_middleware(
 
 
 
+class BudgetInfo(BaseModel):
+    reason: Literal["estimated_cost", "time", "memory", "worker_died"]
+    estimated_cost: Optional[float] = None
+    wall_time: float
+    memory_mb: Optional[int] = None
+    partial: bool
+
+
+def binary_matrix(value: Any, handler: Callable[[Any], Any]) -> Any:
+    """Una matriz también puede llegar en forma binaria {"shape", "dtype", "order", "data"}
+    (base64 en JSON, bytes en MessagePack y .npy): se decodifica sin validar cada número."""
+    if isinstance(value, dict):
+        return decode_matrix(value)
+    return handler(value)
+
+
+MatrixData = Annotated[List[List[float]], WrapValidator(binary_matrix)]
+
+
+class EncodedMatrix(BaseModel):
+    """Matriz en forma binaria: valores float64 little-endian por filas, en base64."""
+    dtype: str = "<f8"
+    shape: List[int]
+    order: Literal["C", "F"] = "C"
+    data: str
+
+
 class MatrixPayload(BaseModel):
-    data: List[List[float]]
+    data: MatrixData
 
 
 class MatrixOperationRequest(BaseModel):
@@ -50,16 +120,21 @@ class MatrixOperationRequest(BaseModel):
     a: MatrixPayload
     b: Optional[MatrixPayload] = None
     scalar: Optional[float] = None
+    verbosity: Verbosity = "full"
+    # "base64": la matriz resultado se devuelve en forma binaria (EncodedMatrix)
+    matrix_encoding: Literal["list", "base64"] = "list"
 
 
 class MatrixOperationResponse(BaseModel):
-    result: Optional[List[List[float]]] = None
+    result: Optional[Union[List[List[float]], EncodedMatrix]] = None
     steps: List[str]
     error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
 
 
 class LinearSystemRequest(BaseModel):
-    augmented: List[List[float]]
+    augmented: MatrixData
+    verbosity: Verbosity = "full"
 
 
 class LinearSystemResponse(BaseModel):
@@ -67,27 +142,71 @@ class LinearSystemResponse(BaseModel):
     solution: Optional[List[float]] = None
     steps: List[str]
     error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
 
 
 class VectorsRequest(BaseModel):
     vectors: List[List[float]]
+    show_steps: Optional[bool] = None
+    verbosity: Verbosity = "full"
 
 
 class VectorsResponse(BaseModel):
     steps: List[str]
     solution_type: Optional[str] = None
+    rank: Optional[int] = None
+    independent: Optional[List[int]] = None
+    dependent: Optional[List[int]] = None
+    coefficients: Optional[List[List[float]]] = None
     error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class CombinationBatchRequest(BaseModel):
+    vectors: List[List[float]]
+    targets: List[List[float]]
+    verbosity: Verbosity = "full"
+
+
+class CombinationBatchResponse(BaseModel):
+    steps: List[str]
+    rank: Optional[int] = None
+    members: Optional[List[bool]] = None
+    coefficients: Optional[List[Optional[List[float]]]] = None
+    residuals: Optional[List[float]] = None
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class OrthonormalizeRequest(BaseModel):
+    vectors: List[List[float]]
+    method: Literal["mgs", "householder"] = "mgs"
+    reorthogonalize: bool = True
+    show_steps: Optional[bool] = None
+    verbosity: Verbosity = "full"
+
+
+class OrthonormalizeResponse(BaseModel):
+    steps: List[str]
+    basis: Optional[List[List[float]]] = None
+    rank: Optional[int] = None
+    indices: Optional[List[int]] = None
+    orthogonality_loss: Optional[float] = None
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
 
 
 class DeterminantRequest(BaseModel):
-    matrix: List[List[float]]
+    matrix: MatrixData
     method: Literal["cofactors", "sarrus", "cramer"] = "cofactors"
+    verbosity: Verbosity = "full"
 
 
 class DeterminantResponse(BaseModel):
     determinant: Optional[float] = None
     steps: List[str]
     error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
 
 
 class DecompositionRequest(BaseModel):
@@ -115,12 +234,15 @@ class BisectionRequest(BaseModel):
     b: float
     tol: float = 1e-4
     max_iter: int = 50
+    verbosity: Verbosity = "full"
 
 class NewtonRaphsonRequest(BaseModel):
     expr: str
     x0: float
     tol: float = 1e-4
     max_iter: int = 50
+    symbolic_derivative: bool = False
+    verbosity: Verbosity = "full"
 
 class SecantRequest(BaseModel):
     expr: str
@@ -128,16 +250,303 @@ class SecantRequest(BaseModel):
     x1: float
     tol: float = 1e-4
     max_iter: int = 50
+    verbosity: Verbosity = "full"
 
-class NumericalResponse(BaseModel):
+class CompareMethodsRequest(BaseModel):
+    expr: str
+    a: float
+    b: float
+    x0: Optional[float] = None
+    tol: float = 1e-10
+    max_iter: int = 100
+    verbosity: Verbosity = "full"
+
+
+class MethodBenchmark(BaseModel):
+    method: str
+    root: Optional[float] = None
+    residual: Optional[float] = None
+    iterations: int
+    evaluations: int
+    time_ms: float
+    error: Optional[str] = None
+
+
+class CompareMethodsResponse(BaseModel):
+    methods: Optional[List[MethodBenchmark]] = None
+    steps: List[str]
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class RootJob(BaseModel):
+    id: Optional[str] = None
+    method: Literal["bisection", "false_position", "newton_raphson", "secant", "brent", "newton_bisection"]
+    expr: str
+    a: Optional[float] = None
+    b: Optional[float] = None
+    x0: Optional[float] = None
+    x1: Optional[float] = None
+    tol: float = 1e-6
+    max_iter: int = 100
+    include_steps: bool = False
+
+
+class BatchRequest(BaseModel):
+    jobs: List[RootJob]
+    timeout: float = Field(5.0, gt=0, le=MAX_JOB_TIMEOUT)  # segundos por trabajo
+
+
+class AccelerationRequest(BaseModel):
+    expr: str
+    method: Literal["false_position", "secant", "newton_raphson"]
+    acceleration: Literal["aitken", "steffensen", "illinois", "pegasus"]
+    a: Optional[float] = None
+    b: Optional[float] = None
+    x0: Optional[float] = None
+    x1: Optional[float] = None
+    tol: float = 1e-10
+    max_iter: int = 100
+    verbosity: Verbosity = "full"
+
+
+class AccelerationResponse(BaseModel):
     value: Optional[float] = None
+    iterations: Optional[int] = None
+    evaluations: Optional[int] = None
+    raw_iterations: Optional[int] = None
+    raw_evaluations: Optional[int] = None
+    steps: List[str]
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class BracketSweepRequest(BaseModel):
+    expr: str
+    intervals: List[List[float]]
+    method: Literal["bisection", "illinois"] = "bisection"
+    tol: float = 1e-10
+    max_iter: int = 200
+    verbosity: Verbosity = "full"
+
+
+class BracketSweepResponse(BaseModel):
+    values: Optional[List[Optional[float]]] = None
+    iterations: Optional[List[int]] = None
+    errors: Optional[List[Optional[str]]] = None
+    steps: List[str]
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class AllRootsRequest(BaseModel):
+    expr: str
+    a: float
+    b: float
+    samples: int = 1000
+    tol: float = 1e-10
+    max_iter: int = 200
+    verbosity: Verbosity = "full"
+
+
+class RootInfoModel(BaseModel):
+    x: float
+    fx: float
+    iterations: int
+    kind: Literal["sign_change", "grid_zero", "touch"]
+    bracket: List[float]
+
+
+class AllRootsResponse(BaseModel):
+    values: Optional[List[float]] = None
+    roots: Optional[List[RootInfoModel]] = None
+    steps: List[str]
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class NonlinearSystemRequest(BaseModel):
+    exprs: List[str]
+    x0: List[float]
+    variables: Optional[List[str]] = None
+    method: Literal["newton", "chord", "broyden"] = "newton"
+    jacobian: Literal["ad", "sympy"] = "ad"
+    tol: float = 1e-10
+    max_iter: int = 50
+    verbosity: Verbosity = "full"
+
+
+class NonlinearSystemResponse(BaseModel):
+    values: Optional[List[float]] = None
+    iterations: Optional[int] = None
+    evaluations: Optional[int] = None
+    jacobian_evaluations: Optional[int] = None
+    factorizations: Optional[int] = None
+    steps: List[str]
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class PolynomialRootsRequest(BaseModel):
+    expr: str
+    verbosity: Verbosity = "full"
+
+
+class PolynomialRootsResponse(BaseModel):
     values: Optional[List[float]] = None
+    complex_roots: Optional[List[List[float]]] = None
+    coefficients: Optional[List[float]] = None
+    qr_iterations: Optional[int] = None
     steps: List[str]
     error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
 
 
-@app.post("/matrix/operate", response_model=MatrixOperationResponse)
-def matrix_operate(payload: MatrixOperationRequest):
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class NumericalCacheResponse(BaseModel):
+    derivatives: CacheStats
+    jacobians: CacheStats
+    expressions: CacheStats
+
+
+class ExecutorStats(BaseModel):
+    workers: int
+    pending: int
+    max_pending: int
+    completed: int
+    inline: int
+    rejected: int
+    coalesced: int
+    in_flight: int
+
+
+class EndpointCacheStats(BaseModel):
+    hits: int
+    misses: int
+
+
+class ResponseCacheStats(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+    disk_hits: int
+    expired: int
+    evictions: int
+    size: int
+    maxsize: int
+    ttl: float
+    disk_size: Optional[int] = None
+    endpoints: Dict[str, EndpointCacheStats]
+
+
+class NumericalResponse(BaseModel):
+    value: Optional[float] = None
+    values: Optional[List[float]] = None
+    iterations: Optional[int] = None
+    steps: List[str]
+    error: Optional[str] = None
+    budget: Optional[BudgetInfo] = None
+
+
+class _DecodedRequest(Request):
+    """Petición binaria ya decodificada, presentada a FastAPI como JSON."""
+
+    def __init__(self, request: Request, body: bytes, payload: Any):
+        headers = [(k, v) for k, v in request.scope["headers"] if k != b"content-type"]
+        super().__init__({**request.scope, "headers": headers + [(b"content-type", b"application/json")]}, request.receive)
+        self._raw_body = body
+        self._payload = payload
+
+    async def body(self) -> bytes:
+        return self._raw_body
+
+    async def json(self) -> Any:
+        return self._payload
+
+
+# campo de la carga que ocupa un cuerpo .npy (el resto de campos van en la query string)
+NPY_BODY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "/matrix/operate": ("a", "data"),
+    "/linear-systems/solve": ("augmented",),
+    "/determinants/calculate": ("matrix",),
+}
+
+
+class MatrixRoute(APIRoute):
+    """Endpoints de matrices: el cuerpo puede ser JSON, MessagePack o un .npy.
+
+    MessagePack lleva la misma carga que el JSON; las matrices pueden ir como listas o en
+    forma binaria. Un .npy es la matriz principal del endpoint (NPY_BODY_FIELDS).
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        npy_field = NPY_BODY_FIELDS[self.path]
+
+        async def route_handler(request: Request) -> Response:
+            fmt = body_format(request.headers.get("content-type"))
+            if fmt == "json":
+                return await handler(request)
+            if fmt is None or (fmt == "msgpack" and msgpack is None):
+                accepted = ["application/json", NPY_MEDIA_TYPE] + ([MSGPACK_MEDIA_TYPE] if msgpack else [])
+                return JSONResponse({"detail": f"Content-Type no admitido; use {', '.join(accepted)}"}, 415)
+            body = await request.body()
+            try:
+                if fmt == "msgpack":
+                    payload = unpack_msgpack(body)
+                else:
+                    payload = dict(request.query_params)
+                    target = payload
+                    for key in npy_field[:-1]:
+                        target = target.setdefault(key, {})
+                    target[npy_field[-1]] = read_npy(body)
+            except MatrixFormatError as e:
+                return JSONResponse({"detail": str(e)}, 400)
+            return await handler(_DecodedRequest(request, body, payload))
+
+        return route_handler
+
+
+BINARY_BODIES = {
+    "requestBody": {
+        "content": {
+            MSGPACK_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            NPY_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+        }
+    }
+}
+
+matrix_router = APIRouter(route_class=MatrixRoute)
+
+
+def negotiated(request: Request, response: BaseModel, array: Any) -> Any:
+    """La respuesta en el formato que pide Accept.
+
+    .npy lleva solo el array principal (matriz, solución o determinante); si no lo hay, por
+    ejemplo tras un error, se responde en JSON. MessagePack lleva la respuesta completa con
+    las matrices en forma binaria.
+    """
+    fmt = accept_format(request.headers.get("accept"))
+    if fmt == "npy" and array is not None:
+        return Response(encode_npy(array), media_type=NPY_MEDIA_TYPE)
+    if fmt == "msgpack" and msgpack is not None:
+        fields = {k: v.model_dump() if isinstance(v, BaseModel) else v for k, v in response}
+        return Response(pack_msgpack(fields), media_type=MSGPACK_MEDIA_TYPE)
+    return response
+
+
+def matrix_result(m: Optional[List[List[float]]], encoding: str) -> Any:
+    return encode_matrix(m, as_text=True) if m is not None and encoding == "base64" else m
+
+
+@matrix_router.post("/matrix/operate", response_model=MatrixOperationResponse, openapi_extra=BINARY_BODIES)
+async def matrix_operate(payload: MatrixOperationRequest, request: Request):
     a = payload.a.data
     b = payload.b.data if payload.b else None
 
@@ -146,51 +555,156 @@ def matrix_operate(payload: MatrixOperationRequest):
     if payload.operation == "scalar" and payload.scalar is None:
         return MatrixOperationResponse(steps=["Falta escalar"], error="missing_scalar")
 
-    if payload.operation == "add":
-        res = add_matrices_with_steps(a, b)          # type: ignore[arg-type]
-    elif payload.operation == "subtract":
-        res = subtract_matrices_with_steps(a, b)     # type: ignore[arg-type]
-    elif payload.operation == "multiply":
-        res = multiply_matrices_with_steps(a, b)     # type: ignore[arg-type]
-    elif payload.operation == "scalar":
-        res = scalar_multiply_with_steps(a, payload.scalar)  # type: ignore[arg-type]
-    elif payload.operation == "transpose":
-        res = transpose_with_steps(a)
-    elif payload.operation == "inverse":
-        res = inverse_with_steps(a)
-    else:
-        return MatrixOperationResponse(steps=["Operación no soportada"], error="unsupported")
+    res = await compute_executor.run(
+        "matrix_operate",
+        matrix_operation,
+        (payload.operation, a, b, payload.scalar, payload.verbosity),
+        matrix_operation_cost(payload.operation, a, b),
+    )
+    response = MatrixOperationResponse(
+        result=matrix_result(res.matrix, payload.matrix_encoding), steps=res.steps, error=res.error, **(res.details or {})
+    )
+    return negotiated(request, response, res.matrix)
 
-    return MatrixOperationResponse(result=res.matrix, steps=res.steps, error=res.error)
 
+def step_stream_response(request: Request, events) -> StreamingResponse:
+    """SSE si el cliente lo pide en Accept; si no, NDJSON (un evento JSON por línea)."""
+    if SSE_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(sse_lines(events), media_type=SSE_MEDIA_TYPE)
+    return StreamingResponse(ndjson_lines(events), media_type=NDJSON_MEDIA_TYPE)
 
-@app.post("/linear-systems/solve", response_model=LinearSystemResponse)
-def solve_linear_system_api(payload: LinearSystemRequest):
-    res = solve_linear_system_gauss_jordan(payload.augmented)
-    return LinearSystemResponse(
+
+def matrix_operation_payload(res: StepResult, encoding: str = "list") -> dict:
+    return MatrixOperationResponse(
+        result=matrix_result(res.matrix, encoding), steps=[], error=res.error, **(res.details or {})
+    ).model_dump()
+
+
+@app.post("/matrix/operate/stream")
+def matrix_operate_stream(payload: MatrixOperationRequest, request: Request):
+    """Como /matrix/operate, pero envía cada paso según se calcula y el resultado como último evento."""
+    a = payload.a.data
+    b = payload.b.data if payload.b else None
+
+    if payload.operation in ("add", "subtract", "multiply") and b is None:
+        stream_func, args = finished_stream, (StepResult(steps=["Falta matriz B"], error="missing_b"),)
+    elif payload.operation == "scalar" and payload.scalar is None:
+        stream_func, args = finished_stream, (StepResult(steps=["Falta escalar"], error="missing_scalar"),)
+    else:
+        stream_func, args = iter_matrix_operation, (payload.operation, a, b, payload.scalar, payload.verbosity)
+    events = stream_events(
+        stream_func,
+        args,
+        lambda res: matrix_operation_payload(res, payload.matrix_encoding),
+        matrix_operation_cost(payload.operation, a, b),
+        payload.verbosity,
+        policy_for("matrix_operate"),
+    )
+    return step_stream_response(request, events)
+
+
+@matrix_router.post("/linear-systems/solve", response_model=LinearSystemResponse, openapi_extra=BINARY_BODIES)
+async def solve_linear_system_api(payload: LinearSystemRequest, request: Request):
+    res = await compute_executor.run(
+        "linear_systems", solve_linear_system_gauss_jordan, (payload.augmented, payload.verbosity), elimination_cost(payload.augmented)
+    )
+    response = LinearSystemResponse(
         solution_type=res.solution_type,
         solution=res.vector,
         steps=res.steps,
         error=res.error,
+        **(res.details or {}),
+    )
+    return negotiated(request, response, res.vector)
+
+
+def linear_system_payload(res: StepResult) -> dict:
+    return LinearSystemResponse(
+        solution_type=res.solution_type, solution=res.vector, steps=[], error=res.error, **(res.details or {})
+    ).model_dump()
+
+
+@app.post("/linear-systems/solve/stream")
+def solve_linear_system_stream(payload: LinearSystemRequest, request: Request):
+    events = stream_events(
+        iter_gauss_jordan,
+        (payload.augmented, payload.verbosity),
+        linear_system_payload,
+        elimination_cost(payload.augmented),
+        payload.verbosity,
+        policy_for("linear_systems"),
     )
+    return step_stream_response(request, events)
 
 
 @app.post("/vectors/independence", response_model=VectorsResponse)
-def vectors_independence(payload: VectorsRequest):
-    res = check_independence(payload.vectors)
-    return VectorsResponse(steps=res.steps, solution_type=res.solution_type, error=res.error)
+async def vectors_independence(payload: VectorsRequest):
+    res = await compute_executor.run(
+        "vectors_independence", check_independence, (payload.vectors, payload.show_steps, payload.verbosity), vectors_cost(payload.vectors)
+    )
+    return VectorsResponse(steps=res.steps, solution_type=res.solution_type, error=res.error, **(res.details or {}))
 
 
 @app.post("/vectors/basis", response_model=VectorsResponse)
-def vectors_basis(payload: VectorsRequest):
-    res = check_basis(payload.vectors)
-    return VectorsResponse(steps=res.steps, solution_type=res.solution_type, error=res.error)
+async def vectors_basis(payload: VectorsRequest):
+    res = await compute_executor.run(
+        "vectors_basis", check_basis, (payload.vectors, payload.show_steps, payload.verbosity), vectors_cost(payload.vectors)
+    )
+    return VectorsResponse(steps=res.steps, solution_type=res.solution_type, error=res.error, **(res.details or {}))
+
+
+@app.post("/vectors/combination/batch", response_model=CombinationBatchResponse)
+async def vectors_combination_batch(payload: CombinationBatchRequest):
+    res = await compute_executor.run(
+        "vectors_combination",
+        combination_batch,
+        (payload.vectors, payload.targets, payload.verbosity),
+        vectors_cost(payload.vectors, len(payload.targets)),
+    )
+    return CombinationBatchResponse(steps=res.steps, error=res.error, **(res.details or {}))
+
+
+@app.post("/vectors/orthonormalize", response_model=OrthonormalizeResponse)
+async def vectors_orthonormalize(payload: OrthonormalizeRequest):
+    res = await compute_executor.run(
+        "vectors_orthonormalize",
+        orthonormalize,
+        (payload.vectors, payload.method, payload.reorthogonalize, payload.show_steps, payload.verbosity),
+        vectors_cost(payload.vectors),
+    )
+    return OrthonormalizeResponse(steps=res.steps, basis=res.matrix, error=res.error, **(res.details or {}))
+
 
+@matrix_router.post("/determinants/calculate", response_model=DeterminantResponse, openapi_extra=BINARY_BODIES)
+async def determinants_calculate(payload: DeterminantRequest, request: Request):
+    res = await compute_executor.run(
+        "determinants",
+        determinant_with_steps,
+        (payload.matrix, payload.method, payload.verbosity),
+        determinant_cost(payload.matrix, payload.method),
+    )
+    response = DeterminantResponse(determinant=res.determinant, steps=res.steps, error=res.error, **(res.details or {}))
+    return negotiated(request, response, res.determinant)
+
+
+def determinant_payload(res: StepResult) -> dict:
+    return DeterminantResponse(determinant=res.determinant, steps=[], error=res.error, **(res.details or {})).model_dump()
+
+
+@app.post("/determinants/calculate/stream")
+def determinants_calculate_stream(payload: DeterminantRequest, request: Request):
+    events = stream_events(
+        iter_determinant,
+        (payload.matrix, payload.method, payload.verbosity),
+        determinant_payload,
+        determinant_cost(payload.matrix, payload.method),
+        payload.verbosity,
+        policy_for("determinants"),
+    )
+    return step_stream_response(request, events)
 
-@app.post("/determinants/calculate", response_model=DeterminantResponse)
-def determinants_calculate(payload: DeterminantRequest):
-    res = determinant_with_steps(payload.matrix, payload.method)
-    return DeterminantResponse(determinant=res.determinant, steps=res.steps, error=res.error)
+
+app.include_router(matrix_router)
 
 
 @app.post("/numerical/decompose/base10", response_model=NumericalResponse)
@@ -225,42 +739,206 @@ def numerical_propagation(payload: NumericalPropagationRequest):
 
 
 @app.post("/numerical/bisection", response_model=NumericalResponse)
-def numerical_bisection(payload: BisectionRequest):
-    res = solve_bisection(payload.expr, payload.a, payload.b, payload.tol, payload.max_iter)
+async def numerical_bisection(payload: BisectionRequest):
+    res = await compute_executor.run(
+        "bisection",
+        solve_bisection,
+        (payload.expr, payload.a, payload.b, payload.tol, payload.max_iter, payload.verbosity),
+        iterative_cost(payload.expr, payload.max_iter),
+    )
     value = res.vector[0] if res.vector else None
-    return NumericalResponse(value=value, steps=res.steps, error=res.error)
+    return NumericalResponse(value=value, steps=res.steps, error=res.error, **(res.details or {}))
 
 @app.post("/numerical/false-position", response_model=NumericalResponse)
-def numerical_false_position(payload: BisectionRequest):
-    res = solve_false_position(payload.expr, payload.a, payload.b, payload.tol, payload.max_iter)
+async def numerical_false_position(payload: BisectionRequest):
+    res = await compute_executor.run(
+        "false_position",
+        solve_false_position,
+        (payload.expr, payload.a, payload.b, payload.tol, payload.max_iter, payload.verbosity),
+        iterative_cost(payload.expr, payload.max_iter),
+    )
     value = res.vector[0] if res.vector else None
     return NumericalResponse(
         value=value,
         steps=res.steps,
         error=res.error,
+        **(res.details or {}),
     )
 
 @app.post("/numerical/newton-raphson", response_model=NumericalResponse)
-def numerical_newton_raphson(payload: NewtonRaphsonRequest):
-    res = solve_newton_raphson(payload.expr, payload.x0, payload.tol, payload.max_iter)
+async def numerical_newton_raphson(payload: NewtonRaphsonRequest):
+    res = await compute_executor.run(
+        "newton_raphson_symbolic" if payload.symbolic_derivative else "newton_raphson",
+        solve_newton_raphson,
+        (payload.expr, payload.x0, payload.tol, payload.max_iter, payload.symbolic_derivative, payload.verbosity),
+        iterative_cost(payload.expr, payload.max_iter) + (SYMBOLIC_COST if payload.symbolic_derivative else 0.0),
+    )
     value = res.vector[0] if res.vector else None
     return NumericalResponse(
         value=value,
         steps=res.steps,
         error=res.error,
+        **(res.details or {}),
     )
 
 @app.post("/numerical/secant", response_model=NumericalResponse)
-def numerical_secant(payload: SecantRequest):
-    res = solve_secant(payload.expr, payload.x0, payload.x1, payload.tol, payload.max_iter)
+async def numerical_secant(payload: SecantRequest):
+    res = await compute_executor.run(
+        "secant",
+        solve_secant,
+        (payload.expr, payload.x0, payload.x1, payload.tol, payload.max_iter, payload.verbosity),
+        iterative_cost(payload.expr, payload.max_iter),
+    )
     value = res.vector[0] if res.vector else None
     return NumericalResponse(
         value=value,
         steps=res.steps,
         error=res.error,
+        **(res.details or {}),
     )
 
 
+@app.post("/numerical/brent", response_model=NumericalResponse)
+async def numerical_brent(payload: BisectionRequest):
+    res = await compute_executor.run(
+        "brent",
+        solve_brent,
+        (payload.expr, payload.a, payload.b, payload.tol, payload.max_iter, payload.verbosity),
+        iterative_cost(payload.expr, payload.max_iter),
+    )
+    value = res.vector[0] if res.vector else None
+    return NumericalResponse(
+        value=value,
+        steps=res.steps,
+        error=res.error,
+        **(res.details or {}),
+    )
+
+
+@app.post("/numerical/newton-bisection", response_model=NumericalResponse)
+async def numerical_newton_bisection(payload: BisectionRequest):
+    res = await compute_executor.run(
+        "newton_bisection",
+        solve_newton_bisection,
+        (payload.expr, payload.a, payload.b, payload.tol, payload.max_iter, payload.verbosity),
+        iterative_cost(payload.expr, payload.max_iter),
+    )
+    value = res.vector[0] if res.vector else None
+    return NumericalResponse(
+        value=value,
+        steps=res.steps,
+        error=res.error,
+        **(res.details or {}),
+    )
+
+
+@app.post("/numerical/compare", response_model=CompareMethodsResponse)
+async def numerical_compare(payload: CompareMethodsRequest):
+    res = await compute_executor.run(
+        "compare",
+        compare_root_methods,
+        (payload.expr, payload.a, payload.b, payload.tol, payload.max_iter, payload.x0, payload.verbosity),
+        iterative_cost(payload.expr, 6 * payload.max_iter),
+    )
+    return CompareMethodsResponse(steps=res.steps, error=res.error, **(res.details or {}))
+
+
+@app.post("/numerical/accelerate", response_model=AccelerationResponse)
+async def numerical_accelerate(payload: AccelerationRequest):
+    res = await compute_executor.run(
+        "accelerate",
+        solve_accelerated,
+        (
+            payload.expr, payload.method, payload.acceleration,
+            payload.a, payload.b, payload.x0, payload.x1, payload.tol, payload.max_iter, payload.verbosity,
+        ),
+        iterative_cost(payload.expr, 4 * payload.max_iter),
+    )
+    value = res.vector[0] if res.vector else None
+    return AccelerationResponse(value=value, steps=res.steps, error=res.error, **(res.details or {}))
+
+
+@app.post("/numerical/batch")
+def numerical_batch(payload: BatchRequest):
+    """Trabajos de raíces en un pool de procesos; responde NDJSON (un resultado por línea, según
+    terminan, y un resumen final por método)."""
+    jobs = [job.model_dump() for job in payload.jobs]
+    lines = (json.dumps(item, ensure_ascii=False) + "\n" for item in stream_batch(jobs, payload.timeout))
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@app.post("/numerical/batch/brackets", response_model=BracketSweepResponse)
+async def numerical_bracket_sweep(payload: BracketSweepRequest):
+    res = await compute_executor.run(
+        "bracket_sweep",
+        solve_bracket_sweep,
+        (payload.expr, payload.intervals, payload.method, payload.tol, payload.max_iter, payload.verbosity),
+        iterative_cost(payload.expr, len(payload.intervals) * payload.max_iter),
+    )
+    return BracketSweepResponse(steps=res.steps, error=res.error, **(res.details or {}))
+
+
+@app.post("/numerical/roots/all", response_model=AllRootsResponse)
+async def numerical_all_roots(payload: AllRootsRequest):
+    res = await compute_executor.run(
+        "all_roots",
+        solve_all_roots,
+        (payload.expr, payload.a, payload.b, payload.samples, payload.tol, payload.max_iter, payload.verbosity),
+        iterative_cost(payload.expr, payload.samples + 10 * payload.max_iter),
+    )
+    return AllRootsResponse(values=res.vector, steps=res.steps, error=res.error, **(res.details or {}))
+
+
+@app.post("/numerical/nonlinear-system", response_model=NonlinearSystemResponse)
+async def numerical_nonlinear_system(payload: NonlinearSystemRequest):
+    n = len(payload.x0)
+    cost = sum(iterative_cost(e, payload.max_iter * (n + 1)) for e in payload.exprs) + payload.max_iter * n ** 3
+    res = await compute_executor.run(
+        "nonlinear_system",
+        solve_nonlinear_system,
+        (
+            payload.exprs, payload.x0, payload.variables, payload.method, payload.jacobian,
+            payload.tol, payload.max_iter, payload.verbosity,
+        ),
+        cost + (SYMBOLIC_COST if payload.jacobian == "sympy" else 0.0),
+    )
+    return NonlinearSystemResponse(values=res.vector, steps=res.steps, error=res.error, **(res.details or {}))
+
+
+@app.post("/numerical/roots/polynomial", response_model=PolynomialRootsResponse)
+async def numerical_polynomial_roots(payload: PolynomialRootsRequest):
+    res = await compute_executor.run(
+        "polynomial_roots", solve_polynomial_roots, (payload.expr, payload.verbosity), polynomial_cost(payload.expr)
+    )
+    return PolynomialRootsResponse(values=res.vector, steps=res.steps, error=res.error, **(res.details or {}))
+
+
+@app.get("/numerical/cache", response_model=NumericalCacheResponse)
+def numerical_cache():
+    info = expression_cache_info()
+    return NumericalCacheResponse(
+        derivatives=CacheStats(**derivative_cache.info()),
+        jacobians=CacheStats(**jacobian_cache.info()),
+        expressions=CacheStats(hits=info.hits, misses=info.misses, size=info.currsize, maxsize=info.maxsize),
+    )
+
+
+@app.get("/cache", response_model=ResponseCacheStats)
+def response_cache_stats():
+    return ResponseCacheStats(**response_cache.info())
+
+
+@app.delete("/cache", response_model=ResponseCacheStats)
+def response_cache_clear():
+    response_cache.clear()
+    return ResponseCacheStats(**response_cache.info())
+
+
+@app.get("/executor", response_model=ExecutorStats)
+def executor_stats():
+    return ExecutorStats(**compute_executor.info())
+
+
 @app.get("/")
 def root():
     return {"message": "Numerical Lab API running"}
@@ -0,0 +1,198 @@
+import math
+from collections import deque
+from typing import Callable, Deque, Iterator, Literal, NamedTuple, Optional, Tuple
+
+Acceleration = Literal["aitken", "steffensen", "illinois", "pegasus"]
+FalsePositionVariant = Literal["plain", "illinois", "pegasus"]
+
+
+class CountingFunction:
+    """Envuelve f (o f con value_and_derivative) y cuenta las evaluaciones."""
+
+    __slots__ = ("_f", "count")
+
+    def __init__(self, f):
+        self._f = f
+        self.count = 0
+
+    def __call__(self, x: float) -> float:
+        self.count += 1
+        return self._f(x)
+
+    def value_and_derivative(self, x: float) -> Tuple[float, float]:
+        self.count += 1
+        return self._f.value_and_derivative(x)
+
+
+# ── pasos de los métodos base: cada uno produce el estado de una iteración ──
+# solve_false_position, solve_secant y solve_newton_raphson los recorren para su traza;
+# los iteradores sin acelerar de más abajo se quedan solo con los iterados.
+
+
+class FalsePositionStep(NamedTuple):
+    a: float  # extremo retenido
+    b: float  # último iterado (o el extremo inicial b)
+    fa: float
+    fb: float
+    c: float
+    fc: float
+
+
+class SecantStep(NamedTuple):
+    x0: float
+    f0: float
+    x1: float
+    f1: float
+    x2: Optional[float]  # None si f(x₁) = f(x₀) fuera de una raíz exacta
+
+
+class NewtonStep(NamedTuple):
+    x: float
+    fx: float
+    dfx: float
+    x_next: Optional[float]  # None si f′(x) = 0 fuera de una raíz exacta
+
+
+def false_position_steps(
+    f: Callable[[float], float], a: float, b: float, fa: float, fb: float,
+    variant: FalsePositionVariant = "plain",
+) -> Iterator[FalsePositionStep]:
+    """Regla falsa con b como último iterado y a como extremo retenido; termina tras
+    un paso con f(c) = 0.
+
+    Cuando a se retiene dos veces seguidas la regla falsa clásica se estanca; Illinois
+    divide f(a) a la mitad y Pegasus la multiplica por f(b) / (f(b) + f(c)).
+    """
+    while True:
+        c = b - fb * (b - a) / (fb - fa)
+        fc = f(c)
+        yield FalsePositionStep(a, b, fa, fb, c, fc)
+        if fc == 0.0:
+            return
+        if (fc < 0.0) != (fb < 0.0):
+            a, fa = b, fb
+        elif variant == "illinois":
+            fa *= 0.5
+        elif variant == "pegasus":
+            fa *= fb / (fb + fc)
+        b, fb = c, fc
+
+
+def secant_steps(f: Callable[[float], float], x0: float, x1: float) -> Iterator[SecantStep]:
+    """Secante; termina tras un paso con f(x₁) = 0 (x₂ = x₁) o con f(x₁) = f(x₀) (x₂ = None)."""
+    f0 = f(x0)
+    while True:
+        f1 = f(x1)
+        if f1 == 0.0:
+            yield SecantStep(x0, f0, x1, f1, x1)
+            return
+        if f1 == f0:
+            yield SecantStep(x0, f0, x1, f1, None)
+            return
+        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+        yield SecantStep(x0, f0, x1, f1, x2)
+        x0, x1, f0 = x1, x2, f1
+
+
+def newton_update(x: float, fx: float, dfx: float) -> float:
+    """x − f(x)/f′(x); ZeroDivisionError si f′ = 0 (o no es finita) fuera de una raíz exacta."""
+    if fx == 0.0:
+        return x
+    if dfx == 0.0 or not math.isfinite(dfx):
+        raise ZeroDivisionError(f"f'(x) = {dfx}")
+    return x - fx / dfx
+
+
+def newton_steps(f, x0: float) -> Iterator[NewtonStep]:
+    """Newton con f y f′ de f.value_and_derivative; termina en un punto fijo o si f′ = 0."""
+    x = x0
+    while True:
+        fx, dfx = f.value_and_derivative(x)
+        try:
+            x_next: Optional[float] = newton_update(x, fx, dfx)
+        except ZeroDivisionError:
+            x_next = None
+        yield NewtonStep(x, fx, dfx, x_next)
+        if x_next is None or x_next == x:
+            return
+        x = x_next
+
+
+# ── iteradores sin acelerar: producen x₁, x₂, ... y terminan si caen en una raíz exacta ──
+
+
+def false_position_iterates(
+    f: Callable[[float], float], a: float, b: float, fa: float, fb: float,
+    variant: FalsePositionVariant = "plain",
+) -> Iterator[float]:
+    return (step.c for step in false_position_steps(f, a, b, fa, fb, variant))
+
+
+def secant_iterates(f: Callable[[float], float], x0: float, x1: float) -> Iterator[float]:
+    for step in secant_steps(f, x0, x1):
+        if step.f1 == 0.0:
+            return
+        if step.x2 is None:
+            raise ZeroDivisionError("f(x1) = f(x0)")
+        yield step.x2
+
+
+def newton_step(f) -> Callable[[float], float]:
+    """x ↦ x − f(x)/f′(x) con f′ por diferenciación automática; ZeroDivisionError si f′ = 0
+    fuera de una raíz exacta."""
+
+    def g(x: float) -> float:
+        return newton_update(x, *f.value_and_derivative(x))
+
+    return g
+
+
+def fixed_point_iterates(g: Callable[[float], float], x0: float) -> Iterator[float]:
+    while True:
+        x1 = g(x0)
+        yield x1
+        if x1 == x0:
+            return
+        x0 = x1
+
+
+# ── aceleración ──
+
+
+def aitken(x0: float, x1: float, x2: float) -> Optional[float]:
+    """Extrapolación Δ² de Aitken: x₂ − (Δx₁)² / Δ²x₀; None si Δ²x₀ = 0."""
+    d2 = x2 - 2.0 * x1 + x0
+    if d2 == 0.0:
+        return None
+    acc = x2 - (x2 - x1) ** 2 / d2
+    return acc if math.isfinite(acc) else None
+
+
+def aitken_accelerate(iterates: Iterator[float]) -> Iterator[Tuple[float, Optional[float]]]:
+    """(xₖ, x̂ₖ) para cualquier sucesión; x̂ₖ es Aitken sobre los tres últimos iterados.
+
+    No cuesta evaluaciones adicionales de f. La extrapolación solo se acepta si la razón
+    de pasos r = Δxₖ / Δxₖ₋₁ cumple 0 < |r| < 1, es decir, si la sucesión se comporta
+    localmente como una contracción lineal.
+    """
+    window: Deque[float] = deque(maxlen=3)
+    for x in iterates:
+        window.append(x)
+        acc = None
+        if len(window) == 3 and window[1] != window[0]:
+            ratio = (window[2] - window[1]) / (window[1] - window[0])
+            if 0.0 < abs(ratio) < 1.0:
+                acc = aitken(*window)
+        yield x, acc
+
+
+def steffensen(g: Callable[[float], float], x0: float) -> Iterator[Tuple[float, Optional[float]]]:
+    """Steffensen sobre la iteración x ↦ g(x): dos pasos de g y reinicio desde su Aitken."""
+    while True:
+        x1 = g(x0)
+        x2 = g(x1)
+        acc = aitken(x0, x1, x2)
+        yield x2, acc
+        if x2 == x1:
+            return
+        x0 = x2 if acc is None else acc
@@ -0,0 +1,122 @@
+import math
+from typing import Callable, Dict, Tuple, Union
+
+Number = Union[int, float]
+
+
+class Dual:
+    """Número dual a + b·ε (ε² = 0): val lleva f(x) y der lleva f′(x)."""
+
+    __slots__ = ("val", "der")
+
+    def __init__(self, val: float, der: float = 0.0):
+        self.val = val
+        self.der = der
+
+    def __repr__(self) -> str:
+        return f"Dual({self.val!r}, {self.der!r})"
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.val + other.val, self.der + other.der)
+        return Dual(self.val + other, self.der)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.val - other.val, self.der - other.der)
+        return Dual(self.val - other, self.der)
+
+    def __rsub__(self, other):
+        return Dual(other - self.val, -self.der)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.val * other.val, self.der * other.val + self.val * other.der)
+        return Dual(self.val * other, self.der * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            q = self.val / other.val
+            return Dual(q, (self.der - q * other.der) / other.val)
+        return Dual(self.val / other, self.der / other)
+
+    def __rtruediv__(self, other):
+        q = other / self.val
+        return Dual(q, -q * self.der / self.val)
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            if other.der == 0.0:
+                return self ** other.val
+            # a^b = exp(b·ln a)
+            p = self.val ** other.val
+            return Dual(p, p * (other.der * math.log(self.val) + other.val * self.der / self.val))
+        if other == 0:
+            return Dual(1.0, 0.0)
+        if self.val == 0 and other < 1:
+            # f′ no acotada en 0 (p. ej. x**0.5): ±inf; con exponente negativo el propio
+            # valor da ZeroDivisionError (fuera del dominio)
+            return Dual(self.val ** other, other * self.der * math.inf if self.der else 0.0)
+        return Dual(self.val ** other, other * self.val ** (other - 1) * self.der)
+
+    def __rpow__(self, other):
+        p = other ** self.val
+        return Dual(p, p * math.log(other) * self.der if p else 0.0)
+
+    def __mod__(self, other):
+        # a mod m = a − ⌊a/m⌋·m, con ⌊a/m⌋ localmente constante
+        if isinstance(other, Dual):
+            return Dual(self.val % other.val, self.der - math.floor(self.val / other.val) * other.der)
+        return Dual(self.val % other, self.der)
+
+    def __rmod__(self, other):
+        return Dual(other % self.val, -math.floor(other / self.val) * self.der)
+
+    def __neg__(self):
+        return Dual(-self.val, -self.der)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(abs(self.val), self.der if self.val >= 0 else -self.der)
+
+
+def _lift(f: Callable[[float], float], df: Callable[[float], float]):
+    """Extiende f: ℝ → ℝ a duales con la regla de la cadena f(a + bε) = f(a) + f′(a)·b·ε."""
+    def wrapped(x):
+        if isinstance(x, Dual):
+            return Dual(f(x.val), df(x.val) * x.der if x.der else 0.0)
+        return f(x)
+    wrapped.__name__ = f.__name__
+    return wrapped
+
+
+DUAL_FUNCTIONS: Dict[str, object] = {
+    "sin": _lift(math.sin, math.cos),
+    "cos": _lift(math.cos, lambda a: -math.sin(a)),
+    "tan": _lift(math.tan, lambda a: 1.0 / math.cos(a) ** 2),
+    "asin": _lift(math.asin, lambda a: 1.0 / math.sqrt(1.0 - a * a) if abs(a) != 1.0 else math.inf),
+    "acos": _lift(math.acos, lambda a: -1.0 / math.sqrt(1.0 - a * a) if abs(a) != 1.0 else -math.inf),
+    "atan": _lift(math.atan, lambda a: 1.0 / (1.0 + a * a)),
+    "sinh": _lift(math.sinh, math.cosh),
+    "cosh": _lift(math.cosh, math.sinh),
+    "tanh": _lift(math.tanh, lambda a: 1.0 / math.cosh(a) ** 2),
+    "sqrt": _lift(math.sqrt, lambda a: 0.5 / math.sqrt(a) if a else math.inf),
+    "exp": _lift(math.exp, math.exp),
+    "log": _lift(math.log, lambda a: 1.0 / a),
+    "log10": _lift(math.log10, lambda a: 1.0 / (a * math.log(10.0))),
+    "abs": abs,
+}
+
+
+def value_and_derivative(func: Callable[[object], object], x: float) -> Tuple[float, float]:
+    """Evalúa f(x) y f′(x) en una sola pasada sembrando x + 1·ε."""
+    y = func(Dual(float(x), 1.0))
+    if isinstance(y, Dual):
+        return y.val, y.der
+    return float(y), 0.0  # f constante
@@ -0,0 +1,251 @@
+import ast
+import math
+import multiprocessing
+import signal
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Callable, List, Optional, Tuple
+
+from .common import Matrix, StepLog, StepResult
+from .expressionCompiler import ExpressionError, compile_expression
+from .matrixStructure import classify_structure
+
+try:  # límites de memoria solo en POSIX
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+# operaciones elementales estimadas por encima de las cuales se rechaza sin ejecutar
+MAX_COST = 5e8
+DEFAULT_WALL_TIME = 5.0
+DEFAULT_MEMORY_MB = 512
+# margen para que el proceso entregue los pasos parciales antes de matarlo
+SOFT_TIMEOUT_FRACTION = 0.9
+KILL_MARGIN = 0.5
+MAX_PARTIAL_STEPS = 200
+# coste fijo atribuido a un cálculo simbólico con SymPy (fuerza su ejecución en un proceso)
+SYMBOLIC_COST = 1e6
+
+
+@dataclass(frozen=True)
+class Budget:
+    wall_time: float = DEFAULT_WALL_TIME
+    memory_mb: Optional[int] = DEFAULT_MEMORY_MB
+    max_cost: float = MAX_COST
+
+
+DEFAULT_BUDGET = Budget()
+
+
+class BudgetExceeded(BaseException):
+    """Se agotó el tiempo del proceso trabajador.
+
+    Hereda de BaseException para que los `except Exception` de los cálculos no la
+    absorban (igual que KeyboardInterrupt).
+    """
+
+
+# ── estimación previa de coste (operaciones elementales) ──
+
+
+def expression_size(expr: str) -> int:
+    """Nodos del árbol de la expresión; 1 si no compila (el error lo da el propio cálculo)."""
+    try:
+        return sum(1 for _ in ast.walk(ast.parse(expr.replace("^", "**"), mode="eval")))
+    except SyntaxError:
+        return 1
+
+
+def polynomial_cost(expr: str) -> float:
+    """QR de la matriz compañera, O(n³); una expresión que no es polinomio no cuesta nada."""
+    try:
+        coefficients = compile_expression(expr).coefficients
+    except ExpressionError:
+        return 1.0
+    return 10.0 * len(coefficients) ** 3 if coefficients else 1.0
+
+
+def iterative_cost(expr: str, evaluations: float) -> float:
+    return evaluations * expression_size(expr)
+
+
+def determinant_cost(m: Matrix, method: str) -> float:
+    """n! · n por cofactores, salvo matrices con estructura (eliminación O(n³))."""
+    n = len(m)
+    if n <= 3 or any(len(row) < n for row in m):
+        return float(n ** 3 + 1)
+    a = [row[:n] for row in m] if method == "cramer" else m
+    if classify_structure(a).is_special:
+        return float(n ** 3)
+    return float(math.factorial(n) * n) if n < 170 else math.inf
+
+
+def matrix_operation_cost(operation: str, a: Matrix, b: Optional[Matrix] = None) -> float:
+    rows, cols = len(a), max((len(r) for r in a), default=0)
+    if operation == "multiply" and b:
+        return float(rows * cols * max((len(r) for r in b), default=0) + 1)
+    if operation == "inverse":
+        # inverse_with_steps comprueba antes det(A) (cofactores si no hay estructura)
+        return determinant_cost(a, "cofactors") + rows ** 3
+    return float(rows * cols + 1)
+
+
+def vectors_cost(vectors: List[List[float]], targets: int = 0) -> float:
+    """Factorización QR de la matriz de columnas: O(n·k·min(n, k)), más una resolución por objetivo."""
+    k = len(vectors)
+    n = max((len(v) for v in vectors), default=0)
+    return float(n * k * min(n, k) + targets * n * k + 1)
+
+
+def elimination_cost(m: Matrix) -> float:
+    rows = len(m)
+    cols = max((len(r) for r in m), default=0)
+    return float(rows * rows * cols + 1)
+
+
+# ── ejecución en un proceso que se puede matar ──
+
+
+def _partial_steps(tb: Optional[TracebackType]) -> List[str]:
+    """El registro de pasos del marco más interno que tenga una variable local `steps`."""
+    frames = []
+    while tb is not None:
+        frames.append(tb.tb_frame)
+        tb = tb.tb_next
+    for frame in reversed(frames):
+        steps = frame.f_locals.get("steps")
+        if isinstance(steps, (StepLog, list)):
+            return list(steps[:MAX_PARTIAL_STEPS])
+    return []
+
+
+def _on_alarm(signum, frame):
+    raise BudgetExceeded()
+
+
+def limit_memory(memory_mb: Optional[int]) -> None:
+    """Límite de espacio de direcciones del proceso actual (solo POSIX)."""
+    if resource is not None and memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def run_with_deadline(func: Callable[..., StepResult], args: Tuple[Any, ...], wall_time: float) -> Tuple[str, Any]:
+    """func(*args) en un proceso trabajador, interrumpido por SIGALRM al agotar el plazo.
+
+    Devuelve ("ok", StepResult), ("time" | "memory", pasos parciales) o ("error", texto).
+    """
+    signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, wall_time * SOFT_TIMEOUT_FRACTION)
+    try:
+        return "ok", func(*args)
+    except BudgetExceeded as e:
+        return "time", _partial_steps(e.__traceback__)
+    except MemoryError as e:
+        return "memory", _partial_steps(e.__traceback__)
+    except Exception as e:
+        return "error", f"{type(e).__name__}: {e}"
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _worker(conn, func: Callable[..., StepResult], args: Tuple[Any, ...], budget: Budget) -> None:
+    limit_memory(budget.memory_mb)
+    conn.send(run_with_deadline(func, args, budget.wall_time))
+    conn.close()
+
+
+# módulos que el servidor de procesos importa una sola vez (sus hijos nacen con ellos cargados)
+PRELOADED_MODULES = ("determinants", "linearSystems", "nonlinearSystems", "numericalConcepts")
+
+
+def process_context():
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    # forkserver: los hijos no heredan hilos ni candados del servidor de la API
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload([f"{__package__}.{name}" for name in PRELOADED_MODULES])
+    return ctx
+
+
+def budget_exceeded(
+    reason: str, budget: Budget, estimated_cost: float, partial: Optional[List[str]] = None
+) -> StepResult:
+    messages = {
+        "estimated_cost": f"coste estimado ≈ {estimated_cost:.3g} operaciones (máximo {budget.max_cost:.3g})",
+        "time": f"tiempo límite de {budget.wall_time:g} s agotado",
+        "memory": f"límite de memoria de {budget.memory_mb} MB agotado",
+        "worker_died": "el proceso de cálculo terminó de forma inesperada",
+    }
+    steps = StepLog(partial or [])
+    if partial:
+        steps.append("…")
+        steps.append("")
+    steps.append(f"PRESUPUESTO DE CÓMPUTO AGOTADO: {messages[reason]}.")
+    return StepResult(
+        steps=steps,
+        error="budget_exceeded",
+        details={
+            "budget": {
+                "reason": reason,
+                "estimated_cost": estimated_cost if math.isfinite(estimated_cost) else None,
+                "wall_time": budget.wall_time,
+                "memory_mb": budget.memory_mb,
+                "partial": bool(partial),
+            }
+        },
+    )
+
+
+def run_budgeted(
+    func: Callable[..., StepResult],
+    args: Tuple[Any, ...],
+    estimated_cost: float,
+    budget: Budget = DEFAULT_BUDGET,
+) -> StepResult:
+    """Ejecuta func(*args) dentro del presupuesto.
+
+    Si el coste estimado supera budget.max_cost se rechaza sin ejecutar. Si no, corre en
+    un proceso aparte con límites de tiempo y memoria: al agotar el tiempo, el propio
+    proceso devuelve los pasos hechos hasta entonces y, si no responde (una operación en
+    C que no cede), se mata. Qué peticiones son tan pequeñas que no merecen un proceso lo
+    decide el llamador (ExecutionPolicy.inline_cost).
+    """
+    if not estimated_cost <= budget.max_cost:
+        return budget_exceeded("estimated_cost", budget, estimated_cost)
+
+    ctx = process_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_worker, args=(sender, func, args, budget), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if receiver.poll(budget.wall_time + KILL_MARGIN):
+            status, payload = receiver.recv()
+        else:
+            status, payload = "time", []
+    except EOFError:  # p. ej. el sistema mató al proceso por memoria
+        status, payload = "worker_died", []
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    return outcome_to_result(status, payload, budget, estimated_cost)
+
+
+def run_inline(func: Callable[..., StepResult], args: Tuple[Any, ...]) -> StepResult:
+    """func(*args) en el hilo actual; una excepción da el mismo internal_error que en un proceso."""
+    try:
+        return func(*args)
+    except Exception as e:
+        return outcome_to_result("error", f"{type(e).__name__}: {e}", DEFAULT_BUDGET, 0.0)
+
+
+def outcome_to_result(status: str, payload: Any, budget: Budget, estimated_cost: float) -> StepResult:
+    if status == "ok":
+        return payload
+    if status == "error":
+        return StepResult(steps=[f"Error inesperado en el cálculo: {payload}"], error="internal_error")
+    return budget_exceeded(status, budget, estimated_cost, payload)
@@ -1,18 +1,141 @@
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import List, Optional, Literal
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Literal, Union, overload
 
 Matrix = List[List[float]]
 Vector = List[float]
+# full: todos los pasos; summary: encabezados, resultados intermedios clave y conclusión
+# (sin líneas por entrada ni por iteración); none: ningún paso
+Verbosity = Literal["none", "summary", "full"]
 
 
-@dataclass
+class StepLog(Sequence):
+    """Registro de pasos append-only y compacto.
+
+    Todo el texto vive en un único buffer UTF-8 y los límites de cada paso en un
+    arreglo de offsets, en lugar de un objeto str por línea. Se comporta como una
+    secuencia de str (iterar, indexar, len, +) para que el resto del código no cambie.
+
+    Con verbosity "none" append no guarda nada. El registro no puede evitar que se
+    formatee el texto que recibe: el texto de detalle (por entrada o por iteración) se
+    genera solo bajo `if steps.detailed:` y el costoso de resumen (format_matrix de una
+    matriz grande) bajo `if steps.enabled:`.
+    """
+
+    __slots__ = ("_buffer", "_offsets", "enabled", "detailed")
+
+    def __init__(self, steps: Iterable[str] = (), verbosity: Verbosity = "full"):
+        self._buffer = bytearray()
+        self._offsets = array("Q", [0])
+        self.enabled = verbosity != "none"
+        self.detailed = verbosity == "full"
+        self.extend(steps)
+
+    @property
+    def verbosity(self) -> Verbosity:
+        return "full" if self.detailed else ("summary" if self.enabled else "none")
+
+    def append(self, step: str) -> None:
+        if not self.enabled:
+            return
+        self._buffer += step.encode("utf-8")
+        self._offsets.append(len(self._buffer))
+
+    def extend(self, steps: Iterable[str]) -> None:
+        for step in steps:
+            self.append(step)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("StepLog index out of range")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._buffer[start:end].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        view = memoryview(self._buffer)
+        offsets = self._offsets
+        for i in range(len(offsets) - 1):
+            yield str(view[offsets[i]:offsets[i + 1]], "utf-8")
+
+    def __add__(self, other: Iterable[str]) -> "StepLog":
+        result = StepLog(self, self.verbosity)
+        result.extend(other)
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (StepLog, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"StepLog({list(self)!r})"
+
+    def tolist(self) -> List[str]:
+        return list(self)
+
+
+@dataclass(slots=True)
 class StepResult:
-    steps: List[str]
+    steps: StepLog
     matrix: Optional[Matrix] = None
     vector: Optional[Vector] = None
     determinant: Optional[float] = None
     solution_type: Optional[Literal["unique", "infinite", "none"]] = None
     error: Optional[str] = None
+    # datos estructurados adicionales propios de cada operación (rango, índices, ...)
+    details: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.steps, StepLog):
+            self.steps = StepLog(self.steps)
+
+
+# algoritmo paso a paso: produce cada línea según la calcula y devuelve (return) el
+# StepResult con el resultado. Los errores de validación previos a cualquier cálculo se
+# devuelven con sus pasos en el propio StepResult, sin producir líneas.
+StepStream = Generator[str, None, StepResult]
+
+
+def collect_steps(stream: StepStream, verbosity: Verbosity = "full") -> StepResult:
+    """Consume un StepStream completo y guarda sus líneas en el StepResult final."""
+    steps = StepLog(verbosity=verbosity)
+    while True:
+        try:
+            steps.append(next(stream))
+        except StopIteration as stop:
+            result: StepResult = stop.value
+            if not len(result.steps):
+                result.steps = steps
+            return result
+
+
+def finished_stream(result: StepResult) -> StepStream:
+    """StepStream sin líneas que devuelve directamente `result` (p. ej. un error de validación)."""
+    return result
+    yield  # generador
+
+
+def drain(stream: Generator[str, None, Any]) -> Any:
+    """Ejecuta un generador de pasos descartando las líneas; devuelve su valor de retorno."""
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            return stop.value
 
 
 def format_matrix(m: Matrix, decimals: int = 4) -> str:
@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from .expressionCompiler import compile_expression, compile_system
+
+DERIVATIVE_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledDerivative:
+    f_expr: Any  # sympy.Expr
+    df_expr: Any
+    # f y f′ en una sola llamada; las subexpresiones comunes (sp.cse) se calculan una vez
+    f_and_df: Callable[[float], Tuple[float, float]]
+
+
+def normalize_expression(expr: str) -> str:
+    return "".join(expr.replace("^", "**").split())
+
+
+def _build(key: str) -> CompiledDerivative:
+    # SymPy se importa solo aquí: la derivación por defecto es automática (core.autodiff)
+    import sympy as sp
+
+    compile_expression(key)  # validación AST antes de que SymPy evalúe el texto
+    x = sp.symbols("x")
+    # nombres del compilador de expresiones que SymPy no interpreta igual por defecto
+    names = {"x": x, "e": sp.E, "pi": sp.pi, "log10": lambda a: sp.log(a, 10)}
+    f_expr = sp.sympify(key, locals=names)
+    df_expr = sp.diff(f_expr, x)
+    f_and_df = sp.lambdify(x, (f_expr, df_expr), modules=["math"], cse=True)
+    return CompiledDerivative(f_expr, df_expr, f_and_df)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledJacobian:
+    f_exprs: List[Any]  # sympy.Expr por componente
+    jacobian_exprs: List[List[Any]]
+    # (F(x), J(x)) en una sola llamada con subexpresiones comunes (sp.cse)
+    f_and_jacobian: Callable[..., Tuple[List[float], List[List[float]]]]
+
+
+def _jacobian_key(exprs: List[str], variables: List[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    return tuple(normalize_expression(e) for e in exprs), tuple(variables)
+
+
+def _build_jacobian(key: Tuple[Tuple[str, ...], Tuple[str, ...]]) -> CompiledJacobian:
+    import sympy as sp
+
+    exprs, variables = key
+    compile_system(list(exprs), list(variables))  # validación AST
+    symbols = [sp.Symbol(v) for v in variables]
+    names = {"e": sp.E, "pi": sp.pi, "log10": lambda a: sp.log(a, 10), **dict(zip(variables, symbols))}
+    f = sp.Matrix([sp.sympify(e, locals=names) for e in exprs])
+    jac = f.jacobian(symbols)
+    f_and_jacobian = sp.lambdify(symbols, (list(f), jac.tolist()), modules=["math"], cse=True)
+    return CompiledJacobian(list(f), jac.tolist(), f_and_jacobian)
+
+
+class DerivativeCache:
+    """Caché LRU acotada de derivadas compiladas con SymPy, compartida entre hilos.
+
+    `build` recibe la clave normalizada (por defecto el texto de f) y devuelve la
+    entrada compilada. La compilación ocurre fuera del candado: dos hilos pueden
+    compilar la misma clave a la vez, pero solo se guarda (y se devuelve) la primera.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[Any], Any] = _build,
+        key: Callable[..., Hashable] = normalize_expression,
+        maxsize: int = DERIVATIVE_CACHE_SIZE,
+    ):
+        self.maxsize = maxsize
+        self._build = build
+        self._key = key
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, *args: Any) -> Any:
+        key = self._key(*args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        entry = self._build(key)
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+derivative_cache = DerivativeCache()
+jacobian_cache = DerivativeCache(_build_jacobian, _jacobian_key)
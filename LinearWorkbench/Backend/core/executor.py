@@ -0,0 +1,229 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Literal, Optional, Tuple
+
+from .budget import (
+    DEFAULT_BUDGET,
+    KILL_MARGIN,
+    Budget,
+    budget_exceeded,
+    limit_memory,
+    outcome_to_result,
+    process_context,
+    run_budgeted,
+    run_inline,
+    run_with_deadline,
+)
+from .common import StepResult
+from .responseCache import cache_key, response_cache
+
+ExecutionMode = Literal["inline", "pool", "isolated"]
+
+POOL_WORKERS = int(os.environ.get("WORKBENCH_POOL_WORKERS", 0)) or os.cpu_count() or 1
+# peticiones en vuelo por trabajador antes de responder "overloaded"
+QUEUE_PER_WORKER = 8
+# por debajo de este coste estimado se calcula en el propio bucle de eventos
+INLINE_COST = 2e4
+
+
+@dataclass(frozen=True)
+class ExecutionPolicy:
+    """Dónde se ejecuta un endpoint.
+
+    inline: en el bucle de eventos (solo cálculos triviales).
+    pool: en el pool de procesos precalentado, con plazo blando (SIGALRM) en el trabajador.
+    isolated: en un proceso propio que se mata si no responde (algoritmos factoriales).
+    En pool e isolated, las peticiones con coste estimado ≤ inline_cost se quedan inline.
+    cached: el resultado se guarda en la caché de respuestas (el cálculo es determinista).
+    """
+
+    mode: ExecutionMode = "pool"
+    inline_cost: float = INLINE_COST
+    budget: Budget = DEFAULT_BUDGET
+    cached: bool = True
+
+
+DEFAULT_POLICY = ExecutionPolicy()
+
+# configuración por endpoint; los que no aparecen usan DEFAULT_POLICY
+POLICIES: Dict[str, ExecutionPolicy] = {
+    "determinants": ExecutionPolicy(mode="isolated"),
+    "nonlinear_system": ExecutionPolicy(mode="isolated"),
+    "newton_raphson_symbolic": ExecutionPolicy(mode="isolated"),
+}
+
+
+def configure(endpoint: str, **changes: Any) -> ExecutionPolicy:
+    """Cambia la política de un endpoint (p. ej. configure("compare", mode="inline"))."""
+    POLICIES[endpoint] = replace(POLICIES.get(endpoint, DEFAULT_POLICY), **changes)
+    return POLICIES[endpoint]
+
+
+def policy_for(endpoint: str) -> ExecutionPolicy:
+    return POLICIES.get(endpoint, DEFAULT_POLICY)
+
+
+def overloaded() -> StepResult:
+    return StepResult(
+        steps=["Servidor saturado: demasiados cálculos en curso, inténtelo de nuevo."],
+        error="overloaded",
+    )
+
+
+def _init_worker(memory_mb: Optional[int]) -> None:
+    limit_memory(memory_mb)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class ComputeExecutor:
+    """Pool de procesos compartido para los endpoints de cálculo y los trabajos por lotes.
+
+    El número de peticiones en vuelo está acotado (POOL_WORKERS · QUEUE_PER_WORKER): por
+    encima se responde de inmediato con error "overloaded" en lugar de encolar sin límite.
+    Las peticiones simultáneas con la misma carga canónica se agrupan (single-flight):
+    esperan al cálculo ya en curso y comparten su resultado.
+    """
+
+    def __init__(self, workers: int = POOL_WORKERS, queue_per_worker: int = QUEUE_PER_WORKER):
+        self.workers = workers
+        self.max_pending = workers * queue_per_worker
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.inline = 0
+        self.coalesced = 0
+        self._in_flight: Dict[str, "asyncio.Future[StepResult]"] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=process_context(),
+                    initializer=_init_worker,
+                    initargs=(DEFAULT_BUDGET.memory_mb,),
+                )
+            return self._pool
+
+    def warm(self) -> None:
+        """Arranca todos los trabajadores ya (el pool los crea bajo demanda)."""
+        pool = self.pool
+        for fut in [pool.submit(_ping) for _ in range(self.workers)]:
+            fut.result()
+
+    def discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Descarta un pool roto (un trabajador murió, p. ej. por el OOM killer): el
+        siguiente acceso a `pool` crea uno nuevo. Si otro hilo ya lo reemplazó, no hace nada."""
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def admit(self, slots: int = 1) -> bool:
+        """Reserva `slots` plazas de cálculo en vuelo; False (y cuenta un rechazo) si no caben."""
+        with self._lock:
+            if self.pending + slots > self.max_pending:
+                self.rejected += 1
+                return False
+            self.pending += slots
+            return True
+
+    def release(self, slots: int = 1) -> None:
+        with self._lock:
+            self.pending -= slots
+            self.completed += slots
+
+    async def run(
+        self,
+        endpoint: str,
+        func: Callable[..., StepResult],
+        args: Tuple[Any, ...],
+        estimated_cost: float,
+    ) -> StepResult:
+        policy = policy_for(endpoint)
+        key = cache_key(endpoint, func, args)
+        if policy.cached:
+            res = response_cache.get(endpoint, key)
+            if res is not None:
+                return res
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._compute(policy, func, args, estimated_cost))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(endpoint, key, t, policy.cached))
+        # shield: si el cliente que lanzó el cálculo se desconecta, los demás siguen esperándolo
+        return await asyncio.shield(task)
+
+    def _finish(self, endpoint: str, key: str, task: "asyncio.Future[StepResult]", cached: bool) -> None:
+        self._in_flight.pop(key, None)
+        if cached and not task.cancelled() and task.exception() is None:
+            response_cache.put(endpoint, key, task.result())
+
+    async def _compute(
+        self,
+        policy: ExecutionPolicy,
+        func: Callable[..., StepResult],
+        args: Tuple[Any, ...],
+        estimated_cost: float,
+    ) -> StepResult:
+        budget = policy.budget
+        if not estimated_cost <= budget.max_cost:
+            return budget_exceeded("estimated_cost", budget, estimated_cost)
+        if policy.mode == "inline" or estimated_cost <= policy.inline_cost:
+            self.inline += 1
+            return run_inline(func, args)
+        if not self.admit():
+            return overloaded()
+        try:
+            if policy.mode == "isolated":
+                return await asyncio.to_thread(run_budgeted, func, args, estimated_cost, budget)
+            loop = asyncio.get_running_loop()
+            pool = self.pool
+            try:
+                call = loop.run_in_executor(pool, run_with_deadline, func, args, budget.wall_time)
+                status, payload = await asyncio.wait_for(call, budget.wall_time + KILL_MARGIN)
+            except asyncio.TimeoutError:
+                # el trabajador no atendió la alarma (operación en C): se responde ya y el
+                # proceso queda ocupado hasta terminar; por eso lo factorial va "isolated"
+                status, payload = "time", []
+            except BrokenProcessPool:
+                # un trabajador murió y el pool ya no acepta trabajos: se reemplaza
+                self.discard_pool(pool)
+                status, payload = "worker_died", []
+            return outcome_to_result(status, payload, budget, estimated_cost)
+        finally:
+            self.release()
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "inline": self.inline,
+            "rejected": self.rejected,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+
+compute_executor = ComputeExecutor()
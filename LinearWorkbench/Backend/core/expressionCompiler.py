@@ -0,0 +1,352 @@
+import ast
+import math
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .autodiff import DUAL_FUNCTIONS, Dual, value_and_derivative
+
+# nombres que puede usar una expresión además de la variable x
+ALLOWED_NAMES: Dict[str, object] = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "asin": math.asin,
+    "acos": math.acos,
+    "atan": math.atan,
+    "sinh": math.sinh,
+    "cosh": math.cosh,
+    "tanh": math.tanh,
+    "sqrt": math.sqrt,
+    "exp": math.exp,
+    "log": math.log,
+    "log10": math.log10,
+    "abs": abs,
+    "pi": math.pi,
+    "e": math.e,
+}
+VARIABLE = "x"
+EXPRESSION_CACHE_SIZE = 256
+# grado máximo que se reconoce como polinomio (por encima se evalúa como expresión general)
+MAX_POLYNOMIAL_DEGREE = 100
+# exponente máximo de una potencia entre constantes exactas (SymPy la calcula sin redondear)
+MAX_EXACT_EXPONENT = 10_000
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd,
+)
+
+
+class ExpressionError(ValueError):
+    """Expresión con sintaxis inválida o con construcciones no permitidas."""
+
+
+class CompiledExpression:
+    """Expresión f(x) validada y compilada a una función de Python.
+
+    Si f es un polinomio, `coefficients` guarda sus coeficientes (de grado 0 a n) y, si
+    además está escrito en forma expandida, evaluate_many usa su forma de Horner. Un
+    polinomio de grado mayor que MAX_POLYNOMIAL_DEGREE se evalúa como expresión general
+    (`coefficients` None) y lo indica `degree_too_large`.
+    """
+
+    __slots__ = ("source", "coefficients", "degree_too_large", "_code", "_func", "_dual_func", "_many")
+
+    def __init__(
+        self,
+        source: str,
+        code,
+        coefficients: Optional[List[float]] = None,
+        horner_code=None,
+        degree_too_large: bool = False,
+    ):
+        self.source = source
+        self.coefficients = coefficients
+        self.degree_too_large = degree_too_large
+        self._code = code
+        self._func = eval(code, {"__builtins__": {}, **ALLOWED_NAMES})
+        self._dual_func: Optional[Callable] = None
+        self._many = eval(horner_code, {"__builtins__": {}}) if horner_code is not None else self._func
+
+    def __call__(self, x: float) -> float:
+        y = self._func(x)
+        if type(y) is complex:  # p. ej. x**0.5 con x < 0
+            raise ValueError(f"f({x}) no es un número real")
+        return y
+
+    def value_and_derivative(self, x: float) -> Tuple[float, float]:
+        """(f(x), f′(x)) por diferenciación automática en modo directo (números duales).
+
+        Reutiliza el mismo código compilado con las funciones extendidas a duales.
+        """
+        if self._dual_func is None:
+            self._dual_func = eval(self._code, {"__builtins__": {}, **ALLOWED_NAMES, **DUAL_FUNCTIONS})
+        fx, dfx = value_and_derivative(self._dual_func, x)
+        if type(fx) is complex or type(dfx) is complex:
+            raise ValueError(f"f({x}) no es un número real")
+        return fx, dfx
+
+    def evaluate_many(self, xs: Iterable[float]) -> List[float]:
+        """Evalúa f en muchos puntos reutilizando la misma función compilada."""
+        return list(map(self._many, xs))
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+def _validate(tree: ast.AST, variables: Tuple[str, ...] = (VARIABLE,)) -> None:
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ExpressionError(f"construcción no permitida: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float))
+        ):
+            raise ExpressionError(f"constante no permitida: {node.value!r}")
+        if isinstance(node, ast.Name) and node.id not in variables and node.id not in ALLOWED_NAMES:
+            raise ExpressionError(f"nombre desconocido: {node.id}")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or not callable(ALLOWED_NAMES.get(node.func.id)):
+                raise ExpressionError("solo se permiten llamadas a funciones matemáticas conocidas")
+            if node.keywords:
+                raise ExpressionError("las funciones no aceptan argumentos con nombre")
+
+
+def _is_constant(node: ast.AST) -> bool:
+    return not any(isinstance(n, ast.Name) and n.id not in ALLOWED_NAMES for n in ast.walk(node))
+
+
+def _constant_value(node: ast.expr) -> float:
+    """Valor en coma flotante de una subexpresión constante; OverflowError si desborda."""
+    expression = ast.fix_missing_locations(ast.Expression(body=node))
+    try:
+        return float(eval(compile(expression, "<constante>", "eval"), {"__builtins__": {}, **ALLOWED_NAMES}))
+    except OverflowError:
+        raise
+    except (ArithmeticError, ValueError, TypeError):
+        return math.nan  # 0**-1, (-8)**(1/3): el error se da al evaluar f
+
+
+def _guard_powers(tree: ast.AST) -> None:
+    """Las constantes enteras pasan a float: una potencia enorme desborda (OverflowError) en
+    lugar de construir un entero de millones de dígitos. Se rechazan las potencias entre
+    constantes cuyo valor desborda (9**9**9) y, si la base es exacta (sin decimales), las de
+    exponente enorme (2**-10**9), que SymPy calcularía con millones de cifras."""
+    integers = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, int):
+            integers.add(id(node))
+            try:
+                node.value = float(node.value)
+            except OverflowError:  # literal de más de ~308 cifras
+                raise ExpressionError("constante demasiado grande") from None
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow)
+            and _is_constant(node.left) and _is_constant(node.right)
+        ):
+            continue
+        exact = all(id(n) in integers for n in ast.walk(node.left) if isinstance(n, ast.Constant))
+        try:
+            exponent = _constant_value(node.right)
+            _constant_value(node)
+        except OverflowError:
+            raise ExpressionError("potencia demasiado grande (desborda un número en coma flotante)") from None
+        if exact and not abs(exponent) <= MAX_EXACT_EXPONENT:
+            raise ExpressionError(f"potencia demasiado grande (exponente > {MAX_EXACT_EXPONENT})")
+
+
+def _parse(source: str, variables: Tuple[str, ...]) -> ast.expr:
+    try:
+        tree = ast.parse(source.replace("^", "**"), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"sintaxis inválida: {e.msg}") from None
+    _validate(tree, variables)
+    _guard_powers(tree)
+    return tree.body
+
+
+def _lambda(variables: Tuple[str, ...], body: ast.expr):
+    """Compila 'lambda <variables>: <body>' para que cada evaluación sea una llamada normal."""
+    lam = ast.Expression(
+        ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[], args=[ast.arg(arg=v) for v in variables], kwonlyargs=[],
+                kw_defaults=[], defaults=[],
+            ),
+            body=body,
+        )
+    )
+    ast.fix_missing_locations(lam)
+    return compile(lam, "<expresión>", "eval")
+
+
+def _poly_mul(p: List[float], q: List[float]) -> List[float]:
+    out = [0.0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a:
+            for j, b in enumerate(q):
+                out[i + j] += a * b
+    return out
+
+
+def _poly_add(p: List[float], q: List[float], sign: float = 1.0) -> List[float]:
+    out = list(p) + [0.0] * (len(q) - len(p))
+    for i, b in enumerate(q):
+        out[i] += sign * b
+    return out
+
+
+# resultado de _polynomial para un polinomio de grado mayor que MAX_POLYNOMIAL_DEGREE
+_TOO_LARGE: List[float] = []
+
+
+def _polynomial(node: ast.expr) -> Optional[List[float]]:
+    """Coeficientes (de grado 0 a n) si el nodo es un polinomio en x; None si no lo es y
+    _TOO_LARGE si lo es pero supera MAX_POLYNOMIAL_DEGREE."""
+    if isinstance(node, ast.Constant):
+        return [float(node.value)]
+    if isinstance(node, ast.Name):
+        if node.id == VARIABLE:
+            return [0.0, 1.0]
+        value = ALLOWED_NAMES.get(node.id)
+        return [value] if isinstance(value, float) else None
+    if isinstance(node, ast.UnaryOp):
+        p = _polynomial(node.operand)
+        if p is None or p is _TOO_LARGE:
+            return p
+        return [-c for c in p] if isinstance(node.op, ast.USub) else p
+    if not isinstance(node, ast.BinOp):
+        return None
+    left, right = _polynomial(node.left), _polynomial(node.right)
+    if left is None or right is None:
+        return None
+    if left is _TOO_LARGE or right is _TOO_LARGE:
+        # sigue siendo un polinomio (de grado excesivo) si la operación lo conserva
+        if isinstance(node.op, (ast.Add, ast.Sub, ast.Mult)):
+            return _TOO_LARGE
+        n = right[0] if right is not _TOO_LARGE and len(right) == 1 else None
+        if isinstance(node.op, ast.Div) and n:
+            return _TOO_LARGE
+        if isinstance(node.op, ast.Pow) and n is not None and n == int(n) and n >= 0:
+            return _TOO_LARGE if n else [1.0]
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        return _poly_add(left, right, -1.0 if isinstance(node.op, ast.Sub) else 1.0)
+    if isinstance(node.op, ast.Mult):
+        if len(left) + len(right) - 2 > MAX_POLYNOMIAL_DEGREE:
+            return _TOO_LARGE
+        return _poly_mul(left, right)
+    if isinstance(node.op, ast.Div) and len(right) == 1 and right[0] != 0.0:
+        return [c / right[0] for c in left]
+    if isinstance(node.op, ast.Pow) and len(right) == 1:
+        n = right[0]
+        if len(left) == 1:
+            base = left[0]
+            if (base == 0.0 and n < 0) or (base < 0.0 and n != int(n)):
+                return None
+            try:
+                return [base ** n]
+            except OverflowError:
+                return None
+        if n != int(n) or n < 0:
+            return None
+        if (len(left) - 1) * n > MAX_POLYNOMIAL_DEGREE:
+            return _TOO_LARGE
+        out = [1.0]
+        for _ in range(int(n)):
+            out = _poly_mul(out, left)
+        return out
+    return None
+
+
+def _is_expanded(node: ast.expr) -> bool:
+    """Suma de monomios: ningún término contiene a su vez sumas o restas."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        return _is_expanded(node.left) and _is_expanded(node.right)
+    if isinstance(node, ast.UnaryOp):
+        return _is_expanded(node.operand)
+    return not any(
+        isinstance(n, ast.BinOp) and isinstance(n.op, (ast.Add, ast.Sub)) for n in ast.walk(node)
+    )
+
+
+def _horner(coefficients: List[float]) -> ast.expr:
+    """(((cₙ·x + cₙ₋₁)·x + ...)·x + c₀) como árbol de sintaxis."""
+    body: ast.expr = ast.Constant(coefficients[-1])
+    for c in reversed(coefficients[:-1]):
+        body = ast.BinOp(body, ast.Mult(), ast.Name(VARIABLE, ast.Load()))
+        if c:
+            body = ast.BinOp(body, ast.Add(), ast.Constant(c))
+    return body
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile(source: str) -> CompiledExpression:
+    body = _parse(source, (VARIABLE,))
+    coefficients = _polynomial(body)
+    if coefficients is None or coefficients is _TOO_LARGE:
+        return CompiledExpression(source, _lambda((VARIABLE,), body), degree_too_large=coefficients is _TOO_LARGE)
+    while len(coefficients) > 1 and coefficients[-1] == 0.0:
+        coefficients.pop()
+    horner = _lambda((VARIABLE,), _horner(coefficients)) if _is_expanded(body) else None
+    return CompiledExpression(source, _lambda((VARIABLE,), body), coefficients, horner)
+
+
+class CompiledSystem:
+    """Sistema F: ℝⁿ → ℝᵐ validado y compilado a una sola función que devuelve una tupla."""
+
+    __slots__ = ("sources", "variables", "_func", "_dual_func")
+
+    def __init__(self, sources: Tuple[str, ...], variables: Tuple[str, ...], code):
+        self.sources = sources
+        self.variables = variables
+        self._func = eval(code, {"__builtins__": {}, **ALLOWED_NAMES})
+        self._dual_func = eval(code, {"__builtins__": {}, **ALLOWED_NAMES, **DUAL_FUNCTIONS})
+
+    def __call__(self, x: List[float]) -> List[float]:
+        return [float(v) for v in self._func(*x)]
+
+    def value_and_jacobian(self, x: List[float]) -> Tuple[List[float], List[List[float]]]:
+        """F(x) y J(x) por diferenciación automática: n pasadas, sembrando ε en una variable cada vez."""
+        n = len(x)
+        jac = [[0.0] * n for _ in self.sources]
+        values: List[float] = []
+        for j in range(n):
+            seeded = [Dual(float(v), 1.0 if i == j else 0.0) for i, v in enumerate(x)]
+            out = self._dual_func(*seeded)
+            if j == 0:
+                values = [y.val if isinstance(y, Dual) else float(y) for y in out]
+            for i, y in enumerate(out):
+                if isinstance(y, Dual):
+                    jac[i][j] = y.der
+        return values, jac
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_system(sources: Tuple[str, ...], variables: Tuple[str, ...]) -> CompiledSystem:
+    for v in variables:
+        if not v.isidentifier() or v in ALLOWED_NAMES:
+            raise ExpressionError(f"nombre de variable no válido: {v}")
+    if len(set(variables)) != len(variables):
+        raise ExpressionError("variables repetidas")
+    body = ast.Tuple(elts=[_parse(src, variables) for src in sources], ctx=ast.Load())
+    return CompiledSystem(sources, variables, _lambda(variables, body))
+
+
+def compile_system(exprs: List[str], variables: List[str]) -> CompiledSystem:
+    """Compila las funciones componentes de F(x₁, ..., xₙ) (caché LRU por textos y variables).
+
+    Lanza ExpressionError si alguna expresión o variable no es válida.
+    """
+    return _compile_system(tuple(e.strip() for e in exprs), tuple(variables))
+
+
+def compile_expression(expr: str) -> CompiledExpression:
+    """Devuelve la función compilada de `expr` (caché LRU por texto de la expresión).
+
+    Lanza ExpressionError si la expresión no es válida.
+    """
+    return _compile(expr.strip())
+
+
+def expression_cache_info():
+    return _compile.cache_info()
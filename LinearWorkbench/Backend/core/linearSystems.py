@@ -1,18 +1,80 @@
-from .common import Matrix, StepResult, format_matrix, clone_matrix
+from typing import List, Tuple
+from .common import (
+    Matrix, StepLog, StepResult, StepStream, Vector, Verbosity, clone_matrix, collect_steps, format_matrix,
+)
+from .matrixStructure import classify_structure, structured_solve
 
 
-def solve_linear_system_gauss_jordan(augmented: Matrix) -> StepResult:
+def lu_factor(m: Matrix, tol: float = 1e-12) -> Tuple[Matrix, List[int]]:
+    """Factorización PA = LU con pivoteo parcial, O(n³).
+
+    Devuelve (lu, perm): L (diagonal unitaria, implícita) y U comparten la matriz
+    `lu`; perm[i] es la fila de A que quedó en la posición i. Lanza
+    ZeroDivisionError si la matriz es singular.
+    """
+    lu = clone_matrix(m)
+    n = len(lu)
+    perm = list(range(n))
+    for k in range(n):
+        pivot = max(range(k, n), key=lambda r: abs(lu[r][k]))
+        if abs(lu[pivot][k]) < tol:
+            raise ZeroDivisionError("pivote nulo")
+        if pivot != k:
+            lu[k], lu[pivot] = lu[pivot], lu[k]
+            perm[k], perm[pivot] = perm[pivot], perm[k]
+        row_k = lu[k]
+        pv = row_k[k]
+        for r in range(k + 1, n):
+            row = lu[r]
+            factor = row[k] / pv
+            row[k] = factor
+            if factor != 0.0:
+                for j in range(k + 1, n):
+                    row[j] -= factor * row_k[j]
+    return lu, perm
+
+
+def lu_solve(lu: Matrix, perm: List[int], b: Vector) -> Vector:
+    """Resuelve A·x = b con los factores de lu_factor (sustituciones progresiva y regresiva, O(n²))."""
+    n = len(lu)
+    y = [b[p] for p in perm]
+    for i in range(n):
+        row = lu[i]
+        y[i] -= sum(row[j] * y[j] for j in range(i))
+    for i in range(n - 1, -1, -1):
+        row = lu[i]
+        y[i] = (y[i] - sum(row[j] * y[j] for j in range(i + 1, n))) / row[i]
+    return y
+
+
+def iter_gauss_jordan(augmented: Matrix, verbosity: Verbosity = "full") -> StepStream:
+    """Gauss-Jordan sobre [A|b] como StepStream: cada paso se produce al calcularlo."""
     if not augmented:
         return StepResult(steps=["Matriz vacía"], error="empty")
 
-    steps: list[str] = []
+    enabled = verbosity != "none"
     a = clone_matrix(augmented)
     n = len(a)
     m = len(a[0])
 
-    steps.append("MÉTODO DE GAUSS-JORDAN SOBRE [A|b]")
-    steps.append(format_matrix(a))
-    steps.append("")
+    yield "MÉTODO DE GAUSS-JORDAN SOBRE [A|b]"
+    if enabled:
+        yield format_matrix(a)
+    yield ""
+
+    if n == m - 1:
+        coefficients = [row[:-1] for row in a]
+        structure = classify_structure(coefficients)
+        if structure.is_special:
+            shortcut = StepLog(verbosity=verbosity)
+            sol = structured_solve(coefficients, [row[-1] for row in a], structure, shortcut)
+            if sol is not None:
+                yield from shortcut
+                yield ""
+                if enabled:
+                    for idx, val in enumerate(sol, start=1):
+                        yield f"x{idx} = {val}"
+                return StepResult(steps=[], vector=sol, solution_type="unique")
 
     current_row = 0
     for col in range(m - 1):
@@ -34,15 +96,16 @@ def solve_linear_system_gauss_jordan(augmented: Matrix) -> StepResult:
                 a[r][j] -= factor * a[current_row][j]
         current_row += 1
 
-    steps.append("Forma escalonada reducida:")
-    steps.append(format_matrix(a))
-    steps.append("")
+    yield "Forma escalonada reducida:"
+    if enabled:
+        yield format_matrix(a)
+    yield ""
 
     # inconsistente?
     for i in range(n):
         if all(abs(v) < 1e-10 for v in a[i][: m - 1]) and abs(a[i][m - 1]) > 1e-10:
-            steps.append(f"Fila {i+1}: 0 = {a[i][m - 1]} → sistema inconsistente")
-            return StepResult(steps=steps, solution_type="none")
+            yield f"Fila {i+1}: 0 = {a[i][m - 1]} → sistema inconsistente"
+            return StepResult(steps=[], solution_type="none")
 
     # contar pivotes
     leading_cols = set()
@@ -55,8 +118,8 @@ def solve_linear_system_gauss_jordan(augmented: Matrix) -> StepResult:
     num_vars = m - 1
     free_vars = num_vars - len(leading_cols)
     if free_vars > 0:
-        steps.append("Hay variables libres → infinitas soluciones")
-        return StepResult(steps=steps, solution_type="infinite")
+        yield "Hay variables libres → infinitas soluciones"
+        return StepResult(steps=[], solution_type="infinite")
 
     sol = [0.0] * num_vars
     for i in range(n):
@@ -68,6 +131,11 @@ def solve_linear_system_gauss_jordan(augmented: Matrix) -> StepResult:
         if pivot_col is not None:
             sol[pivot_col] = a[i][m - 1]
 
-    for idx, val in enumerate(sol, start=1):
-        steps.append(f"x{idx} = {val}")
-    return StepResult(steps=steps, vector=sol, solution_type="unique")
+    if enabled:
+        for idx, val in enumerate(sol, start=1):
+            yield f"x{idx} = {val}"
+    return StepResult(steps=[], vector=sol, solution_type="unique")
+
+
+def solve_linear_system_gauss_jordan(augmented: Matrix, verbosity: Verbosity = "full") -> StepResult:
+    return collect_steps(iter_gauss_jordan(augmented, verbosity), verbosity)
@@ -1,65 +1,83 @@
-from typing import List
-from .common import Matrix, StepResult, format_matrix
-from .determinants import _det_cofactors_recursive
+from typing import List, Optional
+from .common import Matrix, StepResult, StepStream, Verbosity, collect_steps, finished_stream, format_matrix
+from .determinants import determinant_value
 
-def add_matrices_with_steps(a: Matrix, b: Matrix) -> StepResult:
+def iter_add_matrices(a: Matrix, b: Matrix, verbosity: Verbosity = "full") -> StepStream:
     if not a or not b or len(a) != len(b) or len(a[0]) != len(b[0]):
         return StepResult(
             steps=["Dimensiones incompatibles para suma"], error="dimension_mismatch"
         )
-    steps: list[str] = []
-    steps.append("SUMA DE MATRICES: C = A + B")
-    steps.append("Matriz A:")
-    steps.append(format_matrix(a))
-    steps.append("")
-    steps.append("Matriz B:")
-    steps.append(format_matrix(b))
-    steps.append("")
+    detailed = verbosity == "full"
+    yield "SUMA DE MATRICES: C = A + B"
+    if detailed:
+        yield "Matriz A:"
+        yield format_matrix(a)
+        yield ""
+        yield "Matriz B:"
+        yield format_matrix(b)
+        yield ""
     result: Matrix = []
     for i, row in enumerate(a):
+        b_row = b[i]
+        if not detailed:
+            result.append([val + b_row[j] for j, val in enumerate(row)])
+            continue
         result_row: List[float] = []
         for j, val in enumerate(row):
-            s = val + b[i][j]
-            steps.append(f"C[{i+1},{j+1}] = {val} + {b[i][j]} = {s}")
+            s = val + b_row[j]
+            yield f"C[{i+1},{j+1}] = {val} + {b_row[j]} = {s}"
             result_row.append(s)
         result.append(result_row)
-    steps.append("")
-    steps.append("Resultado C = A + B:")
-    steps.append(format_matrix(result))
-    return StepResult(steps=steps, matrix=result)
+    yield ""
+    yield "Resultado C = A + B:"
+    if verbosity != "none":
+        yield format_matrix(result)
+    return StepResult(steps=[], matrix=result)
 
 
-def subtract_matrices_with_steps(a: Matrix, b: Matrix) -> StepResult:
+def iter_subtract_matrices(a: Matrix, b: Matrix, verbosity: Verbosity = "full") -> StepStream:
     if not a or not b or len(a) != len(b) or len(a[0]) != len(b[0]):
         return StepResult(
             steps=["Dimensiones incompatibles para resta"], error="dimension_mismatch"
         )
-    steps: list[str] = []
-    steps.append("RESTA DE MATRICES: C = A - B")
+    detailed = verbosity == "full"
+    yield "RESTA DE MATRICES: C = A - B"
     result: Matrix = []
     for i, row in enumerate(a):
+        b_row = b[i]
+        if not detailed:
+            result.append([val - b_row[j] for j, val in enumerate(row)])
+            continue
         result_row: List[float] = []
         for j, val in enumerate(row):
-            r = val - b[i][j]
-            steps.append(f"C[{i+1},{j+1}] = {val} - {b[i][j]} = {r}")
+            r = val - b_row[j]
+            yield f"C[{i+1},{j+1}] = {val} - {b_row[j]} = {r}"
             result_row.append(r)
         result.append(result_row)
-    steps.append("")
-    steps.append("Resultado C = A - B:")
-    steps.append(format_matrix(result))
-    return StepResult(steps=steps, matrix=result)
+    yield ""
+    yield "Resultado C = A - B:"
+    if verbosity != "none":
+        yield format_matrix(result)
+    return StepResult(steps=[], matrix=result)
 
 
-def multiply_matrices_with_steps(a: Matrix, b: Matrix) -> StepResult:
+def iter_multiply_matrices(a: Matrix, b: Matrix, verbosity: Verbosity = "full") -> StepStream:
     if not a or not b or len(a[0]) != len(b):
         return StepResult(
             steps=["Dimensiones incompatibles para producto"], error="dimension_mismatch"
         )
-    steps: list[str] = []
     n_rows, n_inner, n_cols = len(a), len(a[0]), len(b[0])
-    steps.append("PRODUCTO DE MATRICES: C = A × B")
-    steps.append(f"Dimensiones: ({n_rows}×{n_inner})·({len(b)}×{n_cols})")
-    steps.append("")
+    yield "PRODUCTO DE MATRICES: C = A × B"
+    yield f"Dimensiones: ({n_rows}×{n_inner})·({len(b)}×{n_cols})"
+    yield ""
+    if verbosity != "full":
+        # sin términos que mostrar: producto fila × columna sobre las columnas de B
+        columns = list(zip(*b))
+        result = [[sum(x * y for x, y in zip(row, col)) for col in columns] for row in a]
+        yield "Resultado C = A × B:"
+        if verbosity != "none":
+            yield format_matrix(result)
+        return StepResult(steps=[], matrix=result)
     result: Matrix = [[0.0] * n_cols for _ in range(n_rows)]
     for i in range(n_rows):
         for j in range(n_cols):
@@ -69,64 +87,68 @@ def multiply_matrices_with_steps(a: Matrix, b: Matrix) -> StepResult:
                 prod = a[i][k] * b[k][j]
                 terms.append(f"({a[i][k]}×{b[k][j]})")
                 total += prod
-            steps.append(f"C[{i+1},{j+1}] = " + " + ".join(terms) + f" = {total}")
+            yield f"C[{i+1},{j+1}] = " + " + ".join(terms) + f" = {total}"
             result[i][j] = total
-        steps.append("")
-    steps.append("Resultado C = A × B:")
-    steps.append(format_matrix(result))
-    return StepResult(steps=steps, matrix=result)
+        yield ""
+    yield "Resultado C = A × B:"
+    yield format_matrix(result)
+    return StepResult(steps=[], matrix=result)
 
 
-def scalar_multiply_with_steps(m: Matrix, k: float) -> StepResult:
+def iter_scalar_multiply(m: Matrix, k: float, verbosity: Verbosity = "full") -> StepStream:
     if not m:
         return StepResult(steps=["Matriz vacía"], error="empty_matrix")
-    steps: list[str] = []
-    steps.append(f"MULTIPLICACIÓN POR ESCALAR: k = {k}")
+    detailed = verbosity == "full"
+    yield f"MULTIPLICACIÓN POR ESCALAR: k = {k}"
     result: Matrix = []
     for i, row in enumerate(m):
+        if not detailed:
+            result.append([k * val for val in row])
+            continue
         result_row: list[float] = []
         for j, val in enumerate(row):
             r = k * val
-            steps.append(f"C[{i+1},{j+1}] = {k}×{val} = {r}")
+            yield f"C[{i+1},{j+1}] = {k}×{val} = {r}"
             result_row.append(r)
         result.append(result_row)
-    steps.append("")
-    steps.append("Resultado C = k × A:")
-    steps.append(format_matrix(result))
-    return StepResult(steps=steps, matrix=result)
+    yield ""
+    yield "Resultado C = k × A:"
+    if verbosity != "none":
+        yield format_matrix(result)
+    return StepResult(steps=[], matrix=result)
 
 
-def transpose_with_steps(m: Matrix) -> StepResult:
+def iter_transpose(m: Matrix, verbosity: Verbosity = "full") -> StepStream:
     if not m:
         return StepResult(steps=["Matriz vacía"], error="empty_matrix")
     rows, cols = len(m), len(m[0])
-    steps: list[str] = []
-    steps.append("TRANSPOSICIÓN: C = Aᵀ")
+    yield "TRANSPOSICIÓN: C = Aᵀ"
     result: Matrix = [[m[i][j] for i in range(rows)] for j in range(cols)]
-    steps.append(format_matrix(result))
-    return StepResult(steps=steps, matrix=result)
+    if verbosity != "none":
+        yield format_matrix(result)
+    return StepResult(steps=[], matrix=result)
 
 
-def inverse_with_steps(m: Matrix) -> StepResult:
+def iter_inverse(m: Matrix, verbosity: Verbosity = "full") -> StepStream:
     if not m or len(m) != len(m[0]):
         return StepResult(
             steps=["La matriz debe ser cuadrada para invertirla"], error="not_square"
         )
     n = len(m)
-    steps: list[str] = []
-    det = _det_cofactors_recursive(m)
-    steps.append("INVERSA DE MATRIZ mediante Gauss-Jordan")
-    steps.append(f"det(A) = {det}")
+    yield "INVERSA DE MATRIZ mediante Gauss-Jordan"
+    det = determinant_value(m)
+    yield f"det(A) = {det}"
     if abs(det) < 1e-12:
-        steps.append("det(A) ≈ 0 → la matriz no es invertible")
-        return StepResult(steps=steps, error="singular")
+        yield "det(A) ≈ 0 → la matriz no es invertible"
+        return StepResult(steps=[], error="singular")
 
     # matriz aumentada [A | I]
     aug = [row[:] + [1.0 if i == j else 0.0 for j in range(n)] for i, row in enumerate(m)]
     for col in range(n):
         pivot = max(range(col, n), key=lambda r: abs(aug[r][col]))
         if abs(aug[pivot][col]) < 1e-12:
-            return StepResult(steps=steps + ["Pivote nulo"], error="singular")
+            yield "Pivote nulo"
+            return StepResult(steps=[], error="singular")
         if pivot != col:
             aug[col], aug[pivot] = aug[pivot], aug[col]
         pv = aug[col][col]
@@ -139,6 +161,65 @@ def inverse_with_steps(m: Matrix) -> StepResult:
             for j in range(2 * n):
                 aug[r][j] -= factor * aug[col][j]
     inv = [row[n:] for row in aug]
-    steps.append("A⁻¹:")
-    steps.append(format_matrix(inv))
-    return StepResult(steps=steps, matrix=inv)
+    yield "A⁻¹:"
+    if verbosity != "none":
+        yield format_matrix(inv)
+    return StepResult(steps=[], matrix=inv)
+
+
+def add_matrices_with_steps(a: Matrix, b: Matrix, verbosity: Verbosity = "full") -> StepResult:
+    return collect_steps(iter_add_matrices(a, b, verbosity), verbosity)
+
+
+def subtract_matrices_with_steps(a: Matrix, b: Matrix, verbosity: Verbosity = "full") -> StepResult:
+    return collect_steps(iter_subtract_matrices(a, b, verbosity), verbosity)
+
+
+def multiply_matrices_with_steps(a: Matrix, b: Matrix, verbosity: Verbosity = "full") -> StepResult:
+    return collect_steps(iter_multiply_matrices(a, b, verbosity), verbosity)
+
+
+def scalar_multiply_with_steps(m: Matrix, k: float, verbosity: Verbosity = "full") -> StepResult:
+    return collect_steps(iter_scalar_multiply(m, k, verbosity), verbosity)
+
+
+def transpose_with_steps(m: Matrix, verbosity: Verbosity = "full") -> StepResult:
+    return collect_steps(iter_transpose(m, verbosity), verbosity)
+
+
+def inverse_with_steps(m: Matrix, verbosity: Verbosity = "full") -> StepResult:
+    return collect_steps(iter_inverse(m, verbosity), verbosity)
+
+
+def iter_matrix_operation(
+    operation: str,
+    a: Matrix,
+    b: Optional[Matrix] = None,
+    scalar: Optional[float] = None,
+    verbosity: Verbosity = "full",
+) -> StepStream:
+    """StepStream de una operación de /matrix/operate."""
+    if operation == "add":
+        return iter_add_matrices(a, b, verbosity)          # type: ignore[arg-type]
+    if operation == "subtract":
+        return iter_subtract_matrices(a, b, verbosity)     # type: ignore[arg-type]
+    if operation == "multiply":
+        return iter_multiply_matrices(a, b, verbosity)     # type: ignore[arg-type]
+    if operation == "scalar":
+        return iter_scalar_multiply(a, scalar, verbosity)  # type: ignore[arg-type]
+    if operation == "transpose":
+        return iter_transpose(a, verbosity)
+    if operation == "inverse":
+        return iter_inverse(a, verbosity)
+    return finished_stream(StepResult(steps=["Operación no soportada"], error="unsupported"))
+
+
+def matrix_operation(
+    operation: str,
+    a: Matrix,
+    b: Optional[Matrix] = None,
+    scalar: Optional[float] = None,
+    verbosity: Verbosity = "full",
+) -> StepResult:
+    """Despacha una operación de /matrix/operate (función de módulo: se puede enviar a otro proceso)."""
+    return collect_steps(iter_matrix_operation(operation, a, b, scalar, verbosity), verbosity)
@@ -0,0 +1,207 @@
+from dataclasses import dataclass
+from typing import List, Literal, Optional, Tuple
+from .common import Matrix, StepLog, Vector
+
+StructureKind = Literal[
+    "diagonal", "permutation", "upper_triangular", "lower_triangular", "banded", "general"
+]
+
+STRUCTURE_NAMES = {
+    "diagonal": "diagonal",
+    "permutation": "de permutación",
+    "upper_triangular": "triangular superior",
+    "lower_triangular": "triangular inferior",
+    "banded": "de banda",
+    "general": "general (densa)",
+}
+
+
+@dataclass
+class MatrixStructure:
+    kind: StructureKind
+    lower_bandwidth: int
+    upper_bandwidth: int
+    symmetric: bool
+    # permutación como arreglo de índices: m[i][permutation[i]] == 1
+    permutation: Optional[List[int]] = None
+
+    @property
+    def is_special(self) -> bool:
+        return self.kind != "general"
+
+    def describe(self) -> str:
+        text = STRUCTURE_NAMES[self.kind]
+        if self.kind == "banded":
+            text += f" (p={self.lower_bandwidth}, q={self.upper_bandwidth})"
+        if self.symmetric and self.kind != "diagonal":
+            text += ", simétrica"
+        return text
+
+
+def classify_structure(m: Matrix, tol: float = 1e-12) -> MatrixStructure:
+    """Clasifica una matriz cuadrada en una sola pasada sobre sus entradas no nulas."""
+    n = len(m)
+    if n == 0 or any(len(row) != n for row in m):
+        return MatrixStructure("general", max(n - 1, 0), max(n - 1, 0), False)
+
+    p = q = 0
+    symmetric = True
+    nonzero_per_row: List[List[int]] = []
+    for i, row in enumerate(m):
+        cols = [j for j, v in enumerate(row) if abs(v) > tol]
+        nonzero_per_row.append(cols)
+        if cols:
+            p = max(p, i - cols[0])
+            q = max(q, cols[-1] - i)
+        if symmetric:
+            symmetric = all(abs(row[j] - m[j][i]) <= tol for j in range(i + 1, n))
+
+    if p == 0 and q == 0:
+        return MatrixStructure("diagonal", 0, 0, True)
+
+    if all(len(cols) == 1 and abs(m[i][cols[0]] - 1.0) <= tol for i, cols in enumerate(nonzero_per_row)):
+        perm = [cols[0] for cols in nonzero_per_row]
+        if len(set(perm)) == n:
+            return MatrixStructure("permutation", p, q, symmetric, permutation=perm)
+
+    if p == 0:
+        return MatrixStructure("upper_triangular", p, q, symmetric)
+    if q == 0:
+        return MatrixStructure("lower_triangular", p, q, symmetric)
+    if p + q + 1 < n:
+        return MatrixStructure("banded", p, q, symmetric)
+    return MatrixStructure("general", p, q, symmetric)
+
+
+def _permutation_sign(perm: List[int]) -> int:
+    seen = [False] * len(perm)
+    sign = 1
+    for start in range(len(perm)):
+        if seen[start]:
+            continue
+        length = 0
+        j = start
+        while not seen[j]:
+            seen[j] = True
+            j = perm[j]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
+
+
+def _banded_elimination(
+    m: Matrix, b: Optional[Vector], p: int, q: int
+) -> Tuple[Optional[Vector], float]:
+    """Eliminación de banda con pivoteo parcial, O(n·p·(p+q)). Devuelve (x, det).
+
+    Lanza ZeroDivisionError si la matriz es singular.
+    """
+    u = [row[:] for row in m]
+    y = b[:] if b is not None else None
+    n = len(u)
+    q_ext = p + q  # el pivoteo puede ensanchar la banda superior hasta p + q
+    det = 1.0
+    for k in range(n):
+        last_row = min(n, k + p + 1)
+        last_col = min(n, k + q_ext + 1)
+        pivot = max(range(k, last_row), key=lambda r: abs(u[r][k]))
+        if abs(u[pivot][k]) < 1e-12:
+            raise ZeroDivisionError("pivote nulo")
+        if pivot != k:
+            u[k], u[pivot] = u[pivot], u[k]
+            if y is not None:
+                y[k], y[pivot] = y[pivot], y[k]
+            det = -det
+        pv = u[k][k]
+        det *= pv
+        for r in range(k + 1, last_row):
+            factor = u[r][k] / pv
+            if factor == 0.0:
+                continue
+            for j in range(k, last_col):
+                u[r][j] -= factor * u[k][j]
+            if y is not None:
+                y[r] -= factor * y[k]
+    if y is None:
+        return None, det
+    x = [0.0] * n
+    for k in range(n - 1, -1, -1):
+        last_col = min(n, k + q_ext + 1)
+        s = sum(u[k][j] * x[j] for j in range(k + 1, last_col))
+        x[k] = (y[k] - s) / u[k][k]
+    return x, det
+
+
+def structured_determinant(m: Matrix, s: MatrixStructure, steps: StepLog) -> Optional[float]:
+    """Determinante por el atajo de la estructura; None si la matriz es general."""
+    if s.kind in ("diagonal", "upper_triangular", "lower_triangular"):
+        det = 1.0
+        for i in range(len(m)):
+            det *= m[i][i]
+        steps.append(f"Atajo: matriz {s.describe()} → det = producto de la diagonal (O(n))")
+        if steps.detailed:
+            steps.append("  det = " + " × ".join(str(m[i][i]) for i in range(len(m))) + f" = {det}")
+        return det
+    if s.kind == "permutation":
+        sign = _permutation_sign(s.permutation)  # type: ignore[arg-type]
+        steps.append(f"Atajo: matriz {s.describe()} → det = signo de la permutación (O(n))")
+        if steps.detailed:
+            steps.append("  π = (" + ", ".join(str(c + 1) for c in s.permutation) + f"), signo = {sign:+d}")  # type: ignore[union-attr]
+        return float(sign)
+    if s.kind == "banded":
+        try:
+            _, det = _banded_elimination(m, None, s.lower_bandwidth, s.upper_bandwidth)
+        except ZeroDivisionError:
+            det = 0.0
+        steps.append(
+            f"Atajo: matriz {s.describe()} → eliminación de banda O(n·p·(p+q)), "
+            "det = ± producto de pivotes"
+        )
+        steps.append(f"  det = {det}")
+        return det
+    return None
+
+
+def structured_solve(m: Matrix, b: Vector, s: MatrixStructure, steps: StepLog) -> Optional[Vector]:
+    """Resuelve m·x = b con el núcleo especializado; None si no aplica o es singular."""
+    n = len(m)
+    if s.kind in ("diagonal", "upper_triangular", "lower_triangular") and any(
+        abs(m[i][i]) < 1e-12 for i in range(n)
+    ):
+        return None
+
+    if s.kind == "diagonal":
+        steps.append(f"Atajo: matriz {s.describe()} → xᵢ = bᵢ / aᵢᵢ (O(n))")
+        return [b[i] / m[i][i] for i in range(n)]
+
+    if s.kind == "permutation":
+        steps.append(f"Atajo: matriz {s.describe()} → x[π(i)] = bᵢ (O(n), sin aritmética)")
+        x = [0.0] * n
+        for i, c in enumerate(s.permutation):  # type: ignore[arg-type]
+            x[c] = b[i]
+        return x
+
+    if s.kind == "upper_triangular":
+        steps.append(f"Atajo: matriz {s.describe()} → sustitución regresiva (O(n²))")
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            x[i] = (b[i] - sum(m[i][j] * x[j] for j in range(i + 1, n))) / m[i][i]
+        return x
+
+    if s.kind == "lower_triangular":
+        steps.append(f"Atajo: matriz {s.describe()} → sustitución progresiva (O(n²))")
+        x = [0.0] * n
+        for i in range(n):
+            x[i] = (b[i] - sum(m[i][j] * x[j] for j in range(i))) / m[i][i]
+        return x
+
+    if s.kind == "banded":
+        try:
+            x, _ = _banded_elimination(m, b, s.lower_bandwidth, s.upper_bandwidth)
+        except ZeroDivisionError:
+            return None
+        steps.append(f"Atajo: matriz {s.describe()} → eliminación de banda O(n·p·(p+q))")
+        return x
+
+    return None
@@ -0,0 +1,223 @@
+import ast
+import base64
+import binascii
+import math
+import struct
+import sys
+from array import array
+from itertools import chain
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from .common import Matrix, Vector
+
+try:  # MessagePack es opcional: sin el paquete msgpack esos cuerpos se rechazan
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
+
+TransportFormat = Literal["json", "npy", "msgpack"]
+
+JSON_MEDIA_TYPE = "application/json"
+NPY_MEDIA_TYPE = "application/x-npy"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MEDIA_TYPES: Dict[str, TransportFormat] = {
+    JSON_MEDIA_TYPE: "json",
+    NPY_MEDIA_TYPE: "npy",
+    MSGPACK_MEDIA_TYPE: "msgpack",
+    "application/x-msgpack": "msgpack",
+    "application/vnd.msgpack": "msgpack",
+}
+
+NPY_MAGIC = b"\x93NUMPY"
+# cabecera + datos de un .npy alineados a 64 bytes, como los escribe NumPy
+NPY_ALIGNMENT = 64
+# tipo de NumPy (sin el orden de bytes) → código de array/memoryview
+TYPECODES = {"f8": "d", "f4": "f", "i8": "q", "i4": "i"}
+
+
+class MatrixFormatError(ValueError):
+    """Cuerpo .npy / MessagePack o matriz codificada que no se puede interpretar."""
+
+
+# ── negociación de contenido ──
+
+
+def body_format(content_type: Optional[str]) -> Optional[TransportFormat]:
+    """Formato del cuerpo según Content-Type (sin cabecera: JSON); None si no se admite."""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if not media_type or media_type.endswith("+json"):
+        return "json"
+    return MEDIA_TYPES.get(media_type)
+
+
+def accept_format(accept: Optional[str]) -> TransportFormat:
+    """Formato de respuesta preferido según Accept (por calidad q y luego por orden); JSON si no hay otro."""
+    ranked = []
+    for position, item in enumerate((accept or "").split(",")):
+        media_type, *params = [part.strip().lower() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        fmt = MEDIA_TYPES.get(media_type)
+        if fmt is not None and quality > 0:
+            ranked.append((-quality, position, fmt))
+    return min(ranked)[2] if ranked else "json"
+
+
+# ── matrices binarias: valores por filas en un bloque de bytes ──
+
+
+def _typecode(dtype: str) -> tuple:
+    """(código de array, hay que invertir bytes) para un dtype de NumPy como '<f8'."""
+    order, kind = (dtype[0], dtype[1:]) if dtype[:1] in "<>=|" else ("=", dtype)
+    code = TYPECODES.get(kind)
+    if code is None:
+        raise MatrixFormatError(f"tipo de dato no admitido: {dtype!r} (se admiten f8, f4, i8, i4)")
+    swap = (order == "<" and sys.byteorder == "big") or (order == ">" and sys.byteorder == "little")
+    return code, swap
+
+
+def _unpack(data: Union[bytes, bytearray, memoryview], dtype: str, shape: List[int], order: str) -> Any:
+    """Valores de un bloque de bytes como listas anidadas de float (un escalar si shape es ())."""
+    code, swap = _typecode(dtype)
+    count = math.prod(shape)
+    view = memoryview(data).cast("B")
+    if len(view) != count * struct.calcsize(code):
+        raise MatrixFormatError(
+            f"{len(view)} bytes no corresponden a la forma {tuple(shape)} con tipo {dtype}"
+        )
+    if swap:
+        values = array(code)
+        values.frombytes(view)
+        values.byteswap()
+        view = memoryview(values).cast("B")
+    if not shape:
+        return float(view.cast(code)[0])
+    if count == 0:
+        return [[] for _ in range(shape[0])] if len(shape) == 2 else []
+    if len(shape) == 2 and order == "F":
+        columns = view.cast(code, [shape[1], shape[0]]).tolist()
+        rows = [list(row) for row in zip(*columns)]
+    else:
+        # sin copias intermedias: memoryview interpreta los bytes tal cual y tolist los convierte en C
+        rows = view.cast(code, list(shape)).tolist()
+    if code in "df":
+        return rows
+    if len(shape) == 1:
+        return [float(x) for x in rows]
+    return [[float(x) for x in row] for row in rows]
+
+
+def decode_matrix(encoded: Dict[str, Any]) -> Matrix:
+    """Matriz a partir de {"shape": [m, n], "dtype": "<f8", "order": "C", "data": ...}.
+
+    `data` son los bytes de los valores (MessagePack, .npy) o esos bytes en base64 (JSON).
+    """
+    shape = encoded.get("shape")
+    if (
+        not isinstance(shape, (list, tuple))
+        or len(shape) != 2
+        or not all(isinstance(d, int) and not isinstance(d, bool) and d >= 0 for d in shape)
+    ):
+        raise MatrixFormatError("'shape' debe ser [filas, columnas]")
+    dtype = encoded.get("dtype", "<f8")
+    order = encoded.get("order", "C")
+    if not isinstance(dtype, str) or order not in ("C", "F"):
+        raise MatrixFormatError("'dtype' debe ser texto y 'order' 'C' o 'F'")
+    data = encoded.get("data")
+    if isinstance(data, str):
+        try:
+            data = base64.b64decode(data, validate=True)
+        except binascii.Error as e:
+            raise MatrixFormatError(f"'data' no es base64 válido: {e}") from None
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise MatrixFormatError("'data' debe ser binario o texto en base64")
+    return _unpack(data, dtype, list(shape), order)
+
+
+def encode_matrix(m: Matrix, as_text: bool = False) -> Dict[str, Any]:
+    """Forma binaria de una matriz (float64 little-endian por filas); `as_text` pasa los bytes a base64."""
+    values = array("d", chain.from_iterable(m))
+    if sys.byteorder == "big":
+        values.byteswap()
+    data = values.tobytes()
+    return {
+        "dtype": "<f8",
+        "shape": [len(m), len(m[0]) if m else 0],
+        "order": "C",
+        "data": base64.b64encode(data).decode("ascii") if as_text else data,
+    }
+
+
+def is_matrix(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and isinstance(value[0], list)
+
+
+# ── .npy ──
+
+
+def read_npy(body: bytes) -> Dict[str, Any]:
+    """Cabecera de un .npy y vista de sus datos, en la forma que acepta decode_matrix."""
+    if body[:6] != NPY_MAGIC or len(body) < 10:
+        raise MatrixFormatError("el cuerpo no es un archivo .npy")
+    major = body[6]
+    if major == 1:
+        (header_len,), start = struct.unpack("<H", body[8:10]), 10
+    elif major in (2, 3):
+        (header_len,), start = struct.unpack("<I", body[8:12]), 12
+    else:
+        raise MatrixFormatError(f"versión de .npy no admitida: {major}")
+    header = body[start:start + header_len].decode("utf-8" if major == 3 else "latin1")
+    try:
+        meta = ast.literal_eval(header)
+        descr, fortran, shape = meta["descr"], meta["fortran_order"], meta["shape"]
+    except (ValueError, SyntaxError, KeyError, TypeError):
+        raise MatrixFormatError("cabecera .npy no válida") from None
+    if not isinstance(descr, str) or not isinstance(shape, tuple):
+        raise MatrixFormatError("solo se admiten arrays .npy de tipo numérico simple")
+    return {
+        "dtype": descr,
+        "shape": list(shape),
+        "order": "F" if fortran else "C",
+        "data": memoryview(body)[start + header_len:],
+    }
+
+
+def encode_npy(value: Union[Matrix, Vector, float]) -> bytes:
+    """Un .npy (versión 1.0, float64 little-endian) con una matriz, un vector o un escalar."""
+    if is_matrix(value):
+        shape: tuple = (len(value), len(value[0]))
+        flat = chain.from_iterable(value)
+    elif isinstance(value, list):
+        shape, flat = (len(value),), value
+    else:
+        shape, flat = (), [value]
+    values = array("d", flat)
+    if sys.byteorder == "big":
+        values.byteswap()
+    header = f"{{'descr': '<f8', 'fortran_order': False, 'shape': {shape!r}, }}"
+    padding = -(len(NPY_MAGIC) + 4 + len(header) + 1) % NPY_ALIGNMENT
+    header = (header + " " * padding + "\n").encode("latin1")
+    return NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header + values.tobytes()
+
+
+# ── MessagePack ──
+
+
+def unpack_msgpack(body: bytes) -> Any:
+    try:
+        return msgpack.unpackb(body, raw=False)
+    except (ValueError, TypeError):  # los errores de msgpack derivan de ValueError
+        raise MatrixFormatError("el cuerpo no es MessagePack válido") from None
+
+
+def pack_msgpack(payload: Dict[str, Any]) -> bytes:
+    """MessagePack de una respuesta; sus matrices van en forma binaria (ver encode_matrix)."""
+    return msgpack.packb(
+        {key: encode_matrix(value) if is_matrix(value) else value for key, value in payload.items()},
+        use_bin_type=True,
+    )
@@ -0,0 +1,203 @@
+from typing import List, Literal, Optional
+
+from .common import Matrix, StepLog, StepResult, Vector, Verbosity, format_matrix
+from .derivativeCache import jacobian_cache
+from .expressionCompiler import ExpressionError, compile_system
+from .linearSystems import lu_factor, lu_solve
+
+NonlinearMethod = Literal["newton", "chord", "broyden"]
+JacobianBackend = Literal["ad", "sympy"]
+
+# se muestra J(x) en la traza hasta este tamaño
+MAX_TRACED_JACOBIAN = 4
+# en modo cuerda se refactoriza J si ‖F‖ no baja al menos en este factor
+CHORD_STALL_RATIO = 0.9
+
+METHOD_TITLES = {
+    "newton": "MÉTODO DE NEWTON PARA SISTEMAS",
+    "chord": "MÉTODO DE LA CUERDA (JACOBIANO FIJO)",
+    "broyden": "MÉTODO DE BROYDEN (ACTUALIZACIÓN DE RANGO 1)",
+}
+
+
+def default_variables(n: int) -> List[str]:
+    return ["x", "y", "z"][:n] if n <= 3 else [f"x{i}" for i in range(1, n + 1)]
+
+
+def _fmt_vec(v: Vector) -> str:
+    return "(" + ", ".join(f"{x:.8f}" for x in v) + ")"
+
+
+def _norm_inf(v: Vector) -> float:
+    return max((abs(x) for x in v), default=0.0)
+
+
+def _inverse_from_lu(lu: Matrix, perm: List[int]) -> Matrix:
+    n = len(lu)
+    columns = [lu_solve(lu, perm, [1.0 if i == j else 0.0 for i in range(n)]) for j in range(n)]
+    return [[columns[j][i] for j in range(n)] for i in range(n)]
+
+
+def _matvec(m: Matrix, v: Vector) -> Vector:
+    return [sum(a * b for a, b in zip(row, v)) for row in m]
+
+
+def solve_nonlinear_system(
+    exprs: List[str],
+    x0: List[float],
+    variables: Optional[List[str]] = None,
+    method: NonlinearMethod = "newton",
+    jacobian: JacobianBackend = "ad",
+    tol: float = 1e-10,
+    max_iter: int = 50,
+    verbosity: Verbosity = "full",
+) -> StepResult:
+    """Resuelve F(x) = 0, x ∈ ℝⁿ.
+
+    newton: J(x) y su LU en cada iteración, O(n³) por paso.
+    chord: LU de J(x₀) reutilizada, O(n²) por paso; se refactoriza solo si ‖F‖ se estanca.
+    broyden: H ≈ J⁻¹ inicial por LU y actualizaciones de Sherman-Morrison, O(n²) por paso.
+    J se obtiene por diferenciación automática o, con jacobian="sympy", de la caché simbólica.
+    """
+    n = len(x0)
+    if n == 0 or len(exprs) != n:
+        return StepResult(steps=["Error: el sistema debe tener tantas ecuaciones como incógnitas"], error="not_square")
+    variables = variables or default_variables(n)
+    if len(variables) != n:
+        return StepResult(steps=["Error: número de variables distinto del de incógnitas"], error="not_square")
+    try:
+        system = compile_system(exprs, variables)
+        symbolic = jacobian_cache.get(exprs, variables) if jacobian == "sympy" else None
+    except ExpressionError as e:
+        return StepResult(steps=[f"Error en la expresión: {e}"], error="parse_error")
+    except Exception as e:
+        return StepResult(steps=[f"Error al calcular el jacobiano: {e}"], error="parse_error")
+
+    def f_and_jacobian(x: Vector):
+        if symbolic is not None:
+            fx, jx = symbolic.f_and_jacobian(*x)
+            return [float(v) for v in fx], [[float(v) for v in row] for row in jx]
+        return system.value_and_jacobian(x)
+
+    names = ", ".join(variables)
+    steps = StepLog(verbosity=verbosity)
+    steps.append('════════════════════════════════════════════')
+    steps.append(f'   {METHOD_TITLES[method]}')
+    steps.append('════════════════════════════════════════════')
+    steps.append('Sistema F(x) = 0:')
+    for i, e in enumerate(exprs, start=1):
+        steps.append(f'  f{i}({names}) = {e}')
+    if symbolic is not None:
+        steps.append('Jacobiano simbólico:')
+        for i, row in enumerate(symbolic.jacobian_exprs, start=1):
+            steps.append(f'  ∇f{i} = (' + ", ".join(map(str, row)) + ')')
+    else:
+        steps.append('Jacobiano: diferenciación automática (números duales)')
+    steps.append(f'Semilla inicial: x0 = {_fmt_vec(x0)}')
+    steps.append('')
+    steps.append('Fórmula iterativa:')
+    steps.append('J·Δx = -F(x(i)),  x(i+1) = x(i) + Δx')
+    steps.append('----------------------------------------')
+
+    x = [float(v) for v in x0]
+    evaluations = jacobians = factorizations = 0
+    lu: Optional[Matrix] = None
+    perm: List[int] = []
+    h_inv: Optional[Matrix] = None
+    fx: Optional[Vector] = None
+
+    def details(iterations: int) -> dict:
+        return {
+            "iterations": iterations,
+            "evaluations": evaluations,
+            "jacobian_evaluations": jacobians,
+            "factorizations": factorizations,
+        }
+
+    try:
+        for i in range(1, max_iter + 1):
+            refresh = method == "newton" or lu is None and h_inv is None
+            if refresh:
+                fx, jx = f_and_jacobian(x)
+                evaluations += 1
+                jacobians += 1
+                lu, perm = lu_factor(jx)
+                factorizations += 1
+                if method == "broyden":
+                    h_inv = _inverse_from_lu(lu, perm)
+            elif fx is None:
+                fx = system(x)
+                evaluations += 1
+
+            if steps.detailed:
+                steps.append(f"Iteración {i}:")
+                steps.append(f"  x        = {_fmt_vec(x)}")
+                steps.append(f"  F(x)     = {_fmt_vec(fx)}")
+                steps.append(f"  ‖F(x)‖∞  = {_norm_inf(fx):.8e}")
+                if refresh and n <= MAX_TRACED_JACOBIAN:
+                    steps.append("  J(x) =")
+                    steps.extend("    " + line for line in format_matrix(jx).splitlines())
+                elif refresh:
+                    steps.append(f"  J(x): {n}×{n} evaluado y factorizado (LU)")
+
+            if method == "broyden":
+                dx = [-v for v in _matvec(h_inv, fx)]  # type: ignore[arg-type]
+            else:
+                dx = lu_solve(lu, perm, [-v for v in fx])  # type: ignore[arg-type]
+            x_next = [a + b for a, b in zip(x, dx)]
+            error = _norm_inf(dx)
+            if steps.detailed:
+                steps.append(f"  Δx       = {_fmt_vec(dx)}")
+                steps.append(f"  x_sig    = {_fmt_vec(x_next)}")
+                steps.append(f"  Error    = {error:.8e}")
+
+            if error < tol or _norm_inf(fx) < tol:
+                steps.append("")
+                steps.append("  ✓ Convergencia alcanzada")
+                steps.append('════════════════════════════════════════════')
+                if steps.enabled:
+                    steps.append(f"  SOLUCIÓN APROXIMADA: {_fmt_vec(x_next)}")
+                    steps.append(
+                        f"  Iteraciones: {i}, evaluaciones de F: {evaluations}, de J: {jacobians}, "
+                        f"factorizaciones LU: {factorizations}"
+                    )
+                return StepResult(steps=steps, vector=x_next, details=details(i))
+
+            f_next = None
+            if method != "newton":
+                f_next = system(x_next)
+                evaluations += 1
+            if method == "broyden":
+                # H ← H + (Δx − H·y)·(Δxᵀ·H) / (Δxᵀ·H·y), con y = F(x_sig) − F(x)
+                y = [a - b for a, b in zip(f_next, fx)]  # type: ignore[arg-type]
+                hy = _matvec(h_inv, y)  # type: ignore[arg-type]
+                denom = sum(a * b for a, b in zip(dx, hy))
+                if abs(denom) < 1e-300:
+                    if steps.detailed:
+                        steps.append("  Actualización de Broyden degenerada: se recalcula J")
+                    h_inv = None
+                    lu = None
+                else:
+                    dx_h = [sum(dx[k] * h_inv[k][j] for k in range(n)) for j in range(n)]  # type: ignore[index]
+                    u = [(a - b) / denom for a, b in zip(dx, hy)]
+                    for r in range(n):
+                        ur = u[r]
+                        row = h_inv[r]  # type: ignore[index]
+                        for c in range(n):
+                            row[c] += ur * dx_h[c]
+            elif method == "chord" and _norm_inf(f_next) > CHORD_STALL_RATIO * _norm_inf(fx):  # type: ignore[arg-type]
+                if steps.detailed:
+                    steps.append("  ‖F‖ no disminuye lo suficiente: se recalcula y refactoriza J")
+                lu = None
+            x, fx = x_next, f_next
+            if steps.detailed:
+                steps.append("")
+    except ZeroDivisionError:
+        steps.append("  ERROR CRÍTICO: el jacobiano es singular (o casi singular).")
+        return StepResult(steps=steps, error="singular_jacobian", details=details(i))
+    except (ArithmeticError, ValueError) as e:
+        steps.append(f"Error matemático al evaluar (dominio inválido): {e}")
+        return StepResult(steps=steps, error="math_error", details=details(i))
+
+    steps.append("AVISO: Se alcanzó el número máximo de iteraciones sin converger completamente.")
+    return StepResult(steps=steps, vector=x, details=details(max_iter))
@@ -1,14 +1,39 @@
 import math
-import sympy as sp
-from typing import Dict, Callable
-from .common import StepResult
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from .acceleration import (
+    Acceleration,
+    CountingFunction,
+    aitken_accelerate,
+    false_position_iterates,
+    false_position_steps,
+    fixed_point_iterates,
+    newton_step,
+    newton_steps,
+    secant_iterates,
+    secant_steps,
+    steffensen,
+)
+from .common import StepLog, StepResult, Verbosity, format_matrix
+from .derivativeCache import derivative_cache
+from .expressionCompiler import MAX_POLYNOMIAL_DEGREE, ExpressionError, compile_expression
+from .polynomials import QRConvergenceError, horner, polynomial_roots
+from .rootBracketing import bisect_many, find_all_roots, illinois_many, safe_evaluate_many
+
+MAX_SCAN_SAMPLES = 1_000_000
+MAX_LISTED_ROOTS = 50
+MAX_SWEEP_BRACKETS = 100_000
+# la matriz compañera se muestra en la traza hasta este grado
+MAX_TRACED_COMPANION = 6
 
 
 def decompose_base10(num_str: str) -> StepResult:
     num_str = num_str.strip()
     if not num_str.isdigit():
         return StepResult(steps=["Error: ingrese solo dígitos (base 10)"], error="invalid")
-    steps: list[str] = []
+    steps = StepLog()
     digits = list(reversed(num_str))
     decomposition = []
     values = []
@@ -27,7 +52,7 @@ def decompose_base2(num_str: str) -> StepResult:
     num_str = num_str.strip()
     if not num_str or any(c not in "01" for c in num_str):
         return StepResult(steps=["Error: ingrese solo 0 y 1"], error="invalid")
-    steps: list[str] = []
+    steps = StepLog()
     digits = list(reversed(num_str))
     values = []
     for pos, d in enumerate(digits):
@@ -43,7 +68,7 @@ def decompose_base2(num_str: str) -> StepResult:
 def demonstrate_roundoff(value: float, n: int) -> StepResult:
     if n < 1 or n > 100:
         return StepResult(steps=["n debe estar entre 1 y 100"], error="invalid_n")
-    steps: list[str] = []
+    steps = StepLog()
     s = 0.0
     for i in range(1, n + 1):
         s += value
@@ -56,7 +81,7 @@ def demonstrate_roundoff(value: float, n: int) -> StepResult:
 def demonstrate_truncation(x: float, max_terms: int) -> StepResult:
     if max_terms < 1 or max_terms > 50:
         return StepResult(steps=["términos fuera de rango"], error="invalid_terms")
-    steps: list[str] = []
+    steps = StepLog()
     exact = math.exp(x)
     approx = 0.0
     fact = 1.0
@@ -75,7 +100,7 @@ def demonstrate_truncation(x: float, max_terms: int) -> StepResult:
 
 
 def demonstrate_propagation(a: float, b: float) -> StepResult:
-    steps: list[str] = []
+    steps = StepLog()
     s1 = a + b
     s2 = a - (a - b)
     steps.append(f"a + b = {s1}")
@@ -86,167 +111,253 @@ def demonstrate_propagation(a: float, b: float) -> StepResult:
     return StepResult(steps=steps)
 
 
-def _eval_function(expr: str, x: float) -> float:
-    allowed: Dict[str, Callable[..., float]] = {
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "sqrt": math.sqrt,
-        "exp": math.exp,
-        "log": math.log,
-    }
-    env = {"x": x, **allowed, "__builtins__": {}}
-    expr = expr.replace("^", "**")
-    return eval(expr, env)  # en producción usar parser seguro
+class EvaluationTimeout(Exception):
+    """Se agotó el tiempo asignado a un cálculo (se comprueba en cada evaluación de f)."""
 
 
-def solve_bisection(expr: str, a: float, b: float, tol: float, max_iter: int) -> StepResult:
-    steps: list[str] = []
-    
-    fa = _eval_function(expr, a)
-    fb = _eval_function(expr, b)
-    
-    steps.append('════════════════════════════════════════════')
-    steps.append('       MÉTODO DE BISECCIÓN (DETALLADO)')
-    steps.append('════════════════════════════════════════════')
-    steps.append(f'Función: f(x) = {expr}')
-    steps.append(f'Intervalo inicial: [{a}, {b}]')
-    steps.append(f'f({a}) = {fa:.6f}')
-    steps.append(f'f({b}) = {fb:.6f}')
-    steps.append('')
+class EvaluationMeter:
+    """Cuenta evaluaciones de f y, opcionalmente, impone un tiempo límite."""
 
-    if fa * fb > 0:
-        steps.append('ERROR: f(a) y f(b) tienen el mismo signo.')
-        steps.append('No se cumple el teorema de Bolzano.')
-        return StepResult(steps=steps, error="same_sign")
-    
-    steps.append('Chequeo de signo: f(a) * f(b) < 0 -> OK')
-    steps.append('----------------------------------------')
+    __slots__ = ("count", "deadline")
 
-    for k in range(1, max_iter + 1):
-        c = (a + b) / 2.0
-        fc = _eval_function(expr, c)
-        error = (b - a) / 2.0
-        
-        steps.append(f"Iteración {k}:")
-        steps.append(f"  a={a:.6f}, b={b:.6f}")
-        steps.append(f"  Punto medio (c) = ({a:.4f} + {b:.4f}) / 2 = {c:.6f}")
-        steps.append(f"  f(c) = {fc:.8f}")
-        steps.append(f"  Error est. = {error:.8f}")
+    def __init__(self, timeout: Optional[float] = None):
+        self.count = 0
+        self.deadline = time.perf_counter() + timeout if timeout is not None else None
 
-        if abs(fc) < tol or error < tol:
-            steps.append("")
-            steps.append("  ✓ Condición de parada alcanzada (tolerancia)")
-            steps.append('════════════════════════════════════════════')
-            steps.append(f"  RAÍZ APROX: {c:.8f}")
-            return StepResult(steps=steps, vector=[c])
+    def tick(self, n: int = 1) -> None:
+        self.count += n
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise EvaluationTimeout()
 
-        if fa * fc < 0:
-            steps.append("  Signos opuestos entre a y c -> Nuevo intervalo [a, c]")
-            b = c
-            fb = fc # 
-        else:
-            steps.append("  Signos opuestos entre c y b -> Nuevo intervalo [c, b]")
-            a = c
-            fa = fc 
-        steps.append("")
 
-    steps.append("AVISO: Máximo de iteraciones alcanzado.")
-    return StepResult(steps=steps, vector=[(a + b) / 2.0])
+# medidor activo (comparación de métodos, trabajos por lotes); None en peticiones normales
+_evaluation_meter: ContextVar[Optional[EvaluationMeter]] = ContextVar("evaluation_meter", default=None)
 
-def solve_false_position(expr: str, a: float, b: float, tol: float, max_iter: int) -> StepResult:
-    steps: list[str] = []
 
-    fa = _eval_function(expr, a)
-    fb = _eval_function(expr, b)
+class _MeteredExpression:
+    """Envuelve una CompiledExpression y registra cada evaluación de f (o de f y f′)."""
 
-    steps.append('════════════════════════════════════════════')
-    steps.append('   MÉTODO DE REGLA FALSA (FALSE POSITION)')
-    steps.append('════════════════════════════════════════════')
-    steps.append('')
-    steps.append(f'Función: f(x) = {expr}')
-    steps.append(f'Intervalo: [{a}, {b}]')
-    steps.append(f'Tolerancia: {tol}')
-    steps.append(f'Iteraciones máximas: {max_iter}')
-    steps.append('')
-    steps.append(f'f({a}) = {fa:.6f}')
-    steps.append(f'f({b}) = {fb:.6f}')
-    steps.append('')
+    __slots__ = ("_f", "_meter")
 
-    if fa * fb > 0:
-        steps.append('ERROR: f(a) y f(b) deben tener signos opuestos')
-        return StepResult(steps=steps, error="same_sign")
+    def __init__(self, f, meter: EvaluationMeter):
+        self._f = f
+        self._meter = meter
 
-    a_val, b_val = a, b
-    c = a_val
-    iteration = 0
-    c_prev = a_val
+    def __call__(self, x):
+        self._meter.tick()
+        return self._f(x)
 
-    while iteration < max_iter:
-        fa = _eval_function(expr, a_val)
-        fb = _eval_function(expr, b_val)
-        
-        # Evitar división por cero si fa == fb (raro pero posible)
-        if abs(fb - fa) < 1e-15:
-            steps.append("Error: Denominador cercano a cero en interpolación.")
-            break
-
-        c = b_val - (fb * (b_val - a_val)) / (fb - fa)
-        fc = _eval_function(expr, c)
-        error = abs(c - c_prev) if iteration > 0 else abs(b_val - a_val)
-
-        steps.append(f'Iteración {iteration + 1}:')
-        steps.append(f'  Intervalo: [{a_val:.5f}, {b_val:.5f}]')
-        steps.append(f'  c = {b_val:.5f} - ({fb:.4f}*({b_val:.4f}-{a_val:.4f}))/({fb:.4f}-{fa:.4f})')
-        steps.append(f'  c = {c:.6f}, f(c) = {fc:.8f}')
-        steps.append(f'  Error = {error:.8f}')
-
-        if abs(fc) < tol or error < tol:
-            steps.append('  ✓ Convergencia alcanzada!')
-            break
-
-        if fa * fc < 0:
-            b_val = c
-        else:
-            a_val = c
-        
-        steps.append("")
-        c_prev = c
-        iteration += 1
+    def value_and_derivative(self, x):
+        self._meter.tick()
+        return self._f.value_and_derivative(x)
 
-    steps.append('═════════════════════════════════════════════')
-    steps.append(f'  RAÍZ ENCONTRADA: x ≈ {c:.8f}')
-    return StepResult(steps=steps, vector=[c])
+    def evaluate_many(self, xs):
+        values = self._f.evaluate_many(xs)
+        self._meter.tick(len(values))
+        return values
 
+    @property
+    def coefficients(self):
+        return self._f.coefficients
 
-def solve_newton_raphson(expr: str, x0: float, tol: float, max_iter: int) -> StepResult:
 
-    steps: list[str] = []
-    
-    #Configuración de SymPy
+@contextmanager
+def metered(timeout: Optional[float] = None) -> Iterator[EvaluationMeter]:
+    """Activa un EvaluationMeter para las llamadas a solve_* del bloque `with`."""
+    meter = EvaluationMeter(timeout)
+    token = _evaluation_meter.set(meter)
     try:
-        x_sym = sp.symbols('x')
-        
-        # Convertir el string a expresión simbólica (ej: "x^2 - 4" -> x**2 - 4)
-        # sympify es inteligente y entiende 'sin', 'cos', 'exp', etc.
-        f_expr = sp.sympify(expr.replace('^', '**'))
-        
-        # Calcular la derivada simbólica
-        df_expr = sp.diff(f_expr, x_sym)
-        
-        # Convertir a funciones rápidas de Python para evaluar números
-        f_func = sp.lambdify(x_sym, f_expr, modules=['math'])
-        df_func = sp.lambdify(x_sym, df_expr, modules=['math'])
-        
-    except Exception as e:
-        return StepResult(steps=[f"Error al calcular la derivada: {e}"], error="parse_error")
+        yield meter
+    finally:
+        _evaluation_meter.reset(token)
+
+
+# errores al evaluar f fuera de su dominio (log(-1), 1/0, desbordamiento, valor complejo)
+MATH_ERRORS = (ArithmeticError, ValueError, TypeError)
+
+
+def _math_error(steps: StepLog, e: Exception) -> StepResult:
+    """StepResult de error con los pasos hechos hasta la evaluación que falló."""
+    steps.append(f"Error matemático al evaluar (dominio inválido): {e}")
+    return StepResult(steps=steps, error="math_error")
+
+
+def _compile_or_error(expr: str):
+    """(función compilada, None) o (None, StepResult de error) si la expresión no es válida."""
+    try:
+        f = compile_expression(expr)
+    except ExpressionError as e:
+        return None, StepResult(steps=[f"Error en la expresión: {e}"], error="parse_error")
+    meter = _evaluation_meter.get()
+    return (f if meter is None else _MeteredExpression(f, meter)), None
+
+
+def solve_bisection(
+    expr: str, a: float, b: float, tol: float, max_iter: int, verbosity: Verbosity = "full"
+) -> StepResult:
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    steps = StepLog(verbosity=verbosity)
+    try:
+
+        fa = f(a)
+        fb = f(b)
+
+        steps.append('════════════════════════════════════════════')
+        steps.append('       MÉTODO DE BISECCIÓN (DETALLADO)')
+        steps.append('════════════════════════════════════════════')
+        steps.append(f'Función: f(x) = {expr}')
+        steps.append(f'Intervalo inicial: [{a}, {b}]')
+        steps.append(f'f({a}) = {fa:.6f}')
+        steps.append(f'f({b}) = {fb:.6f}')
+        steps.append('')
+
+        if fa * fb > 0:
+            steps.append('ERROR: f(a) y f(b) tienen el mismo signo.')
+            steps.append('No se cumple el teorema de Bolzano.')
+            return StepResult(steps=steps, error="same_sign")
+
+        steps.append('Chequeo de signo: f(a) * f(b) < 0 -> OK')
+        steps.append('----------------------------------------')
+
+        for k in range(1, max_iter + 1):
+            c = (a + b) / 2.0
+            fc = f(c)
+            error = (b - a) / 2.0
+
+            if steps.detailed:
+                steps.append(f"Iteración {k}:")
+                steps.append(f"  a={a:.6f}, b={b:.6f}")
+                steps.append(f"  Punto medio (c) = ({a:.4f} + {b:.4f}) / 2 = {c:.6f}")
+                steps.append(f"  f(c) = {fc:.8f}")
+                steps.append(f"  Error est. = {error:.8f}")
 
+            if abs(fc) < tol or error < tol:
+                steps.append("")
+                steps.append("  ✓ Condición de parada alcanzada (tolerancia)")
+                steps.append('════════════════════════════════════════════')
+                steps.append(f"  RAÍZ APROX: {c:.8f}")
+                return StepResult(steps=steps, vector=[c], details={"iterations": k})
+
+            if fa * fc < 0:
+                if steps.detailed:
+                    steps.append("  Signos opuestos entre a y c -> Nuevo intervalo [a, c]")
+                b = c
+                fb = fc # 
+            else:
+                if steps.detailed:
+                    steps.append("  Signos opuestos entre c y b -> Nuevo intervalo [c, b]")
+                a = c
+                fa = fc 
+            if steps.detailed:
+                steps.append("")
+
+        steps.append("AVISO: Máximo de iteraciones alcanzado.")
+        return StepResult(steps=steps, vector=[(a + b) / 2.0], details={"iterations": max_iter})
+    except MATH_ERRORS as e:
+        return _math_error(steps, e)
+
+def solve_false_position(
+    expr: str, a: float, b: float, tol: float, max_iter: int, verbosity: Verbosity = "full"
+) -> StepResult:
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    steps = StepLog(verbosity=verbosity)
+    try:
+
+        fa = f(a)
+        fb = f(b)
+
+        steps.append('════════════════════════════════════════════')
+        steps.append('   MÉTODO DE REGLA FALSA (FALSE POSITION)')
+        steps.append('════════════════════════════════════════════')
+        steps.append('')
+        steps.append(f'Función: f(x) = {expr}')
+        steps.append(f'Intervalo: [{a}, {b}]')
+        steps.append(f'Tolerancia: {tol}')
+        steps.append(f'Iteraciones máximas: {max_iter}')
+        steps.append('')
+        steps.append(f'f({a}) = {fa:.6f}')
+        steps.append(f'f({b}) = {fb:.6f}')
+        steps.append('')
+
+        if fa * fb > 0:
+            steps.append('ERROR: f(a) y f(b) deben tener signos opuestos')
+            return StepResult(steps=steps, error="same_sign")
+
+        c = c_prev = a
+        iteration = 0
+        path = false_position_steps(f, a, b, fa, fb)
+
+        while iteration < max_iter:
+            # Evitar división por cero si fa == fb (raro pero posible). fa y fb son los
+            # valores iniciales: solo pueden coincidir en el primer paso; luego lo dice cada paso.
+            step = next(path) if abs(fb - fa) >= 1e-15 else None
+            if step is None or abs(step.fb - step.fa) < 1e-15:
+                steps.append("Error: Denominador cercano a cero en interpolación.")
+                break
+
+            c, fc = step.c, step.fc
+            error = abs(c - c_prev) if iteration > 0 else abs(b - a)
+
+            if steps.detailed:
+                lo, hi = sorted((step.a, step.b))
+                steps.append(f'Iteración {iteration + 1}:')
+                steps.append(f'  Intervalo: [{lo:.5f}, {hi:.5f}]')
+                steps.append(f'  c = {step.b:.5f} - ({step.fb:.4f}*({step.b:.4f}-{step.a:.4f}))/({step.fb:.4f}-{step.fa:.4f})')
+                steps.append(f'  c = {c:.6f}, f(c) = {fc:.8f}')
+                steps.append(f'  Error = {error:.8f}')
+
+            if abs(fc) < tol or error < tol:
+                steps.append('  ✓ Convergencia alcanzada!')
+                iteration += 1
+                break
+
+            if steps.detailed:
+                steps.append("")
+            c_prev = c
+            iteration += 1
+
+        steps.append('═════════════════════════════════════════════')
+        steps.append(f'  RAÍZ ENCONTRADA: x ≈ {c:.8f}')
+        return StepResult(steps=steps, vector=[c], details={"iterations": iteration})
+    except MATH_ERRORS as e:
+        return _math_error(steps, e)
+
+
+def solve_newton_raphson(
+    expr: str,
+    x0: float,
+    tol: float,
+    max_iter: int,
+    symbolic_derivative: bool = False,
+    verbosity: Verbosity = "full",
+) -> StepResult:
+    """Newton-Raphson con f′ por diferenciación automática (números duales).
+
+    SymPy solo se usa, si se pide, para mostrar f′(x) de forma simbólica.
+    """
+    steps = StepLog(verbosity=verbosity)
     
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+
+    df_text = "diferenciación automática (números duales)"
+    if symbolic_derivative:
+        # f′ simbólica cacheada por expresión (sympify + diff); solo para mostrarla
+        try:
+            df_text = str(derivative_cache.get(expr).df_expr)
+        except Exception as e:
+            return StepResult(steps=[f"Error al calcular la derivada: {e}"], error="parse_error")
+
     steps.append('════════════════════════════════════════════')
-    steps.append('    MÉTODO DE NEWTON-RAPHSON (CON SYMPY)')
+    steps.append('   MÉTODO DE NEWTON-RAPHSON (DERIVACIÓN AD)')
     steps.append('════════════════════════════════════════════')
     steps.append(f'Función original: f(x) = {expr}')
-    steps.append(f'Derivada calculada: f\'(x) = {df_expr}') 
+    steps.append(f'Derivada calculada: f\'(x) = {df_text}') 
     steps.append(f'Semilla inicial: x0 = {x0}')
     steps.append('')
     steps.append('Fórmula iterativa:')
@@ -254,35 +365,39 @@ def solve_newton_raphson(expr: str, x0: float, tol: float, max_iter: int) -> Ste
     steps.append('----------------------------------------')
 
     x_curr = x0
-    
-    # 3. Ciclo iterativo
+    path = newton_steps(f, x0)
+
     for i in range(1, max_iter + 1):
         try:
-            # Evaluamos usando las funciones compiladas por SymPy
-            fx = f_func(x_curr)
-            dfx = df_func(x_curr)
+            # f y f′ en una sola pasada con números duales
+            step = next(path)
         except Exception as e:
             steps.append(f"Error matemático al evaluar (dominio inválido): {str(e)}")
-            return StepResult(steps=steps, error="math_error")
+            return StepResult(steps=steps, error="math_error", details={"iterations": i - 1})
+        fx, dfx = step.fx, step.dfx
 
-        steps.append(f"Iteración {i}:")
-        steps.append(f"  x_actual = {x_curr:.8f}")
-        steps.append(f"  f(x)     = {fx:.8f}")
-        steps.append(f"  f'(x)    = {dfx:.8f}")
+        if steps.detailed:
+            steps.append(f"Iteración {i}:")
+            steps.append(f"  x_actual = {x_curr:.8f}")
+            steps.append(f"  f(x)     = {fx:.8f}")
+            steps.append(f"  f'(x)    = {dfx:.8f}")
 
-        
-        if abs(dfx) < 1e-15:
+        if not math.isfinite(dfx):
+            steps.append("  ERROR CRÍTICO: La derivada no es finita (pendiente vertical).")
+            steps.append("  El paso de Newton no avanza. El método falla.")
+            return StepResult(steps=steps, error="zero_derivative", details={"iterations": i})
+        if abs(dfx) < 1e-15 or step.x_next is None:
             steps.append("  ERROR CRÍTICO: La derivada es 0 (o muy cercana).")
             steps.append("  No se puede dividir. El método falla (pendiente horizontal).")
-            return StepResult(steps=steps, error="zero_derivative")
+            return StepResult(steps=steps, error="zero_derivative", details={"iterations": i})
 
-        
-        x_next = x_curr - (fx / dfx)
+        x_next = step.x_next
         error = abs(x_next - x_curr)
         
-        steps.append(f"  x_sig    = {x_curr:.6f} - ({fx:.6f} / {dfx:.6f})")
-        steps.append(f"           = {x_next:.8f}")
-        steps.append(f"  Error    = {error:.8f}")
+        if steps.detailed:
+            steps.append(f"  x_sig    = {x_curr:.6f} - ({fx:.6f} / {dfx:.6f})")
+            steps.append(f"           = {x_next:.8f}")
+            steps.append(f"  Error    = {error:.8f}")
 
         
         if error < tol or abs(fx) < tol:
@@ -290,66 +405,685 @@ def solve_newton_raphson(expr: str, x0: float, tol: float, max_iter: int) -> Ste
             steps.append("  ✓ Convergencia alcanzada")
             steps.append('════════════════════════════════════════════')
             steps.append(f"  RAÍZ APROXIMADA: {x_next:.10f}")
-            return StepResult(steps=steps, vector=[x_next])
+            return StepResult(steps=steps, vector=[x_next], details={"iterations": i})
 
         x_curr = x_next
-        steps.append("")
+        if steps.detailed:
+            steps.append("")
 
     steps.append("AVISO: Se alcanzó el número máximo de iteraciones sin converger completamente.")
-    return StepResult(steps=steps, vector=[x_curr])
+    return StepResult(steps=steps, vector=[x_curr], details={"iterations": max_iter})
 
 
-def solve_secant(expr: str, x0: float, x1: float, tol: float, max_iter: int) -> StepResult:
+def solve_secant(
+    expr: str, x0: float, x1: float, tol: float, max_iter: int, verbosity: Verbosity = "full"
+) -> StepResult:
     """
     Resuelve usando el método de la Secante (requiere dos puntos iniciales).
     """
-    steps: list[str] = []
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    steps = StepLog(verbosity=verbosity)
+    try:
+        steps.append('════════════════════════════════════════════')
+        steps.append('          MÉTODO DE LA SECANTE')
+        steps.append('════════════════════════════════════════════')
+        steps.append(f'Función f(x) = {expr}')
+        steps.append(f'Puntos iniciales: x0={x0}, x1={x1}')
+        steps.append('')
+        steps.append('Fórmula: x(i+1) = x(i) - [f(x(i))*(x(i)-x(i-1))] / [f(x(i))-f(x(i-1))]')
+        steps.append('----------------------------------------')
+
+        x_curr = x1
+        path = secant_steps(f, x0, x1)
+
+        for i in range(1, max_iter + 1):
+            step = next(path)
+            if steps.detailed:
+                steps.append(f"Iteración {i}:")
+                steps.append(f"  x(i-1) = {step.x0:.6f}, f(x(i-1)) = {step.f0:.6f}")
+                steps.append(f"  x(i)   = {step.x1:.6f}, f(x(i))   = {step.f1:.6f}")
+
+            if step.x2 is None or (step.f1 != 0.0 and abs(step.f1 - step.f0) < 1e-15):
+                steps.append("  ERROR: Denominador cero (f(x_i) ≈ f(x_i-1)).")
+                return StepResult(steps=steps, error="zero_denominator", details={"iterations": i})
+
+            x_next = step.x2
+            error = abs(x_next - x_curr)
+
+            if steps.detailed:
+                steps.append(f"  x(i+1) = {x_curr:.6f} - ...")
+                steps.append(f"  x(i+1) = {x_next:.8f}")
+                steps.append(f"  Error est. = {error:.8f}")
+
+            if error < tol or abs(step.f1) < tol:
+                steps.append("")
+                steps.append("  ✓ Convergencia alcanzada")
+                steps.append('════════════════════════════════════════════')
+                steps.append(f"  RAÍZ: {x_next:.8f}")
+                return StepResult(steps=steps, vector=[x_next], details={"iterations": i})
+
+            x_curr = x_next
+            if steps.detailed:
+                steps.append("")
+
+        steps.append("AVISO: No convergió en el máximo de iteraciones.")
+        return StepResult(steps=steps, vector=[x_curr], details={"iterations": max_iter})
+    except MATH_ERRORS as e:
+        return _math_error(steps, e)
+
+
+def solve_all_roots(
+    expr: str, a: float, b: float, samples: int, tol: float, max_iter: int, verbosity: Verbosity = "full"
+) -> StepResult:
+    """Busca todas las raíces de f en [a, b]: malla de signos + bisección en lote."""
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    if not a < b:
+        return StepResult(steps=["Error: se requiere a < b"], error="invalid_interval")
+    if not 2 <= samples <= MAX_SCAN_SAMPLES:
+        return StepResult(steps=[f"Error: samples debe estar entre 2 y {MAX_SCAN_SAMPLES}"], error="invalid_samples")
+
+    steps = StepLog(verbosity=verbosity)
+    steps.append('════════════════════════════════════════════')
+    steps.append('     BÚSQUEDA DE TODAS LAS RAÍCES EN [a, b]')
+    steps.append('════════════════════════════════════════════')
+    steps.append(f'Función: f(x) = {expr}')
+    steps.append(f'Intervalo: [{a}, {b}], malla de {samples} puntos (h = {(b - a) / (samples - 1):.6g})')
+    steps.append('')
+
+    roots, discontinuities = find_all_roots(f, a, b, samples, tol, max_iter)
+    sign_changes = sum(r.kind == "sign_change" for r in roots) + discontinuities
+    steps.append(f'Cambios de signo en la malla: {sign_changes} (refinados por bisección en lote)')
+    if discontinuities:
+        steps.append(f'  {discontinuities} descartado(s): |f| crece al refinar (discontinuidad, no raíz)')
+    steps.append('----------------------------------------')
+    labels = {"sign_change": "cambio de signo", "grid_zero": "f = 0 en la malla", "touch": "mínimo de |f| (raíz par)"}
+    for k, r in enumerate(roots[:MAX_LISTED_ROOTS] if steps.detailed else (), start=1):
+        steps.append(
+            f"  x{k} = {r.x:.10f}  f(x) = {r.fx:.3e}  [{labels[r.kind]}, {r.iterations} iteraciones]"
+        )
+    if steps.detailed and len(roots) > MAX_LISTED_ROOTS:
+        steps.append(f"  … y {len(roots) - MAX_LISTED_ROOTS} raíces más")
+    steps.append('════════════════════════════════════════════')
+    steps.append(f'  RAÍCES ENCONTRADAS: {len(roots)}')
+    return StepResult(
+        steps=steps,
+        vector=[r.x for r in roots],
+        details={
+            "roots": [
+                {"x": r.x, "fx": r.fx, "iterations": r.iterations, "kind": r.kind, "bracket": list(r.bracket)}
+                for r in roots
+            ]
+        },
+    )
+
+
+def _format_complex(z: complex) -> str:
+    return f"{z.real:.10f} {'+' if z.imag >= 0 else '-'} {abs(z.imag):.10f}i"
+
+
+def solve_polynomial_roots(expr: str, verbosity: Verbosity = "full") -> StepResult:
+    """Todas las raíces de un polinomio (reales y complejas) sin intervalos ni semillas:
+    autovalores de la matriz compañera por iteración QR."""
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    coefficients = f.coefficients
+    if f.degree_too_large:
+        return StepResult(
+            steps=[f"Error: f(x) = {expr} es un polinomio de grado mayor que {MAX_POLYNOMIAL_DEGREE}"],
+            error="degree_too_large",
+        )
+    if coefficients is None:
+        return StepResult(steps=[f"Error: f(x) = {expr} no es un polinomio en x"], error="not_polynomial")
+    degree = len(coefficients) - 1
+    if degree < 1:
+        return StepResult(steps=["Error: el polinomio es constante (grado 0)"], error="constant_polynomial")
+
+    steps = StepLog(verbosity=verbosity)
     steps.append('════════════════════════════════════════════')
-    steps.append('          MÉTODO DE LA SECANTE')
+    steps.append('   RAÍCES DE POLINOMIO (MATRIZ COMPAÑERA + QR)')
     steps.append('════════════════════════════════════════════')
-    steps.append(f'Función f(x) = {expr}')
-    steps.append(f'Puntos iniciales: x0={x0}, x1={x1}')
+    steps.append(f'Función: f(x) = {expr}')
+    steps.append(f'Polinomio detectado de grado {degree}')
+    if steps.detailed:
+        steps.append('Coeficientes (grado n → 0): [' + ", ".join(f"{c:g}" for c in reversed(coefficients)) + ']')
+        horner_text = f"{coefficients[-1]:g}"
+        for c in reversed(coefficients[:-1]):
+            horner_text = f"({horner_text})·x {'-' if c < 0 else '+'} {abs(c):g}" if c else f"({horner_text})·x"
+        steps.append(f'Forma de Horner: p(x) = {horner_text}')
     steps.append('')
-    steps.append('Fórmula: x(i+1) = x(i) - [f(x(i))*(x(i)-x(i-1))] / [f(x(i))-f(x(i-1))]')
+
+    try:
+        result = polynomial_roots(coefficients)
+    except QRConvergenceError:
+        steps.append('ERROR: la iteración QR no convergió.')
+        return StepResult(steps=steps, error="no_convergence")
+
+    if steps.detailed and degree <= MAX_TRACED_COMPANION:
+        steps.append('Matriz compañera C (det(xI - C) = p(x) / cₙ):')
+        steps.extend("  " + line for line in format_matrix(result.companion).splitlines())
+    else:
+        steps.append(f'Matriz compañera C de {degree}×{degree} (Hessenberg superior)')
+    steps.append(f'Equilibrado + QR de Francis con doble desplazamiento: {result.qr_iterations} iteraciones')
+    steps.append('Cada raíz se pule con Newton sobre p (Horner complejo).')
     steps.append('----------------------------------------')
+    for k, z in enumerate(result.roots if steps.enabled else (), start=1):
+        residual = abs(horner(coefficients, z))
+        text = f"{z.real:.10f}" if z.imag == 0.0 else _format_complex(z)
+        steps.append(f"  x{k} = {text}  |p(x{k})| = {residual:.3e}")
+    real, complex_roots = result.real, result.complex
+    steps.append('════════════════════════════════════════════')
+    steps.append(f'  RAÍCES REALES: {len(real)}, COMPLEJAS: {len(complex_roots)}')
+    return StepResult(
+        steps=steps,
+        vector=real,
+        details={
+            "coefficients": list(coefficients),
+            "complex_roots": [[z.real, z.imag] for z in complex_roots],
+            "qr_iterations": result.qr_iterations,
+        },
+    )
 
-    x_prev = x0
-    x_curr = x1
 
-    fx_prev = _eval_function(expr, x_prev)
-    
-    for i in range(1, max_iter + 1):
-        fx_curr = _eval_function(expr, x_curr)
-        
-        steps.append(f"Iteración {i}:")
-        steps.append(f"  x(i-1) = {x_prev:.6f}, f(x(i-1)) = {fx_prev:.6f}")
-        steps.append(f"  x(i)   = {x_curr:.6f}, f(x(i))   = {fx_curr:.6f}")
+def solve_bracket_sweep(
+    expr: str,
+    intervals: List[List[float]],
+    method: str,
+    tol: float,
+    max_iter: int,
+    verbosity: Verbosity = "full",
+) -> StepResult:
+    """Bisección o Illinois sobre muchos intervalos [a, b] de la misma función a la vez.
 
-        denom = fx_curr - fx_prev
-        if abs(denom) < 1e-15:
-            steps.append("  ERROR: Denominador cero (f(x_i) ≈ f(x_i-1)).")
-            return StepResult(steps=steps, error="zero_denominator")
+    f(a) y f(b) se evalúan en dos lotes; los intervalos sin cambio de signo se
+    descartan y el resto avanza en paralelo hasta converger (ver rootBracketing).
+    """
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    if len(intervals) > MAX_SWEEP_BRACKETS:
+        return StepResult(steps=[f"Error: máximo {MAX_SWEEP_BRACKETS} intervalos"], error="too_many_intervals")
+    if any(len(iv) != 2 for iv in intervals):
+        return StepResult(steps=["Error: cada intervalo debe ser [a, b]"], error="invalid_interval")
 
-       
-        x_next = x_curr - (fx_curr * (x_curr - x_prev)) / denom
-        error = abs(x_next - x_curr)
+    fa = safe_evaluate_many(f, [iv[0] for iv in intervals])
+    fb = safe_evaluate_many(f, [iv[1] for iv in intervals])
+    roots: List[Optional[float]] = [None] * len(intervals)
+    iterations = [0] * len(intervals)
+    errors: List[Optional[str]] = [None] * len(intervals)
+    valid = []
+    for i, ((a, b), fai, fbi) in enumerate(zip(intervals, fa, fb)):
+        if fai != fai or fbi != fbi:
+            errors[i] = "math_error"
+        elif fai == 0.0 or fbi == 0.0:
+            roots[i] = a if fai == 0.0 else b
+        elif (fai < 0.0) == (fbi < 0.0):
+            errors[i] = "same_sign"
+        else:
+            valid.append(i)
 
-        steps.append(f"  x(i+1) = {x_curr:.6f} - ...")
-        steps.append(f"  x(i+1) = {x_next:.8f}")
-        steps.append(f"  Error est. = {error:.8f}")
+    kernel = illinois_many if method == "illinois" else bisect_many
+    refined = kernel(f, [((intervals[i][0], intervals[i][1]), (fa[i], fb[i])) for i in valid], tol, max_iter)
+    for i, (x, n) in zip(valid, refined):
+        roots[i], iterations[i] = x, n
 
-        if error < tol or abs(fx_curr) < tol:
-            steps.append("")
-            steps.append("  ✓ Convergencia alcanzada")
-            steps.append('════════════════════════════════════════════')
-            steps.append(f"  RAÍZ: {x_next:.8f}")
-            return StepResult(steps=steps, vector=[x_next])
+    name = "ILLINOIS (REGLA FALSA MODIFICADA)" if method == "illinois" else "BISECCIÓN"
+    steps = StepLog(verbosity=verbosity)
+    steps.append('════════════════════════════════════════════')
+    steps.append(f'   {name} EN LOTE')
+    steps.append('════════════════════════════════════════════')
+    steps.append(f'Función: f(x) = {expr}')
+    steps.append(f'Intervalos: {len(intervals)} ({len(valid)} con cambio de signo)')
+    if valid:
+        steps.append(f'Iteraciones: máx. {max(iterations[i] for i in valid)}, '
+                     f'promedio {sum(iterations[i] for i in valid) / len(valid):.2f}')
+    steps.append('----------------------------------------')
+    for i in range(min(len(intervals), MAX_LISTED_ROOTS) if steps.detailed else 0):
+        a, b = intervals[i]
+        if errors[i]:
+            steps.append(f"  [{a}, {b}]: {errors[i]}")
+        else:
+            steps.append(f"  [{a}, {b}]: x = {roots[i]:.10f} ({iterations[i]} iteraciones)")
+    if steps.detailed and len(intervals) > MAX_LISTED_ROOTS:
+        steps.append(f"  … y {len(intervals) - MAX_LISTED_ROOTS} intervalos más")
+    return StepResult(
+        steps=steps,
+        details={"values": roots, "iterations": iterations, "errors": errors},
+    )
+
+
+def solve_brent(
+    expr: str, a: float, b: float, tol: float, max_iter: int, verbosity: Verbosity = "full"
+) -> StepResult:
+    """Método de Brent: interpolación cuadrática inversa / secante con respaldo de bisección.
+
+    Conserva siempre un intervalo con cambio de signo (converge como bisección en el
+    peor caso) y una sola evaluación de f por iteración.
+    """
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    steps = StepLog(verbosity=verbosity)
+    try:
+
+        fa = f(a)
+        fb = f(b)
+
+        steps.append('════════════════════════════════════════════')
+        steps.append('            MÉTODO DE BRENT')
+        steps.append('════════════════════════════════════════════')
+        steps.append(f'Función: f(x) = {expr}')
+        steps.append(f'Intervalo inicial: [{a}, {b}]')
+        steps.append(f'f({a}) = {fa:.6f}')
+        steps.append(f'f({b}) = {fb:.6f}')
+        steps.append('')
+
+        if fa * fb > 0:
+            steps.append('ERROR: f(a) y f(b) tienen el mismo signo.')
+            return StepResult(steps=steps, error="same_sign")
+        steps.append('Chequeo de signo: f(a) * f(b) < 0 -> OK')
+        steps.append('----------------------------------------')
+
+        # b: mejor aproximación, a: iterado anterior, c: contrapunto (f(b)·f(c) < 0)
+        c, fc = a, fa
+        d = e = b - a
+        for k in range(1, max_iter + 1):
+            if (fb > 0) == (fc > 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+            tol1 = 2.0 * 2.220446049250313e-16 * abs(b) + 0.5 * tol
+            m = 0.5 * (c - b)
+
+            if steps.detailed:
+                steps.append(f"Iteración {k}:")
+                steps.append(f"  b={b:.8f}, c={c:.8f}, f(b)={fb:.8f}")
+
+            if abs(m) <= tol1 or fb == 0.0 or abs(fb) < tol:
+                steps.append("")
+                steps.append("  ✓ Condición de parada alcanzada (tolerancia)")
+                steps.append('════════════════════════════════════════════')
+                steps.append(f"  RAÍZ APROX: {b:.8f}")
+                return StepResult(steps=steps, vector=[b], details={"iterations": k})
+
+            if abs(e) >= tol1 and abs(fa) > abs(fb):
+                s_ = fb / fa
+                if a == c:
+                    p = 2.0 * m * s_
+                    q = 1.0 - s_
+                    kind = "secante"
+                else:
+                    q_ = fa / fc
+                    r = fb / fc
+                    p = s_ * (2.0 * m * q_ * (q_ - r) - (b - a) * (r - 1.0))
+                    q = (q_ - 1.0) * (r - 1.0) * (s_ - 1.0)
+                    kind = "interpolación cuadrática inversa"
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2.0 * p < min(3.0 * m * q - abs(tol1 * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+                    kind = "bisección (interpolación rechazada)"
+            else:
+                d = e = m
+                kind = "bisección"
+
+            a, fa = b, fb
+            b += d if abs(d) > tol1 else (tol1 if m > 0 else -tol1)
+            fb = f(b)
+            if steps.detailed:
+                steps.append(f"  Paso: {kind}")
+                steps.append(f"  Nuevo b = {b:.8f}, f(b) = {fb:.8f}")
+                steps.append("")
+
+        steps.append("AVISO: Máximo de iteraciones alcanzado.")
+        return StepResult(steps=steps, vector=[b], details={"iterations": max_iter})
+    except MATH_ERRORS as e:
+        return _math_error(steps, e)
+
+
+def solve_newton_bisection(
+    expr: str, a: float, b: float, tol: float, max_iter: int, verbosity: Verbosity = "full"
+) -> StepResult:
+    """Newton salvaguardado: paso de Newton (f′ por AD) si cae dentro del intervalo con
+    cambio de signo y reduce el paso lo suficiente; si no, bisección.
+    """
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    steps = StepLog(verbosity=verbosity)
+    try:
+
+        fa = f(a)
+        fb = f(b)
+
+        steps.append('════════════════════════════════════════════')
+        steps.append('   MÉTODO HÍBRIDO NEWTON-BISECCIÓN')
+        steps.append('════════════════════════════════════════════')
+        steps.append(f'Función: f(x) = {expr}')
+        steps.append(f'Intervalo inicial: [{a}, {b}]')
+        steps.append(f'f({a}) = {fa:.6f}')
+        steps.append(f'f({b}) = {fb:.6f}')
+        steps.append('')
+
+        if fa * fb > 0:
+            steps.append('ERROR: f(a) y f(b) tienen el mismo signo.')
+            return StepResult(steps=steps, error="same_sign")
+        if fa == 0.0 or fb == 0.0:
+            root = a if fa == 0.0 else b
+            steps.append(f"  RAÍZ EXACTA EN UN EXTREMO: {root:.8f}")
+            return StepResult(steps=steps, vector=[root], details={"iterations": 0})
+        steps.append('Chequeo de signo: f(a) * f(b) < 0 -> OK')
+        steps.append('----------------------------------------')
+
+        # lo: extremo con f < 0, hi: extremo con f > 0
+        lo, hi = (a, b) if fa < 0 else (b, a)
+        x = 0.5 * (a + b)
+        dx_old = dx = abs(b - a)
+        for k in range(1, max_iter + 1):
+            try:
+                fx, dfx = f.value_and_derivative(x)
+            except (ArithmeticError, ValueError) as e:
+                steps.append(f"Error matemático al evaluar (dominio inválido): {e}")
+                return StepResult(steps=steps, error="math_error", details={"iterations": k - 1})
+            if fx < 0:
+                lo = x
+            else:
+                hi = x
+
+            if steps.detailed:
+                steps.append(f"Iteración {k}:")
+                steps.append(f"  x = {x:.8f}, f(x) = {fx:.8f}, f'(x) = {dfx:.8f}")
+                steps.append(f"  Intervalo: [{min(lo, hi):.8f}, {max(lo, hi):.8f}]")
+
+            if fx == 0.0 or abs(fx) < tol:
+                break
+
+            newton_ok = dfx != 0.0 and math.isfinite(dfx) and ((x - hi) * dfx - fx) * ((x - lo) * dfx - fx) < 0.0 \
+                and abs(2.0 * fx) <= abs(dx_old * dfx)
+            dx_old = dx
+            if newton_ok:
+                dx = fx / dfx
+                x -= dx
+                if steps.detailed:
+                    steps.append(f"  Paso de Newton: x = {x:.8f}")
+            else:
+                dx = 0.5 * (hi - lo)
+                x = lo + dx
+                if steps.detailed:
+                    steps.append(f"  Paso de bisección: x = {x:.8f}")
+            if steps.detailed:
+                steps.append(f"  Error est. = {abs(dx):.8f}")
+                steps.append("")
+            if abs(dx) < tol:
+                break
+        else:
+            steps.append("AVISO: Máximo de iteraciones alcanzado.")
+            return StepResult(steps=steps, vector=[x], details={"iterations": max_iter})
 
-        
-        x_prev = x_curr
-        fx_prev = fx_curr
-        x_curr = x_next
         steps.append("")
+        steps.append("  ✓ Convergencia alcanzada")
+        steps.append('════════════════════════════════════════════')
+        steps.append(f"  RAÍZ APROX: {x:.8f}")
+        return StepResult(steps=steps, vector=[x], details={"iterations": k})
+    except MATH_ERRORS as e:
+        return _math_error(steps, e)
+
+
+ACCELERATED_METHODS = {
+    # la bisección no se acelera: su error no decrece en razón constante
+    "aitken": ("false_position", "secant", "newton_raphson"),
+    "steffensen": ("newton_raphson",),
+    "illinois": ("false_position",),
+    "pegasus": ("false_position",),
+}
+ACCELERATION_TITLES = {
+    "aitken": "Δ² DE AITKEN",
+    "steffensen": "STEFFENSEN",
+    "illinois": "ILLINOIS",
+    "pegasus": "PEGASUS",
+}
+
+
+class _TrackedSequence:
+    """Sucesión (xₖ, x̂ₖ) con su criterio de parada |estₖ − estₖ₋₁| < tol, est = x̂ si existe."""
+
+    __slots__ = ("pairs", "f", "raw", "acc", "estimate", "diff", "iterations", "done", "error")
+
+    def __init__(self, pairs, f: CountingFunction, start: float):
+        self.pairs = pairs
+        self.f = f
+        self.raw = self.estimate = start
+        self.acc: Optional[float] = None
+        self.diff = math.inf
+        self.iterations = 0
+        self.done = False
+        self.error: Optional[str] = None
+
+    def advance(self, tol: float) -> None:
+        try:
+            raw, acc = next(self.pairs)
+        except StopIteration:  # raíz exacta
+            self.done = True
+            return
+        except ZeroDivisionError:
+            self.done, self.error = True, "zero_denominator"
+            return
+        self.iterations += 1
+        estimate = raw if acc is None else acc
+        self.raw, self.acc = raw, acc
+        self.diff = abs(estimate - self.estimate)
+        self.estimate = estimate
+        if self.diff < tol:
+            self.done = True
+
+
+def solve_accelerated(
+    expr: str,
+    method: str,
+    acceleration: Acceleration,
+    a: Optional[float] = None,
+    b: Optional[float] = None,
+    x0: Optional[float] = None,
+    x1: Optional[float] = None,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+    verbosity: Verbosity = "full",
+) -> StepResult:
+    """Ejecuta un método de raíces con aceleración y, en paralelo, su versión sin acelerar.
 
-    steps.append("AVISO: No convergió en el máximo de iteraciones.")
-    return StepResult(steps=steps, vector=[x_curr])
\ No newline at end of file
+    aitken: Δ² sobre los iterados del método (sin evaluaciones extra de f).
+    steffensen: Aitken con reinicio sobre la iteración de Newton.
+    illinois / pegasus: regla falsa modificada frente a la regla falsa clásica.
+    Ambas sucesiones paran cuando |estₖ − estₖ₋₁| < tol; se informan iteraciones y
+    evaluaciones de f de cada una.
+    """
+    if method not in ACCELERATED_METHODS.get(acceleration, ()):
+        return StepResult(
+            steps=[f"Error: la aceleración '{acceleration}' no se aplica al método '{method}'"],
+            error="unsupported_acceleration",
+        )
+    bracketed = method == "false_position"
+    needed = {"false_position": (a, b), "secant": (x0, x1), "newton_raphson": (x0,)}[method]
+    if any(v is None for v in needed):
+        return StepResult(steps=["Error: faltan parámetros del método"], error="missing_parameters")
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+
+    fast, slow = CountingFunction(f), CountingFunction(f)
+    try:
+        if bracketed:
+            fa, fb = f(a), f(b)
+            if fa * fb > 0:
+                return StepResult(steps=["ERROR: f(a) y f(b) tienen el mismo signo."], error="same_sign")
+            if fa == 0.0 or fb == 0.0:
+                root = a if fa == 0.0 else b
+                return StepResult(steps=[f"RAÍZ EXACTA EN UN EXTREMO: {root:.8f}"], vector=[root])
+
+        def raw_iterates(g: CountingFunction, variant: str = "plain"):
+            if method == "false_position":
+                return false_position_iterates(g, a, b, fa, fb, variant)  # type: ignore[arg-type]
+            if method == "secant":
+                return secant_iterates(g, x0, x1)
+            return fixed_point_iterates(newton_step(g), x0)
+
+        if acceleration == "aitken":
+            pairs = aitken_accelerate(raw_iterates(fast))
+        elif acceleration == "steffensen":
+            pairs = steffensen(newton_step(fast), x0)
+        else:
+            pairs = ((x, None) for x in raw_iterates(fast, acceleration))
+        start = a if bracketed else (x1 if method == "secant" else x0)
+        accelerated = _TrackedSequence(pairs, fast, start)
+        baseline = _TrackedSequence(((x, None) for x in raw_iterates(slow)), slow, start)
+
+        steps = StepLog(verbosity=verbosity)
+        steps.append('════════════════════════════════════════════')
+        steps.append(f'   ACELERACIÓN DE CONVERGENCIA: {ACCELERATION_TITLES[acceleration]}')
+        steps.append('════════════════════════════════════════════')
+        steps.append(f'Función: f(x) = {expr}')
+        steps.append(f'Método base: {method}')
+        steps.append(f'Parámetros: ' + ", ".join(
+            f"{k}={v}" for k, v in (("a", a), ("b", b), ("x0", x0), ("x1", x1)) if v is not None
+        ))
+        if acceleration in ("aitken", "steffensen"):
+            steps.append('Fórmula: x̂ = x(i+2) - (x(i+2) - x(i+1))² / (x(i+2) - 2·x(i+1) + x(i))')
+        else:
+            steps.append('Extremo retenido: f(a) ← ' + (
+                'f(a) / 2' if acceleration == "illinois" else 'f(a) · f(b) / (f(b) + f(c))'
+            ))
+        steps.append('----------------------------------------')
+
+        for k in range(1, max_iter + 1):
+            if accelerated.done and baseline.done:
+                break
+            detailed = steps.detailed
+            if detailed:
+                steps.append(f"Iteración {k}:")
+            for label, seq in (("sin acelerar", baseline), ("acelerado   ", accelerated)):
+                if seq.done:
+                    if detailed:
+                        steps.append(f"  {label}: (terminó en la iteración {seq.iterations})")
+                    continue
+                seq.advance(tol)
+                if not detailed:
+                    continue
+                if seq.error:
+                    steps.append(f"  {label}: ERROR: denominador cero")
+                    continue
+                acc_text = f", x̂ = {seq.acc:.10f}" if seq.acc is not None else ""
+                steps.append(f"  {label}: x = {seq.raw:.10f}{acc_text}, Error = {seq.diff:.3e}")
+            if detailed:
+                steps.append("")
+    except (ArithmeticError, ValueError) as e:
+        return StepResult(steps=[f"Error matemático al evaluar (dominio inválido): {e}"], error="math_error")
+
+    if accelerated.error:
+        if method == "newton_raphson":
+            steps.append("ERROR CRÍTICO: La derivada es 0 en la sucesión acelerada.")
+            return StepResult(steps=steps, error="zero_derivative")
+        steps.append("ERROR: la sucesión acelerada encontró un denominador cero.")
+        return StepResult(steps=steps, error=accelerated.error)
+    steps.append('════════════════════════════════════════════')
+    steps.append(f"{'':<14}{'Raíz':>20}{'Iter.':>8}{'Eval. f':>9}")
+    for label, seq in (("Sin acelerar", baseline), ("Acelerado", accelerated)):
+        root_text = f"{seq.estimate:.12f}" if not seq.error else "—"
+        steps.append(f"{label:<14}{root_text:>20}{seq.iterations:>8}{seq.f.count:>9}")
+    if not accelerated.done:
+        steps.append("AVISO: Máximo de iteraciones alcanzado.")
+    else:
+        steps.append("  ✓ Convergencia alcanzada")
+    steps.append(f"  RAÍZ APROX: {accelerated.estimate:.10f}")
+    return StepResult(
+        steps=steps,
+        vector=[accelerated.estimate],
+        details={
+            "iterations": accelerated.iterations,
+            "evaluations": fast.count,
+            "raw_iterations": baseline.iterations,
+            "raw_evaluations": slow.count,
+        },
+    )
+
+
+def compare_root_methods(
+    expr: str,
+    a: float,
+    b: float,
+    tol: float,
+    max_iter: int,
+    x0: Optional[float] = None,
+    verbosity: Verbosity = "full",
+) -> StepResult:
+    """Ejecuta los seis métodos sobre la misma función y compara iteraciones y evaluaciones de f.
+
+    Los métodos de intervalo usan [a, b]; Newton parte de x0 (por defecto el punto
+    medio) y la secante de x0 = a, x1 = b. Los métodos corren sin pasos: de cada uno
+    solo se usa el resultado y details["iterations"].
+    """
+    f, err = _compile_or_error(expr)
+    if err:
+        return err
+    x0 = 0.5 * (a + b) if x0 is None else x0
+    runs = [
+        ("bisection", "Bisección", lambda: solve_bisection(expr, a, b, tol, max_iter, "none")),
+        ("false_position", "Regla falsa", lambda: solve_false_position(expr, a, b, tol, max_iter, "none")),
+        ("newton_raphson", "Newton-Raphson", lambda: solve_newton_raphson(expr, x0, tol, max_iter, False, "none")),
+        ("secant", "Secante", lambda: solve_secant(expr, a, b, tol, max_iter, "none")),
+        ("brent", "Brent", lambda: solve_brent(expr, a, b, tol, max_iter, "none")),
+        ("newton_bisection", "Newton-bisección", lambda: solve_newton_bisection(expr, a, b, tol, max_iter, "none")),
+    ]
+
+    steps = StepLog(verbosity=verbosity)
+    steps.append('════════════════════════════════════════════')
+    steps.append('     COMPARACIÓN DE MÉTODOS DE RAÍCES')
+    steps.append('════════════════════════════════════════════')
+    steps.append(f'Función: f(x) = {expr}, intervalo [{a}, {b}], x0 = {x0}, tol = {tol}')
+    steps.append('')
+    steps.append(f"{'Método':<18}{'Raíz':>18}{'|f(raíz)|':>11}{'Iter.':>7}{'Eval. f':>9}{'Tiempo':>12}")
+    results = []
+    for key, name, run in runs:
+        start = time.perf_counter()
+        with metered() as meter:
+            try:
+                res = run()
+            except (ArithmeticError, ValueError) as e:
+                res = StepResult(steps=[str(e)], error="math_error")
+        elapsed = time.perf_counter() - start
+        root = res.vector[0] if res.vector else None
+        iterations = (res.details or {}).get("iterations", 0)
+        try:
+            residual = abs(f(root)) if root is not None else None
+        except (ArithmeticError, ValueError):
+            residual = None
+        results.append({
+            "method": key,
+            "root": root,
+            "residual": residual,
+            "iterations": iterations,
+            "evaluations": meter.count,
+            "time_ms": elapsed * 1e3,
+            "error": res.error,
+        })
+        if steps.enabled:
+            root_text = f"{root:.10f}" if root is not None else (res.error or "—")
+            residual_text = f"{residual:.1e}" if residual is not None else "—"
+            steps.append(
+                f"{name:<18}{root_text:>18}{residual_text:>11}{iterations:>7}{meter.count:>9}{elapsed * 1e3:>10.3f}ms"
+            )
+    # solo cuentan los métodos que terminaron en una raíz real (|f| ≤ √tol)
+    ok = [r for r in results if r["error"] is None and r["residual"] is not None and r["residual"] <= math.sqrt(tol)]
+    if ok:
+        best = min(ok, key=lambda r: r["evaluations"])
+        steps.append('')
+        steps.append(f"Menos evaluaciones de f: {best['method']} ({best['evaluations']})")
+    return StepResult(steps=steps, details={"methods": results})
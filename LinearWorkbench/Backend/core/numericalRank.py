@@ -0,0 +1,154 @@
+import math
+from dataclasses import dataclass
+from operator import mul
+from typing import List, Optional, Tuple
+from .common import Matrix, Vector
+
+MACHINE_EPS = 2.220446049250313e-16
+
+
+@dataclass
+class RankAnalysis:
+    rank: int
+    tolerance: float
+    independent: List[int]  # índices (0-based) de un subconjunto independiente maximal
+    dependent: List[int]
+    # coefficients[i]: combinación de los independientes que reproduce dependent[i]
+    coefficients: List[List[float]]
+
+
+def _dot(a: List[float], b: List[float]) -> float:
+    return sum(map(mul, a, b))
+
+
+def _pivoted_householder(columns: List[Vector], tol: Optional[float]):
+    """Núcleo del QR con pivoteo: factoriza una copia de las columnas in situ.
+
+    Devuelve (a, perm, rank, tol, reflectors), con R guardada por columnas en `a`
+    (a[c][i] == R[i][c]) y Q implícita como lista de reflectores (j, v, beta).
+    """
+    k = len(columns)
+    n = len(columns[0]) if columns else 0
+    a = [list(map(float, c)) for c in columns]  # copia, almacenamiento por columnas
+    perm = list(range(k))
+    norms = [_dot(c, c) for c in a]
+    ref_norms = norms[:]
+    steps = min(n, k)
+    r00 = 0.0
+    rank = 0
+    reflectors: List[Tuple[int, List[float], float]] = []
+
+    for j in range(steps):
+        p = max(range(j, k), key=lambda c: norms[c])
+        if p != j:
+            a[j], a[p] = a[p], a[j]
+            norms[j], norms[p] = norms[p], norms[j]
+            ref_norms[j], ref_norms[p] = ref_norms[p], ref_norms[j]
+            perm[j], perm[p] = perm[p], perm[j]
+
+        x = a[j][j:]
+        alpha = math.sqrt(_dot(x, x))
+        if j == 0:
+            r00 = alpha
+            if tol is None:
+                tol = max(n, k) * MACHINE_EPS * r00
+        if alpha <= tol:
+            break
+        if x[0] > 0:
+            alpha = -alpha
+        v = x[:]
+        v[0] -= alpha
+        vv = _dot(v, v)
+        a[j][j:] = [alpha] + [0.0] * (n - j - 1)
+        rank += 1
+        if vv == 0.0:
+            continue
+        beta = 2.0 / vv
+        reflectors.append((j, v, beta))
+        for c in range(j + 1, k):
+            col = a[c]
+            s = beta * _dot(v, col[j:])
+            col[j:] = [ci - s * vi for ci, vi in zip(col[j:], v)]
+            # actualización de normas residuales; se recalcula si hay cancelación
+            norms[c] -= col[j] * col[j]
+            if norms[c] < 1e-6 * ref_norms[c]:
+                norms[c] = _dot(col[j + 1:], col[j + 1:])
+                ref_norms[c] = norms[c]
+
+    return a, perm, rank, tol or 0.0, reflectors
+
+
+def _back_substitute(a: Matrix, rank: int, rhs: List[float]) -> List[float]:
+    """Resuelve R₁₁·c = rhs con R₁₁ guardada por columnas en a."""
+    coef = [0.0] * rank
+    for i in range(rank - 1, -1, -1):
+        s = rhs[i] - sum(a[t][i] * coef[t] for t in range(i + 1, rank))
+        coef[i] = s / a[i][i]
+    return coef
+
+
+def rank_revealing_qr(columns: List[Vector], tol: Optional[float] = None) -> RankAnalysis:
+    """QR de Householder con pivoteo de columnas (Businger–Golub) sobre vectores columna.
+
+    El rango es el número de |R[j][j]| mayores que la tolerancia relativa
+    max(n, k) · eps · |R[0][0]| (o `tol` si se indica). Los pivotes elegidos dan un
+    subconjunto independiente maximal y R₁₁·c = R₁₂ los coeficientes de dependencia.
+    """
+    a, perm, rank, tol, _ = _pivoted_householder(columns, tol)
+    coefficients = [_back_substitute(a, rank, a[c][:rank]) for c in range(rank, len(columns))]
+    return RankAnalysis(rank, tol, perm[:rank], perm[rank:], coefficients)
+
+
+@dataclass
+class SpanMembership:
+    member: bool
+    coefficients: List[float]  # uno por generador (0 en los generadores dependientes)
+    residual: float
+
+
+class SpanFactorization:
+    """Factoriza una sola vez los generadores de un span para consultar muchos vectores b.
+
+    Cada consulta aplica Qᵀ (reflectores guardados, O(n·r)) y sustitución regresiva
+    sobre R₁₁ (O(r²)), sin reconstruir ni re-eliminar la matriz aumentada.
+    """
+
+    def __init__(self, generators: List[Vector], rel_tol: float = 1e-10):
+        self.k = len(generators)
+        self.n = len(generators[0]) if generators else 0
+        self.rel_tol = rel_tol
+        self._r, self.perm, self.rank, self.tolerance, self._reflectors = _pivoted_householder(generators, None)
+
+    def solve(self, b: Vector) -> SpanMembership:
+        if len(b) != self.n:
+            raise ValueError("dimension_mismatch")
+        y = list(map(float, b))
+        b_norm = math.sqrt(_dot(y, y))
+        for j, v, beta in self._reflectors:
+            s = beta * _dot(v, y[j:])
+            y[j:] = [yi - s * vi for yi, vi in zip(y[j:], v)]
+        tail = y[self.rank:]
+        residual = math.sqrt(_dot(tail, tail))
+        z = _back_substitute(self._r, self.rank, y[:self.rank])
+        coefficients = [0.0] * self.k
+        for i, c in enumerate(z):
+            coefficients[self.perm[i]] = c
+        return SpanMembership(residual <= self.rel_tol * max(1.0, b_norm), coefficients, residual)
+
+    def solve_many(self, targets: List[Vector]) -> List[SpanMembership]:
+        return [self.solve(b) for b in targets]
+
+
+def format_dependency(analysis: RankAnalysis, index: int, decimals: int = 4) -> str:
+    """Texto 'v_d = c₁·v_i + c₂·v_j ...' para el i-ésimo vector dependiente."""
+    target = analysis.dependent[index]
+    expr = ""
+    for t, c in enumerate(analysis.coefficients[index]):
+        if abs(c) <= 10 ** (-decimals - 2):
+            continue
+        term = f"{abs(c):.{decimals}f}·v{analysis.independent[t] + 1}"
+        if not expr:
+            expr = term if c > 0 else f"-{term}"
+        else:
+            expr += f" {'+' if c > 0 else '-'} {term}"
+    return f"v{target + 1} = {expr or '0'}"
@@ -0,0 +1,126 @@
+import math
+from dataclasses import dataclass
+from typing import List, Literal, Optional
+from .common import StepLog, Vector
+from .numericalRank import _dot, rank_revealing_qr
+
+OrthonormalizationMethod = Literal["mgs", "householder"]
+
+
+@dataclass
+class OrthonormalBasis:
+    basis: List[Vector]  # q₁..q_r
+    indices: List[int]  # vector original (0-based) que origina cada qⱼ
+    method: OrthonormalizationMethod
+    orthogonality_loss: float  # ‖Q·Qᵀ − I‖_F
+
+
+def _axpy(alpha: float, x: Vector, y: Vector) -> Vector:
+    """y + alpha·x en una sola pasada."""
+    return [yi + alpha * xi for xi, yi in zip(x, y)]
+
+
+def _fmt(v: Vector) -> str:
+    return "[" + ", ".join(f"{x:.4f}" for x in v) + "]"
+
+
+def _orthogonality_loss(q: List[Vector]) -> float:
+    total = 0.0
+    for i, qi in enumerate(q):
+        d = _dot(qi, qi) - 1.0
+        total += d * d
+        for qj in q[i + 1:]:
+            total += 2.0 * _dot(qi, qj) ** 2
+    return math.sqrt(total)
+
+
+def modified_gram_schmidt(
+    vectors: List[Vector],
+    reorthogonalize: bool = True,
+    tol: float = 1e-10,
+    steps: Optional[StepLog] = None,
+) -> OrthonormalBasis:
+    """Gram-Schmidt modificado: wⱼ se ortogonaliza contra cada qᵢ ya actualizado.
+
+    Con reorthogonalize se repite la pasada ("twice is enough"), lo que mantiene
+    ‖QQᵀ − I‖ en el orden de eps incluso con vectores casi dependientes. Los
+    vectores con ‖wⱼ‖ ≤ tol·‖vⱼ‖ se descartan como dependientes.
+    """
+    n = len(vectors[0]) if vectors else 0
+    q: List[Vector] = []
+    indices: List[int] = []
+    for j, v in enumerate(vectors):
+        if len(q) == n:
+            if steps is not None:
+                steps.append(f"v{j + 1}: la base ya genera R^{n} → dependiente")
+            continue
+        w = list(map(float, v))
+        v_norm = math.sqrt(_dot(w, w))
+        coefficients = [0.0] * len(q)
+        for _ in range(2 if reorthogonalize else 1):
+            for i, qi in enumerate(q):
+                c = _dot(qi, w)
+                coefficients[i] += c
+                w = _axpy(-c, qi, w)
+        w_norm = math.sqrt(_dot(w, w))
+        if steps is not None:
+            terms = " − ".join(f"({c:.4f})q{i + 1}" for i, c in enumerate(coefficients))
+            steps.append(f"w = v{j + 1}" + (f" − {terms}" if terms else "") + f", ‖w‖ = {w_norm:.4f}")
+        if w_norm == 0.0 or w_norm <= tol * v_norm:
+            if steps is not None:
+                steps.append(f"  v{j + 1} es dependiente de los anteriores → se descarta")
+            continue
+        q.append([x / w_norm for x in w])
+        indices.append(j)
+        if steps is not None:
+            steps.append(f"  q{len(q)} = w / ‖w‖ = {_fmt(q[-1])}")
+    return OrthonormalBasis(q, indices, "mgs", _orthogonality_loss(q))
+
+
+def householder_orthonormalize(vectors: List[Vector], steps: Optional[StepLog] = None) -> OrthonormalBasis:
+    """Householder sobre el subconjunto independiente (en su orden original).
+
+    El QR con pivoteo elige las columnas independientes; sobre ellas (rango completo)
+    se aplican los reflectores Hⱼ = I − βⱼvⱼvⱼᵀ y Q se obtiene aplicándolos en orden
+    inverso a e₁..e_r. Los signos se ajustan para que diag(R) > 0, como en Gram-Schmidt.
+    """
+    analysis = rank_revealing_qr(vectors)
+    indices = sorted(analysis.independent)
+    n = len(vectors[0]) if vectors else 0
+    if steps is not None:
+        steps.append(
+            f"QR con pivoteo: rango = {analysis.rank}; columnas independientes: "
+            + (", ".join(f"v{i + 1}" for i in indices) or "—")
+        )
+    a = [list(map(float, vectors[i])) for i in indices]
+    reflectors = []
+    signs = []
+    for j in range(len(a)):
+        x = a[j][j:]
+        alpha = math.sqrt(_dot(x, x))
+        if x[0] > 0:
+            alpha = -alpha
+        signs.append(-1.0 if alpha < 0 else 1.0)
+        v = x[:]
+        v[0] -= alpha
+        vv = _dot(v, v)
+        beta = 2.0 / vv if vv else 0.0
+        reflectors.append((j, v, beta))
+        a[j][j:] = [alpha] + [0.0] * (n - j - 1)
+        for col in a[j + 1:]:
+            s = beta * _dot(v, col[j:])
+            col[j:] = [ci - s * vi for ci, vi in zip(col[j:], v)]
+        if steps is not None:
+            steps.append(f"H{j + 1}: r{j + 1}{j + 1} = {abs(alpha):.4f}")
+
+    q: List[Vector] = []
+    for t in range(len(a)):
+        e = [0.0] * n
+        e[t] = signs[t]
+        for j, v, beta in reversed(reflectors):
+            s = beta * _dot(v, e[j:])
+            e[j:] = [ei - s * vi for ei, vi in zip(e[j:], v)]
+        q.append(e)
+        if steps is not None:
+            steps.append(f"  q{t + 1} = {_fmt(e)}")
+    return OrthonormalBasis(q, indices, "householder", _orthogonality_loss(q))
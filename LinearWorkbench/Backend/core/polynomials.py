@@ -0,0 +1,259 @@
+import math
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Union
+
+from .common import Matrix
+
+Number = Union[float, complex]
+
+EPS = 2.220446049250313e-16
+# iteraciones QR máximas por autovalor antes de darse por vencido
+MAX_QR_ITERATIONS = 60
+# una raíz se considera real si |Im z| ≤ REAL_TOL · (1 + |z|); del orden de √ε porque una
+# raíz doble real se perturba en un par conjugado con parte imaginaria ~√ε
+REAL_TOL = 1e-7
+POLISH_STEPS = 3
+
+
+class QRConvergenceError(ArithmeticError):
+    """La iteración QR no separó un autovalor en MAX_QR_ITERATIONS iteraciones."""
+
+
+@dataclass
+class PolynomialRoots:
+    roots: List[complex]
+    qr_iterations: int
+    companion: Matrix
+
+    @property
+    def real(self) -> List[float]:
+        return sorted(z.real for z in self.roots if abs(z.imag) <= REAL_TOL * (1.0 + abs(z)))
+
+    @property
+    def complex(self) -> List[complex]:
+        return [z for z in self.roots if abs(z.imag) > REAL_TOL * (1.0 + abs(z))]
+
+
+def horner(coefficients: Sequence[float], x: Number) -> Number:
+    """p(x) con los coeficientes de grado 0 a n."""
+    acc: Number = 0.0
+    for c in reversed(coefficients):
+        acc = acc * x + c
+    return acc
+
+
+def horner_with_derivative(coefficients: Sequence[float], x: Number) -> Tuple[Number, Number]:
+    """(p(x), p′(x)) en una sola pasada de Horner."""
+    p: Number = 0.0
+    dp: Number = 0.0
+    for c in reversed(coefficients):
+        dp = dp * x + p
+        p = p * x + c
+    return p, dp
+
+
+def companion_matrix(coefficients: Sequence[float]) -> Matrix:
+    """Matriz compañera (Hessenberg superior) del polinomio mónico asociado; grado ≥ 1."""
+    n = len(coefficients) - 1
+    lead = coefficients[-1]
+    m = [[0.0] * n for _ in range(n)]
+    for k in range(n):
+        m[0][k] = -coefficients[n - 1 - k] / lead or 0.0
+    for i in range(1, n):
+        m[i][i - 1] = 1.0
+    return m
+
+
+def balance(a: Matrix) -> None:
+    """Equilibrado de Parlett-Reinsch (potencias de 2, sin error de redondeo), in situ.
+
+    Iguala las normas de filas y columnas con una semejanza diagonal: conserva la
+    forma de Hessenberg y los autovalores, y reduce su sensibilidad al redondeo.
+    """
+    n = len(a)
+    done = False
+    while not done:
+        done = True
+        for i in range(n):
+            c = sum(abs(a[j][i]) for j in range(n) if j != i)
+            r = sum(abs(a[i][j]) for j in range(n) if j != i)
+            if c == 0.0 or r == 0.0:
+                continue
+            g, f, s = r / 2.0, 1.0, c + r
+            while c < g:
+                f *= 2.0
+                c *= 4.0
+            g = r * 2.0
+            while c > g:
+                f /= 2.0
+                c /= 4.0
+            if (c + r) / f < 0.95 * s:
+                done = False
+                for j in range(n):
+                    a[i][j] /= f
+                for j in range(n):
+                    a[j][i] *= f
+
+
+def hessenberg_eigenvalues(h: Matrix) -> Tuple[List[complex], int]:
+    """Autovalores de una matriz de Hessenberg superior real (QR de Francis con doble desplazamiento).
+
+    Los pares complejos se obtienen en aritmética real a partir de los bloques 2×2 que
+    quedan al deflactar. Devuelve (autovalores, iteraciones QR). Modifica una copia.
+    """
+    n = len(h)
+    # índices desde 1, como en la formulación clásica del algoritmo
+    a = [[0.0] * (n + 1)] + [[0.0] + [float(v) for v in row] for row in h]
+    anorm = sum(abs(a[i][j]) for i in range(1, n + 1) for j in range(max(i - 1, 1), n + 1))
+    eig: List[complex] = [0j] * (n + 1)
+    total = 0
+    nn = n
+    t = 0.0
+    while nn >= 1:
+        its = 0
+        while True:
+            # busca un subdiagonal despreciable para deflactar
+            l = nn
+            while l >= 2:
+                s = abs(a[l - 1][l - 1]) + abs(a[l][l])
+                if s == 0.0:
+                    s = anorm
+                if abs(a[l][l - 1]) <= EPS * s:
+                    a[l][l - 1] = 0.0
+                    break
+                l -= 1
+            x = a[nn][nn]
+            if l == nn:  # un autovalor real
+                eig[nn] = complex(x + t, 0.0)
+                nn -= 1
+            else:
+                y = a[nn - 1][nn - 1]
+                w = a[nn][nn - 1] * a[nn - 1][nn]
+                if l == nn - 1:  # bloque 2×2: dos reales o un par conjugado
+                    p = 0.5 * (y - x)
+                    q = p * p + w
+                    z = math.sqrt(abs(q))
+                    x += t
+                    if q >= 0.0:
+                        z = p + math.copysign(z, p)
+                        eig[nn - 1] = eig[nn] = complex(x + z, 0.0)
+                        if z:
+                            eig[nn] = complex(x - w / z, 0.0)
+                    else:
+                        eig[nn - 1] = complex(x + p, -z)
+                        eig[nn] = complex(x + p, z)
+                    nn -= 2
+                else:
+                    if its == MAX_QR_ITERATIONS:
+                        raise QRConvergenceError("la iteración QR no converge")
+                    if its and its % 10 == 0:  # desplazamiento excepcional
+                        t += x
+                        for i in range(1, nn + 1):
+                            a[i][i] -= x
+                        s = abs(a[nn][nn - 1]) + abs(a[nn - 1][nn - 2])
+                        y = x = 0.75 * s
+                        w = -0.4375 * s * s
+                    its += 1
+                    total += 1
+                    # dos subdiagonales consecutivos pequeños: el barrido empieza en m
+                    m = nn - 2
+                    while m >= l:
+                        z = a[m][m]
+                        r = x - z
+                        s = y - z
+                        p = (r * s - w) / a[m + 1][m] + a[m][m + 1]
+                        q = a[m + 1][m + 1] - z - r - s
+                        r = a[m + 2][m + 1]
+                        s = abs(p) + abs(q) + abs(r)
+                        p, q, r = p / s, q / s, r / s
+                        if m == l:
+                            break
+                        u = abs(a[m][m - 1]) * (abs(q) + abs(r))
+                        v = abs(p) * (abs(a[m - 1][m - 1]) + abs(z) + abs(a[m + 1][m + 1]))
+                        if u <= EPS * v:
+                            break
+                        m -= 1
+                    for i in range(m + 2, nn + 1):
+                        a[i][i - 2] = 0.0
+                        if i != m + 2:
+                            a[i][i - 3] = 0.0
+                    # barrido de reflectores de Householder 3×3 (persecución del bulto)
+                    for k in range(m, nn):
+                        if k != m:
+                            p = a[k][k - 1]
+                            q = a[k + 1][k - 1]
+                            r = a[k + 2][k - 1] if k != nn - 1 else 0.0
+                            x = abs(p) + abs(q) + abs(r)
+                            if x != 0.0:
+                                p, q, r = p / x, q / x, r / x
+                        s = math.copysign(math.sqrt(p * p + q * q + r * r), p)
+                        if s == 0.0:
+                            continue
+                        if k == m:
+                            if l != m:
+                                a[k][k - 1] = -a[k][k - 1]
+                        else:
+                            a[k][k - 1] = -s * x
+                        p += s
+                        x, y, z = p / s, q / s, r / s
+                        q, r = q / p, r / p
+                        for j in range(k, nn + 1):
+                            p = a[k][j] + q * a[k + 1][j]
+                            if k != nn - 1:
+                                p += r * a[k + 2][j]
+                                a[k + 2][j] -= p * z
+                            a[k + 1][j] -= p * y
+                            a[k][j] -= p * x
+                        for i in range(l, min(nn, k + 3) + 1):
+                            p = x * a[i][k] + y * a[i][k + 1]
+                            if k != nn - 1:
+                                p += z * a[i][k + 2]
+                                a[i][k + 2] -= p * r
+                            a[i][k + 1] -= p * q
+                            a[i][k] -= p
+            if l >= nn - 1:
+                break
+    return eig[1:], total
+
+
+def _polish(coefficients: Sequence[float], z: complex) -> complex:
+    """Unos pocos pasos de Newton sobre p; solo se aceptan si reducen |p|."""
+    pz = abs(horner(coefficients, z))
+    for _ in range(POLISH_STEPS):
+        p, dp = horner_with_derivative(coefficients, z)
+        if dp == 0 or p == 0:
+            break
+        candidate = z - p / dp
+        pc = abs(horner(coefficients, candidate))
+        if not pc < pz:
+            break
+        z, pz = candidate, pc
+    return z
+
+
+def polynomial_roots(coefficients: Sequence[float]) -> PolynomialRoots:
+    """Todas las raíces (reales y complejas) de p como autovalores de su matriz compañera.
+
+    Las raíces nulas se factorizan antes (x^k), la compañera se equilibra y la QR de
+    Hessenberg cuesta O(n³); cada raíz se pule con Newton sobre p en aritmética compleja.
+    """
+    coefficients = list(coefficients)
+    while coefficients and coefficients[-1] == 0.0:
+        coefficients.pop()
+    if len(coefficients) < 2:
+        raise ValueError("el polinomio debe tener grado ≥ 1")
+    zeros = 0
+    while coefficients[zeros] == 0.0:
+        zeros += 1
+    reduced = coefficients[zeros:]
+    roots: List[complex] = [0j] * zeros
+    iterations = 0
+    companion = companion_matrix(coefficients)
+    if len(reduced) > 1:
+        h = companion_matrix(reduced)
+        balance(h)
+        eigenvalues, iterations = hessenberg_eigenvalues(h)
+        roots += [_polish(reduced, z) for z in eigenvalues]
+    roots = [complex(z.real, 0.0) if abs(z.imag) <= REAL_TOL * (1.0 + abs(z)) else z for z in roots]
+    roots.sort(key=lambda z: (abs(z.imag) > 0.0, z.real, z.imag))
+    return PolynomialRoots(roots, iterations, companion)
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import math
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .common import StepResult
+
+RESPONSE_CACHE_SIZE = int(os.environ.get("WORKBENCH_CACHE_SIZE", 1024))
+RESPONSE_CACHE_TTL = float(os.environ.get("WORKBENCH_CACHE_TTL", 3600))
+# segundo nivel en disco (SQLite); desactivado si la variable no está definida
+RESPONSE_CACHE_DIR = os.environ.get("WORKBENCH_CACHE_DIR")
+DISK_CACHE_SIZE = 100_000
+
+# versión del resultado de cada endpoint: subirla invalida sus entradas al cambiar el algoritmo
+ENDPOINT_VERSIONS: Dict[str, int] = {}
+# errores pasajeros que no se guardan (dependen de la carga, no de la petición)
+TRANSIENT_ERRORS = frozenset({"overloaded", "budget_exceeded", "internal_error"})
+
+
+def canonical(value: Any) -> Any:
+    """Forma canónica de una carga validada para el hash.
+
+    Enteros y reales se unifican (1 y 1.0 son la misma clave), -0.0 pasa a 0.0 y los
+    NaN/infinitos se escriben como texto; las cadenas se recortan. Las listas de solo
+    números se resumen en el hash de sus float64.
+    """
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        value = float(value)
+        if not math.isfinite(value):
+            return repr(value)
+        return repr(value + 0.0)
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {str(k): canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        packed = _packed_numbers(value)
+        return packed if packed is not None else [canonical(v) for v in value]
+    return repr(value)
+
+
+def _packed_numbers(values: Any) -> Optional[str]:
+    """Hash de una lista solo numérica a partir de sus float64 (filas de matrices grandes:
+    mucho más rápido que repr de cada valor); None si la lista contiene otra cosa."""
+    if not values or not all(type(x) is float or type(x) is int for x in values):
+        return None
+    try:
+        # + 0.0 unifica enteros y reales y convierte -0.0 en 0.0, como en canonical
+        packed = array("d", [x + 0.0 for x in values])
+    except OverflowError:
+        return None
+    return "f8:" + hashlib.sha256(packed.tobytes()).hexdigest()
+
+
+def cache_key(endpoint: str, func: Callable[..., Any], args: Tuple[Any, ...]) -> str:
+    """Hash de (endpoint, versión, función, argumentos canónicos).
+
+    La función entra en la clave para que dos rutas con los mismos argumentos (p. ej.
+    independencia y base de un conjunto de vectores) nunca compartan resultado.
+    """
+    text = json.dumps(
+        [endpoint, ENDPOINT_VERSIONS.get(endpoint, 1), f"{func.__module__}.{func.__qualname__}", canonical(args)],
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class _DiskTier:
+    """Entradas serializadas en una tabla SQLite, acotada a `maxsize` filas (se borran las más antiguas)."""
+
+    def __init__(self, directory: str, maxsize: int = DISK_CACHE_SIZE):
+        os.makedirs(directory, exist_ok=True)
+        self.maxsize = maxsize
+        self._db = sqlite3.connect(os.path.join(directory, "responses.sqlite3"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, value BLOB)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created)")
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: float) -> Optional[StepResult]:
+        with self._lock:
+            row = self._db.execute("SELECT created, value FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[0] > ttl:
+            return None
+        return pickle.loads(row[1])
+
+    def put(self, key: str, value: StepResult) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, created, value) VALUES (?, ?, ?)", (key, time.time(), blob)
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """Caché LRU con caducidad (TTL) de resultados de cálculo, con segundo nivel opcional en disco.
+
+    La clave es el hash de (endpoint, versión del endpoint, función, argumentos canónicos).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = RESPONSE_CACHE_SIZE,
+        ttl: float = RESPONSE_CACHE_TTL,
+        directory: Optional[str] = RESPONSE_CACHE_DIR,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str, StepResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = _DiskTier(directory) if directory else None
+        self.hits = self.misses = self.disk_hits = self.expired = self.evictions = 0
+        self._by_endpoint: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, endpoint: str, field: str) -> None:
+        stats = self._by_endpoint.setdefault(endpoint, {"hits": 0, "misses": 0})
+        stats[field] += 1
+
+    def get(self, endpoint: str, key: str) -> Optional[StepResult]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self._count(endpoint, "hits")
+                    return entry[2]
+                del self._entries[key]
+                self.expired += 1
+        value = self._disk.get(key, self.ttl) if self._disk is not None else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                self._count(endpoint, "misses")
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._count(endpoint, "hits")
+        self._store(endpoint, key, value)
+        return value
+
+    def _store(self, endpoint: str, key: str, value: StepResult) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), endpoint, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def put(self, endpoint: str, key: str, value: StepResult) -> None:
+        if value.error in TRANSIENT_ERRORS:
+            return
+        self._store(endpoint, key, value)
+        if self._disk is not None:
+            self._disk.put(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = self.expired = self.evictions = 0
+            self._by_endpoint.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "disk_hits": self.disk_hits,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "disk_size": len(self._disk) if self._disk is not None else None,
+                "endpoints": {k: dict(v) for k, v in self._by_endpoint.items()},
+            }
+
+
+response_cache = ResponseCache()
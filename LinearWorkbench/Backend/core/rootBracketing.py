@@ -0,0 +1,229 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, List, Literal, Optional, Tuple
+
+from .expressionCompiler import CompiledExpression
+
+RootKind = Literal["sign_change", "grid_zero", "touch"]
+Bracket = Tuple[float, float]
+
+GOLDEN = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+@dataclass
+class RootInfo:
+    x: float
+    fx: float
+    iterations: int
+    kind: RootKind
+    bracket: Bracket
+
+
+def real_or_nan(value) -> float:
+    """Valor real de f; un complejo (p. ej. x**0.5 con x < 0) u otro tipo no numérico vale NaN."""
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return math.nan
+
+
+def safe_evaluate_many(f: CompiledExpression, xs: List[float]) -> List[float]:
+    """f en todos los puntos; los que salen del dominio (o desbordan) o no son reales valen NaN."""
+    try:
+        return [real_or_nan(v) for v in f.evaluate_many(xs)]
+    except (ArithmeticError, ValueError, TypeError):
+        out = []
+        for x in xs:
+            try:
+                out.append(real_or_nan(f(x)))
+            except (ArithmeticError, ValueError, TypeError):
+                out.append(math.nan)
+        return out
+
+
+def grid(a: float, b: float, samples: int) -> List[float]:
+    h = (b - a) / (samples - 1)
+    return [a + i * h for i in range(samples - 1)] + [b]
+
+
+def scan_grid(
+    xs: List[float], fs: List[float]
+) -> Tuple[List[Tuple[Bracket, Bracket]], List[int], List[Bracket]]:
+    """Una pasada sobre la malla.
+
+    Devuelve (cambios de signo como ((a, b), (f(a), f(b))), índices con f exactamente
+    cero, e intervalos [x₍ᵢ₋₁₎, x₍ᵢ₊₁₎] alrededor de mínimos locales de |f| sin cambio
+    de signo, candidatos a raíces de multiplicidad par).
+    """
+    brackets: List[Tuple[Bracket, Bracket]] = []
+    zeros: List[int] = []
+    touches: List[Bracket] = []
+    scale = max((abs(v) for v in fs if v == v), default=0.0)
+    for i, (x, fx) in enumerate(zip(xs, fs)):
+        if fx != fx:
+            continue
+        if fx == 0.0:
+            zeros.append(i)
+            continue
+        if i + 1 < len(xs):
+            fn = fs[i + 1]
+            if fn == fn and fn != 0.0 and (fx < 0.0) != (fn < 0.0):
+                brackets.append(((x, xs[i + 1]), (fx, fn)))
+                continue
+        if 0 < i < len(xs) - 1:
+            fp, fn = fs[i - 1], fs[i + 1]
+            if (
+                fp == fp and fn == fn
+                and abs(fx) < abs(fp) and abs(fx) <= abs(fn)
+                and (fp < 0.0) == (fx < 0.0) == (fn < 0.0)
+                and abs(fx) <= 1e-3 * scale
+            ):
+                touches.append((xs[i - 1], xs[i + 1]))
+    return brackets, zeros, touches
+
+
+def bisect_many(
+    f: CompiledExpression,
+    brackets: List[Tuple[Bracket, Bracket]],
+    tol: float,
+    max_iter: int,
+) -> List[Tuple[float, int]]:
+    """Bisección de todos los intervalos a la vez (en paralelo por iteración).
+
+    En cada iteración los puntos medios de los intervalos aún activos se evalúan en
+    un solo lote; un intervalo sale del lote cuando su semiancho es < tol o f(c) = 0.
+    """
+    lo = [br[0][0] for br in brackets]
+    hi = [br[0][1] for br in brackets]
+    flo = [br[1][0] for br in brackets]
+    iterations = [0] * len(brackets)
+    roots: List[Optional[float]] = [None] * len(brackets)
+    active = list(range(len(brackets)))
+    for it in range(1, max_iter + 1):
+        if not active:
+            break
+        mids = [(lo[i] + hi[i]) / 2.0 for i in active]
+        fmids = safe_evaluate_many(f, mids)
+        still = []
+        for i, c, fc in zip(active, mids, fmids):
+            iterations[i] = it
+            if fc == 0.0 or (hi[i] - lo[i]) / 2.0 < tol:
+                roots[i] = c
+                continue
+            if (flo[i] < 0.0) == (fc < 0.0):
+                lo[i], flo[i] = c, fc
+            else:
+                hi[i] = c
+            still.append(i)
+        active = still
+    for i in active:
+        roots[i] = (lo[i] + hi[i]) / 2.0
+    return [(r, n) for r, n in zip(roots, iterations)]  # type: ignore[misc]
+
+
+def illinois_many(
+    f: CompiledExpression,
+    brackets: List[Tuple[Bracket, Bracket]],
+    tol: float,
+    max_iter: int,
+) -> List[Tuple[float, int]]:
+    """Regla falsa de Illinois sobre todos los intervalos a la vez.
+
+    Como bisect_many: un lote de evaluaciones por iteración. Cada vez que el extremo
+    a se conserva, f(a) se divide a la mitad, lo que evita el estancamiento de la
+    regla falsa clásica (convergencia superlineal, orden ≈1.44).
+    Un intervalo sale del lote cuando |cₖ − cₖ₋₁| < tol o |f(cₖ)| < tol.
+    """
+    a = [br[0][0] for br in brackets]
+    b = [br[0][1] for br in brackets]
+    fa = [br[1][0] for br in brackets]
+    fb = [br[1][1] for br in brackets]
+    prev = [math.inf] * len(brackets)
+    iterations = [0] * len(brackets)
+    roots: List[Optional[float]] = [None] * len(brackets)
+    active = list(range(len(brackets)))
+    for it in range(1, max_iter + 1):
+        if not active:
+            break
+        points = [(a[i] * fb[i] - b[i] * fa[i]) / (fb[i] - fa[i]) for i in active]
+        fpoints = safe_evaluate_many(f, points)
+        still = []
+        for i, c, fc in zip(active, points, fpoints):
+            iterations[i] = it
+            if fc == 0.0 or abs(fc) < tol or abs(c - prev[i]) < tol:
+                roots[i] = c
+                continue
+            prev[i] = c
+            if (fc < 0.0) != (fb[i] < 0.0):
+                a[i], fa[i] = b[i], fb[i]
+            else:
+                fa[i] *= 0.5
+            b[i], fb[i] = c, fc
+            still.append(i)
+        active = still
+    for i in active:
+        roots[i] = b[i]
+    return [(r, n) for r, n in zip(roots, iterations)]  # type: ignore[misc]
+
+
+def minimize_abs(
+    f: Callable[[float], float], a: float, b: float, tol: float, max_iter: int
+) -> Tuple[float, int]:
+    """Sección áurea sobre |f| en [a, b]; devuelve (x, iteraciones).
+
+    Los puntos fuera del dominio de f o con valor no real cuentan como NaN.
+    """
+    def size(x: float) -> float:
+        try:
+            return abs(real_or_nan(f(x)))
+        except (ArithmeticError, ValueError, TypeError):
+            return math.nan
+
+    c = b - GOLDEN * (b - a)
+    d = a + GOLDEN * (b - a)
+    fc, fd = size(c), size(d)
+    it = 0
+    while it < max_iter and b - a > tol:
+        it += 1
+        if fc <= fd:
+            b, d, fd = d, c, fc
+            c = b - GOLDEN * (b - a)
+            fc = size(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + GOLDEN * (b - a)
+            fd = size(d)
+    return (a + b) / 2.0, it
+
+
+def find_all_roots(
+    f: CompiledExpression, a: float, b: float, samples: int, tol: float, max_iter: int
+) -> Tuple[List[RootInfo], int]:
+    """Todas las raíces detectables en [a, b] con una malla de `samples` puntos.
+
+    Devuelve (raíces ordenadas, número de cambios de signo descartados por ser
+    discontinuidades, p. ej. polos de tan(x)).
+    """
+    xs = grid(a, b, samples)
+    fs = safe_evaluate_many(f, xs)
+    brackets, zeros, touches = scan_grid(xs, fs)
+
+    roots: List[RootInfo] = [RootInfo(xs[i], 0.0, 0, "grid_zero", (xs[i], xs[i])) for i in zeros]
+    discontinuities = 0
+    refined = bisect_many(f, brackets, tol, max_iter)
+    for ((br, fbr), (x, n)) in zip(brackets, refined):
+        fx = safe_evaluate_many(f, [x])[0]
+        # en un polo |f| crece al acercarse: no es raíz
+        if not fx == fx or abs(fx) > max(abs(fbr[0]), abs(fbr[1])):
+            discontinuities += 1
+            continue
+        roots.append(RootInfo(x, fx, n, "sign_change", br))
+    for lo, hi in touches:
+        x, n = minimize_abs(f, lo, hi, tol, max_iter)
+        fx = safe_evaluate_many(f, [x])[0]
+        if fx == fx and abs(fx) <= tol:
+            roots.append(RootInfo(x, fx, n, "touch", (lo, hi)))
+    roots.sort(key=lambda r: r.x)
+    return roots, discontinuities
@@ -0,0 +1,193 @@
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .numericalConcepts import (
+    EvaluationTimeout,
+    metered,
+    solve_bisection,
+    solve_brent,
+    solve_false_position,
+    solve_newton_bisection,
+    solve_newton_raphson,
+    solve_secant,
+)
+from .common import StepResult
+from .executor import POOL_WORKERS, compute_executor
+
+MAX_BATCH_JOBS = 1000
+# tiempo límite máximo por trabajo (segundos)
+MAX_JOB_TIMEOUT = 60.0
+# margen sobre el tiempo límite por trabajo antes de darlo por perdido (evaluación colgada)
+HARD_TIMEOUT_MARGIN = 2.0
+
+# método → (función, parámetros posicionales que toma del trabajo)
+ROOT_METHODS: Dict[str, Tuple[Callable[..., StepResult], Tuple[str, ...]]] = {
+    "bisection": (solve_bisection, ("expr", "a", "b", "tol", "max_iter")),
+    "false_position": (solve_false_position, ("expr", "a", "b", "tol", "max_iter")),
+    "newton_raphson": (solve_newton_raphson, ("expr", "x0", "tol", "max_iter")),
+    "secant": (solve_secant, ("expr", "x0", "x1", "tol", "max_iter")),
+    "brent": (solve_brent, ("expr", "a", "b", "tol", "max_iter")),
+    "newton_bisection": (solve_newton_bisection, ("expr", "a", "b", "tol", "max_iter")),
+}
+
+def _job_result(job: Dict[str, Any], index: int, **fields: Any) -> Dict[str, Any]:
+    result = {
+        "type": "result",
+        "index": index,
+        "id": job.get("id"),
+        "method": job.get("method"),
+        "value": None,
+        "iterations": 0,
+        "evaluations": 0,
+        "time_ms": 0.0,
+        "error": None,
+    }
+    result.update(fields)
+    return result
+
+
+def run_root_job(job: Dict[str, Any], index: int, timeout: Optional[float]) -> Dict[str, Any]:
+    """Ejecuta un trabajo (en el proceso trabajador); nunca lanza excepciones."""
+    spec = ROOT_METHODS.get(job.get("method"))  # type: ignore[arg-type]
+    if spec is None:
+        return _job_result(job, index, error="unknown_method")
+    func, params = spec
+    if any(job.get(p) is None for p in params):
+        return _job_result(job, index, error="missing_parameters")
+
+    start = time.perf_counter()
+    with metered(timeout) as meter:
+        try:
+            res = func(*(job[p] for p in params), verbosity="full" if job.get("include_steps") else "none")
+        except EvaluationTimeout:
+            res = StepResult(steps=["Tiempo límite agotado"], error="timeout")
+        except (ArithmeticError, ValueError, TypeError) as e:
+            res = StepResult(steps=[f"Error matemático al evaluar: {e}"], error="math_error")
+    elapsed = time.perf_counter() - start
+    return _job_result(
+        job,
+        index,
+        value=res.vector[0] if res.vector else None,
+        iterations=(res.details or {}).get("iterations", 0),
+        evaluations=meter.count,
+        time_ms=elapsed * 1e3,
+        error=res.error,
+        **({"steps": list(res.steps)} if job.get("include_steps") else {}),
+    )
+
+
+def iter_batch(jobs: List[Dict[str, Any]], timeout: float) -> Iterator[Dict[str, Any]]:
+    """Reparte los trabajos en el pool de procesos y los entrega según terminan.
+
+    El lote ocupa plazas del ejecutor como cualquier petición: reserva hasta
+    POOL_WORKERS plazas (si no caben, todos sus trabajos salen con error "overloaded")
+    y nunca tiene más trabajos enviados al pool que plazas reservadas.
+
+    El tiempo límite se comprueba en cada evaluación de f dentro del trabajador; si
+    un trabajo no responde ni con HARD_TIMEOUT_MARGIN de más (una sola evaluación
+    colgada), se informa como timeout sin esperar más por él, y su plaza no se
+    reutiliza: el trabajador sigue ocupado.
+    """
+    window = min(len(jobs), POOL_WORKERS)
+    if not window:
+        return
+    if not compute_executor.admit(window):
+        for i, job in enumerate(jobs):
+            yield _job_result(job, i, error="overloaded")
+        return
+    pool = compute_executor.pool
+    waiting = deque(enumerate(jobs))
+    # futuro → (índice del trabajo, instante en que se envió)
+    running: Dict[Future, Tuple[int, float]] = {}
+    slots = window
+    broken = False
+    try:
+        while waiting or running:
+            while waiting and not broken and len(running) < slots:
+                i, job = waiting.popleft()
+                try:
+                    running[pool.submit(run_root_job, job, i, timeout)] = (i, time.monotonic())
+                except BrokenProcessPool:
+                    waiting.appendleft((i, job))
+                    broken = True
+            if not running:
+                # pool roto, o todos los trabajadores colgados: el resto no se envía
+                for i, job in waiting:
+                    yield _job_result(job, i, error="worker_error" if broken else "timeout")
+                break
+            oldest = min(sent for _, sent in running.values())
+            done, _ = wait(
+                running,
+                timeout=max(0.0, oldest + timeout + HARD_TIMEOUT_MARGIN - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                now = time.monotonic()
+                for fut, (i, sent) in list(running.items()):
+                    if now - sent >= timeout + HARD_TIMEOUT_MARGIN:
+                        # el trabajador sigue ocupado con él: su plaza no se reutiliza
+                        del running[fut]
+                        fut.cancel()
+                        slots -= 1
+                        yield _job_result(jobs[i], i, error="timeout", time_ms=timeout * 1e3)
+                continue
+            for fut in done:
+                i, _ = running.pop(fut)
+                try:
+                    yield fut.result()
+                except BrokenProcessPool:  # murió un trabajador: el pool ya no acepta trabajos
+                    broken = True
+                    yield _job_result(jobs[i], i, error="worker_error")
+                except Exception:
+                    yield _job_result(jobs[i], i, error="worker_error")
+    finally:
+        for fut in running:
+            fut.cancel()
+        if broken:
+            compute_executor.discard_pool(pool)
+        compute_executor.release(window)
+
+
+def summarize(results: List[Dict[str, Any]], wall_time: float) -> Dict[str, Any]:
+    """Resumen por método: trabajos, errores, timeouts, evaluaciones y tiempo."""
+    methods: Dict[str, Dict[str, Any]] = {}
+    for r in results:
+        m = methods.setdefault(
+            r["method"] or "unknown",
+            {"jobs": 0, "ok": 0, "errors": 0, "timeouts": 0, "evaluations": 0, "time_ms": 0.0},
+        )
+        m["jobs"] += 1
+        if r["error"] is None:
+            m["ok"] += 1
+        elif r["error"] == "timeout":
+            m["timeouts"] += 1
+        else:
+            m["errors"] += 1
+        m["evaluations"] += r["evaluations"]
+        m["time_ms"] += r["time_ms"]
+    for m in methods.values():
+        m["mean_evaluations"] = m["evaluations"] / m["jobs"]
+        m["mean_time_ms"] = m["time_ms"] / m["jobs"]
+    return {
+        "type": "summary",
+        "jobs": len(results),
+        "ok": sum(1 for r in results if r["error"] is None),
+        "wall_time_ms": wall_time * 1e3,
+        "methods": methods,
+    }
+
+
+def stream_batch(jobs: List[Dict[str, Any]], timeout: float) -> Iterator[Dict[str, Any]]:
+    """Resultados según terminan y, al final, el resumen."""
+    if len(jobs) > MAX_BATCH_JOBS:
+        yield {"type": "error", "error": "too_many_jobs", "max_jobs": MAX_BATCH_JOBS}
+        return
+    start = time.perf_counter()
+    results = []
+    for result in iter_batch(jobs, timeout):
+        results.append(result)
+        yield result
+    yield summarize(results, time.perf_counter() - start)
@@ -0,0 +1,183 @@
+import json
+import signal
+import time
+from typing import Any, Callable, Dict, Generator, Iterator, List, Tuple
+
+from .budget import Budget, KILL_MARGIN, budget_exceeded, limit_memory, process_context, run_with_deadline
+from .common import StepResult, StepStream, Verbosity
+from .executor import ExecutionPolicy, compute_executor, overloaded
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# líneas que el proceso trabajador agrupa en cada envío por la tubería
+PIPE_BATCH_LINES = 64
+PIPE_BATCH_SECONDS = 0.05
+
+
+def stream_events(
+    stream_func: Callable[..., StepStream],
+    args: Tuple[Any, ...],
+    render: Callable[[StepResult], Dict[str, Any]],
+    estimated_cost: float,
+    verbosity: Verbosity,
+    policy: ExecutionPolicy,
+) -> Iterator[Dict[str, Any]]:
+    """Eventos del StepStream stream_func(*args) según el algoritmo produce cada línea.
+
+    {"type": "step", "index": i, "text": ...} por línea (ninguno con verbosity "none") y, al
+    final, {"type": "result", ...} con render(StepResult) sin los pasos, que ya se enviaron.
+    No se acumula ninguna línea: la memoria no depende del número de pasos.
+
+    Se aplica el presupuesto del endpoint igual que sin streaming: por encima de
+    policy.inline_cost el algoritmo corre en un proceso propio que envía las líneas por una
+    tubería y se mata al agotar el tiempo, aunque no produzca ninguna línea.
+    """
+    budget = policy.budget
+    index = 0
+    if not estimated_cost <= budget.max_cost:
+        result = budget_exceeded("estimated_cost", budget, estimated_cost)
+        outcome: Generator[str, None, Any] = _no_lines()
+    elif policy.mode == "inline" or estimated_cost <= policy.inline_cost:
+        outcome = _inline_lines(stream_func, args, verbosity)
+    elif not compute_executor.admit():
+        result = overloaded()
+        outcome = _no_lines()
+    else:
+        outcome = _isolated_lines(stream_func, args, verbosity, budget, estimated_cost)
+    try:
+        while True:
+            try:
+                text = next(outcome)
+            except StopIteration as stop:
+                if stop.value is not None:
+                    result = stop.value
+                break
+            yield {"type": "step", "index": index, "text": text}
+            index += 1
+    finally:
+        # si el cliente se desconecta: mata el proceso y libera su plaza
+        outcome.close()
+    # pasos que el StepResult trae consigo: errores de validación o de presupuesto
+    for text in result.steps:
+        yield {"type": "step", "index": index, "text": text}
+        index += 1
+    final = render(result)
+    final.pop("steps", None)
+    yield {"type": "result", **final}
+
+
+def _no_lines() -> Generator[str, None, Any]:
+    return None
+    yield  # generador
+
+
+def _inline_lines(
+    stream_func: Callable[..., StepStream], args: Tuple[Any, ...], verbosity: Verbosity
+) -> Generator[str, None, StepResult]:
+    """Cálculos pequeños: en el propio hilo (crear un proceso costaría más que el cálculo).
+
+    Las cabeceras 200 ya se enviaron: una excepción se convierte en un StepResult con
+    internal_error para que el evento "result" final llegue siempre.
+    """
+    try:
+        stream = stream_func(*args)
+        while True:
+            try:
+                text = next(stream)
+            except StopIteration as stop:
+                return stop.value
+            if verbosity != "none":
+                yield text
+    except Exception as e:
+        return _internal_error(f"{type(e).__name__}: {e}")
+
+
+def _internal_error(payload: str) -> StepResult:
+    return StepResult(steps=[f"Error inesperado en el cálculo: {payload}"], error="internal_error")
+
+
+def _isolated_lines(
+    stream_func: Callable[..., StepStream],
+    args: Tuple[Any, ...],
+    verbosity: Verbosity,
+    budget: Budget,
+    estimated_cost: float,
+) -> Generator[str, None, StepResult]:
+    ctx = process_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_stream_worker, args=(sender, stream_func, args, verbosity, budget), daemon=True)
+    process.start()
+    sender.close()
+    deadline = time.monotonic() + budget.wall_time + KILL_MARGIN
+    try:
+        while True:
+            if not receiver.poll(max(0.0, deadline - time.monotonic())):
+                return budget_exceeded("time", budget, estimated_cost)
+            try:
+                kind, payload = receiver.recv()
+            except EOFError:  # p. ej. el sistema mató al proceso por memoria
+                return budget_exceeded("worker_died", budget, estimated_cost)
+            if kind == "lines":
+                yield from payload
+            elif kind == "ok":
+                return payload
+            elif kind == "error":
+                return _internal_error(payload)
+            else:  # "time" | "memory": las líneas hechas hasta entonces ya se enviaron
+                return budget_exceeded(kind, budget, estimated_cost)
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+        compute_executor.release()
+
+
+def _stream_worker(conn, stream_func: Callable[..., StepStream], args: Tuple[Any, ...], verbosity: Verbosity, budget: Budget) -> None:
+    limit_memory(budget.memory_mb)
+    batch: List[str] = []
+
+    def forward() -> StepResult:
+        stream = stream_func(*args)
+        sent = time.monotonic()
+        while True:
+            try:
+                text = next(stream)
+            except StopIteration as stop:
+                return stop.value
+            if verbosity == "none":
+                continue
+            batch.append(text)
+            if len(batch) >= PIPE_BATCH_LINES or time.monotonic() - sent > PIPE_BATCH_SECONDS:
+                _send(conn, ("lines", batch[:]))
+                batch.clear()
+                sent = time.monotonic()
+
+    status, payload = run_with_deadline(forward, (), budget.wall_time)
+    if batch:
+        conn.send(("lines", batch))
+    # con "time"/"memory" las líneas hechas ya se enviaron: no hacen falta pasos parciales
+    conn.send((status, payload if status in ("ok", "error") else None))
+    conn.close()
+
+
+def _send(conn, message: Tuple[str, Any]) -> None:
+    # la alarma del plazo no puede cortar un envío a medias: el otro extremo leería un
+    # mensaje roto. Si vence durante el envío, salta justo al desbloquearla.
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+    try:
+        conn.send(message)
+    finally:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGALRM})
+
+
+def ndjson_lines(events: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    for event in events:
+        yield json.dumps(event, ensure_ascii=False) + "\n"
+
+
+def sse_lines(events: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """Formato Server-Sent Events: el tipo del evento va en `event:` y el JSON en `data:`."""
+    for event in events:
+        yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
@@ -1,4 +1,12 @@
-from .common import Matrix, Vector, StepResult, format_matrix, clone_matrix
+from typing import Optional
+from .common import Matrix, Vector, StepLog, StepResult, Verbosity, format_matrix, clone_matrix
+from .orthonormalization import OrthonormalizationMethod, householder_orthonormalize, modified_gram_schmidt
+from .numericalRank import RankAnalysis, SpanFactorization, rank_revealing_qr, format_dependency
+
+# por encima de este número de entradas no se genera la eliminación paso a paso
+# salvo que se pida explícitamente (show_steps=True)
+STEP_BY_STEP_MAX_ENTRIES = 100
+MAX_LISTED_VECTORS = 50
 
 
 def _matrix_from_vectors_as_columns(vectors: list[Vector]) -> Matrix:
@@ -8,7 +16,7 @@ def _matrix_from_vectors_as_columns(vectors: list[Vector]) -> Matrix:
     return [[vec[i] for vec in vectors] for i in range(dim)]
 
 
-def _gaussian_for_rank(m: Matrix) -> tuple[Matrix, int]:
+def _gaussian_for_rank(m: Matrix, tol: float = 1e-10) -> tuple[Matrix, int]:
     a = clone_matrix(m)
     rows = len(a)
     cols = len(a[0]) if a else 0
@@ -18,7 +26,7 @@ def _gaussian_for_rank(m: Matrix) -> tuple[Matrix, int]:
         if r >= rows:
             break
         pivot = max(range(r, rows), key=lambda i: abs(a[i][c]))
-        if abs(a[pivot][c]) < 1e-10:
+        if abs(a[pivot][c]) <= tol:
             continue
         a[r], a[pivot] = a[pivot], a[r]
         pv = a[r][c]
@@ -33,20 +41,77 @@ def _gaussian_for_rank(m: Matrix) -> tuple[Matrix, int]:
     return a, rank
 
 
-def check_independence(vectors: list[Vector]) -> StepResult:
+def _echelon_steps(steps: StepLog, m: Matrix, analysis: RankAnalysis) -> Matrix:
+    """Forma escalonada para la traza, con la misma tolerancia absoluta que el QR."""
+    reduced, echelon_rank = _gaussian_for_rank(m, analysis.tolerance)
+    steps.append("Forma escalonada:")
+    steps.append(format_matrix(reduced))
+    if echelon_rank != analysis.rank:
+        steps.append(
+            f"(La eliminación gaussiana deja {echelon_rank} pivotes; es solo ilustrativa: "
+            "el rango se determina con el QR con pivoteo de columnas)"
+        )
+    return reduced
+
+
+def _wants_steps(vectors: list[Vector], show_steps: Optional[bool], verbosity: Verbosity = "full") -> bool:
+    if verbosity != "full":
+        return False
+    if show_steps is not None:
+        return show_steps
+    return len(vectors) * len(vectors[0]) <= STEP_BY_STEP_MAX_ENTRIES
+
+
+def _rank_details(analysis: RankAnalysis) -> dict:
+    return {
+        "rank": analysis.rank,
+        "independent": analysis.independent,
+        "dependent": analysis.dependent,
+        "coefficients": analysis.coefficients,
+    }
+
+
+def _append_rank_summary(steps: StepLog, analysis: RankAnalysis) -> None:
+    if not steps.enabled:
+        return
+    steps.append(
+        f"QR con pivoteo de columnas: rango = {analysis.rank} "
+        f"(tolerancia relativa {analysis.tolerance:.3e})"
+    )
+    if len(analysis.independent) > MAX_LISTED_VECTORS:
+        steps.append(f"Subconjunto independiente maximal: {len(analysis.independent)} vectores")
+    elif analysis.independent:
+        steps.append(
+            "Subconjunto independiente maximal: "
+            + ", ".join(f"v{i + 1}" for i in sorted(analysis.independent))
+        )
+    for i in range(min(len(analysis.dependent), MAX_LISTED_VECTORS)):
+        steps.append("  " + format_dependency(analysis, i))
+    if len(analysis.dependent) > MAX_LISTED_VECTORS:
+        steps.append(f"  … y {len(analysis.dependent) - MAX_LISTED_VECTORS} vectores dependientes más")
+
+
+def check_independence(
+    vectors: list[Vector], show_steps: Optional[bool] = None, verbosity: Verbosity = "full"
+) -> StepResult:
     if not vectors:
         return StepResult(steps=["No hay vectores"], error="no_vectors")
 
     dim = len(vectors[0])
-    steps: list[str] = []
+    if any(len(v) != dim for v in vectors):
+        return StepResult(steps=["Los vectores tienen dimensiones diferentes"], error="dimension_mismatch")
+    steps = StepLog(verbosity=verbosity)
     steps.append(f"ANÁLISIS DE INDEPENDENCIA EN R^{dim}")
-    m = _matrix_from_vectors_as_columns(vectors)
-    steps.append("Matriz [v1 v2 ... vn]:")
-    steps.append(format_matrix(m))
+    analysis = rank_revealing_qr(vectors)
+    reduced = None
+    if _wants_steps(vectors, show_steps, verbosity):
+        m = _matrix_from_vectors_as_columns(vectors)
+        steps.append("Matriz [v1 v2 ... vn]:")
+        steps.append(format_matrix(m))
+        reduced = _echelon_steps(steps, m, analysis)
 
-    reduced, rank = _gaussian_for_rank(m)
-    steps.append("Forma escalonada:")
-    steps.append(format_matrix(reduced))
+    _append_rank_summary(steps, analysis)
+    rank = analysis.rank
     steps.append(f"Rango = {rank}, número de vectores = {len(vectors)}")
 
     indep = rank == len(vectors)
@@ -54,25 +119,120 @@ def check_independence(vectors: list[Vector]) -> StepResult:
         steps.append("Conclusión: conjunto linealmente INDEPENDIENTE")
     else:
         steps.append("Conclusión: conjunto linealmente DEPENDIENTE")
-    return StepResult(steps=steps, matrix=reduced, solution_type="unique" if indep else "infinite")
+    return StepResult(
+        steps=steps,
+        matrix=reduced,
+        solution_type="unique" if indep else "infinite",
+        details=_rank_details(analysis),
+    )
 
 
-def check_basis(vectors: list[Vector]) -> StepResult:
+def check_basis(
+    vectors: list[Vector], show_steps: Optional[bool] = None, verbosity: Verbosity = "full"
+) -> StepResult:
     if not vectors:
         return StepResult(steps=["No hay vectores"], error="no_vectors")
     dim = len(vectors[0])
-    steps: list[str] = []
+    if any(len(v) != dim for v in vectors):
+        return StepResult(steps=["Los vectores tienen dimensiones diferentes"], error="dimension_mismatch")
+    steps = StepLog(verbosity=verbosity)
     if len(vectors) != dim:
         steps.append(f"Hay {len(vectors)} vectores pero la dimensión es {dim} → no puede ser base")
         return StepResult(steps=steps, error="wrong_cardinality")
-    m = _matrix_from_vectors_as_columns(vectors)
-    reduced, rank = _gaussian_for_rank(m)
-    steps.append("Forma escalonada:")
-    steps.append(format_matrix(reduced))
+    analysis = rank_revealing_qr(vectors)
+    reduced = None
+    if _wants_steps(vectors, show_steps, verbosity):
+        reduced = _echelon_steps(steps, _matrix_from_vectors_as_columns(vectors), analysis)
+    _append_rank_summary(steps, analysis)
+    rank = analysis.rank
     steps.append(f"Rango = {rank}")
     if rank == dim:
         steps.append("Conclusión: los vectores forman una BASE de R^n")
-        return StepResult(steps=steps, matrix=reduced)
+        return StepResult(steps=steps, matrix=reduced, details=_rank_details(analysis))
     else:
         steps.append("Conclusión: NO forman base")
-        return StepResult(steps=steps, matrix=reduced, error="not_basis")
+        return StepResult(steps=steps, matrix=reduced, error="not_basis", details=_rank_details(analysis))
+
+
+def _format_combination(coefficients: list[float], decimals: int = 4) -> str:
+    expr = ""
+    for i, c in enumerate(coefficients):
+        if abs(c) <= 10 ** (-decimals - 2):
+            continue
+        term = f"{abs(c):.{decimals}f}·v{i + 1}"
+        expr = (term if c > 0 else f"-{term}") if not expr else expr + f" {'+' if c > 0 else '-'} {term}"
+    return expr or "0"
+
+
+def combination_batch(vectors: list[Vector], targets: list[Vector], verbosity: Verbosity = "full") -> StepResult:
+    """Pertenencia al span y coeficientes para muchos vectores b con una sola factorización."""
+    if not vectors:
+        return StepResult(steps=["No hay vectores"], error="no_vectors")
+    if not targets:
+        return StepResult(steps=["No hay vectores objetivo"], error="no_targets")
+    dim = len(vectors[0])
+    if any(len(v) != dim for v in vectors) or any(len(b) != dim for b in targets):
+        return StepResult(steps=["Los vectores tienen dimensiones diferentes"], error="dimension_mismatch")
+
+    steps = StepLog(verbosity=verbosity)
+    steps.append(f"COMBINACIÓN LINEAL POR LOTES EN R^{dim}: {len(vectors)} generadores, {len(targets)} objetivos")
+    factorization = SpanFactorization(vectors)
+    steps.append(
+        f"Factorización QR con pivoteo de los generadores (una sola vez): rango = {factorization.rank}"
+    )
+    results = factorization.solve_many(targets)
+    for i, res in enumerate(results[:MAX_LISTED_VECTORS] if steps.detailed else ()):
+        if res.member:
+            steps.append(f"b{i + 1} = {_format_combination(res.coefficients)}  (residuo {res.residual:.3e})")
+        else:
+            steps.append(f"b{i + 1} ∉ span (residuo {res.residual:.3e})")
+    if steps.detailed and len(results) > MAX_LISTED_VECTORS:
+        steps.append(f"… y {len(results) - MAX_LISTED_VECTORS} objetivos más")
+    members = sum(res.member for res in results)
+    steps.append(f"Conclusión: {members} de {len(results)} objetivos pertenecen al span")
+    return StepResult(
+        steps=steps,
+        details={
+            "rank": factorization.rank,
+            "members": [res.member for res in results],
+            "coefficients": [res.coefficients if res.member else None for res in results],
+            "residuals": [res.residual for res in results],
+        },
+    )
+
+
+def orthonormalize(
+    vectors: list[Vector],
+    method: OrthonormalizationMethod = "mgs",
+    reorthogonalize: bool = True,
+    show_steps: Optional[bool] = None,
+    verbosity: Verbosity = "full",
+) -> StepResult:
+    if not vectors:
+        return StepResult(steps=["No hay vectores"], error="no_vectors")
+    dim = len(vectors[0])
+    if any(len(v) != dim for v in vectors):
+        return StepResult(steps=["Los vectores tienen dimensiones diferentes"], error="dimension_mismatch")
+
+    steps = StepLog(verbosity=verbosity)
+    trace = steps if _wants_steps(vectors, show_steps, verbosity) else None
+    if method == "mgs":
+        steps.append(
+            f"ORTONORMALIZACIÓN EN R^{dim}: Gram-Schmidt modificado"
+            + (" con reortogonalización" if reorthogonalize else "")
+        )
+        result = modified_gram_schmidt(vectors, reorthogonalize, steps=trace)
+    else:
+        steps.append(f"ORTONORMALIZACIÓN EN R^{dim}: QR de Householder")
+        result = householder_orthonormalize(vectors, steps=trace)
+    steps.append(f"Dimensión del espacio generado: {len(result.basis)}")
+    steps.append(f"Pérdida de ortogonalidad ‖QQᵀ − I‖ = {result.orthogonality_loss:.3e}")
+    return StepResult(
+        steps=steps,
+        matrix=result.basis,
+        details={
+            "rank": len(result.basis),
+            "indices": result.indices,
+            "orthogonality_loss": result.orthogonality_loss,
+        },
+    )
@@ -0,0 +1,65 @@
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.acceleration import aitken, aitken_accelerate, false_position_steps, fixed_point_iterates, steffensen
+from core.numericalConcepts import solve_accelerated
+
+ROOT = 0.7390851332151607  # cos(x) = x
+
+
+def test_aitken_is_exact_on_a_geometric_sequence():
+    # xₖ = 1 + 0.5ᵏ
+    assert aitken(2.0, 1.5, 1.25) == pytest.approx(1.0)
+    assert aitken(1.0, 1.0, 1.0) is None
+
+
+def test_aitken_accelerates_a_linear_fixed_point_iteration():
+    pairs = list(zip(range(8), aitken_accelerate(fixed_point_iterates(math.cos, 1.0))))
+    x7, acc7 = pairs[-1][1]
+    assert abs(acc7 - ROOT) < abs(x7 - ROOT) / 100
+
+
+def test_steffensen_converges_quadratically():
+    estimates = [acc for _, (_, acc) in zip(range(4), steffensen(math.cos, 1.0))]
+    assert estimates[-1] == pytest.approx(ROOT, abs=1e-12)
+
+
+@pytest.mark.parametrize("variant", ["illinois", "pegasus"])
+def test_modified_false_position_does_not_stall(variant):
+    f = lambda x: x ** 10 - 1  # regla falsa clásica retiene a = 0 durante decenas de pasos
+    plain = [s.c for _, s in zip(range(30), false_position_steps(f, 0.0, 1.3, -1.0, 1.3 ** 10 - 1))]
+    modified = [s.c for _, s in zip(range(30), false_position_steps(f, 0.0, 1.3, -1.0, 1.3 ** 10 - 1, variant))]
+    assert abs(modified[-1] - 1.0) < 1e-12
+    assert abs(plain[-1] - 1.0) > 1e-6
+
+
+@pytest.mark.parametrize(
+    "method, acceleration, params",
+    [
+        ("false_position", "illinois", {"a": 0.0, "b": 1.3}),
+        ("false_position", "pegasus", {"a": 0.0, "b": 1.3}),
+        ("false_position", "aitken", {"a": 0.0, "b": 1.3}),
+    ],
+)
+def test_accelerated_solver_matches_the_root_with_fewer_iterations(method, acceleration, params):
+    res = solve_accelerated("x**10 - 1", method, acceleration, tol=1e-12, max_iter=200, verbosity="none", **params)
+    assert res.error is None
+    assert res.vector[0] == pytest.approx(1.0, abs=1e-9)
+    assert res.details["iterations"] <= res.details["raw_iterations"]
+
+
+def test_steffensen_on_newton():
+    res = solve_accelerated("cos(x) - x", "newton_raphson", "steffensen", x0=1.0, tol=1e-12, verbosity="none")
+    assert res.error is None
+    assert res.vector[0] == pytest.approx(ROOT, abs=1e-10)
+    assert res.details["iterations"] <= res.details["raw_iterations"]
+
+
+def test_acceleration_errors():
+    assert solve_accelerated("x", "secant", "pegasus", x0=0, x1=1).error == "unsupported_acceleration"
+    assert solve_accelerated("x", "false_position", "illinois", a=0).error == "missing_parameters"
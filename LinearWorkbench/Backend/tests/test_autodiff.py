@@ -0,0 +1,53 @@
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.expressionCompiler import compile_expression
+from core.numericalConcepts import solve_newton_bisection, solve_newton_raphson
+
+
+@pytest.mark.parametrize(
+    "expr, x, derivative",
+    [
+        ("x**3 - 2*x", 2.0, 10.0),
+        ("sin(x)*exp(x)", 0.5, math.exp(0.5) * (math.sin(0.5) + math.cos(0.5))),
+        ("x**x", 2.0, 4.0 * (math.log(2.0) + 1.0)),
+        ("2**x", 3.0, 8.0 * math.log(2.0)),
+        ("1/(1 + x**2)", 1.0, -0.5),
+        ("sqrt(x) + log(x)", 4.0, 0.25 + 0.25),
+        ("abs(x - 3)", 1.0, -1.0),
+        ("x % 2", 3.5, 1.0),
+        ("7 % x", 3.0, -2.0),  # 7 − ⌊7/x⌋·x
+    ],
+)
+def test_dual_numbers_match_the_known_derivative(expr, x, derivative):
+    f = compile_expression(expr)
+    fx, dfx = f.value_and_derivative(x)
+    assert fx == pytest.approx(f(x))
+    assert dfx == pytest.approx(derivative)
+
+
+@pytest.mark.parametrize("expr", ["x**0.5", "sqrt(x)", "x**(1/3)"])
+def test_unbounded_derivative_at_zero_is_infinite(expr):
+    fx, dfx = compile_expression(expr).value_and_derivative(0.0)
+    assert fx == 0.0 and dfx == math.inf
+
+
+def test_constant_has_zero_derivative():
+    assert compile_expression("sqrt(4) + 1").value_and_derivative(0.0) == (3.0, 0.0)
+
+
+def test_newton_stops_on_an_infinite_derivative():
+    res = solve_newton_raphson("x**0.5 - 1", 0.0, 1e-10, 50, verbosity="full")
+    assert res.error == "zero_derivative"
+    assert "no es finita" in "\n".join(res.steps)
+
+
+def test_newton_bisection_falls_back_on_an_infinite_derivative():
+    res = solve_newton_bisection("x**0.5 - 1", 0.0, 4.0, 1e-12, 100, verbosity="none")
+    assert res.error is None
+    assert res.vector[0] == pytest.approx(1.0, abs=1e-9)
@@ -0,0 +1,48 @@
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.numericalConcepts import solve_bisection, solve_bracket_sweep
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("method", ["bisection", "illinois"])
+def test_sweep_finds_each_root_of_sin(method):
+    intervals = [[k - 0.5, k + 0.5] for k in range(1, 6)]
+    res = solve_bracket_sweep("sin(pi*x)", intervals, method, 1e-12, 200, verbosity="none")
+    assert res.details["values"] == pytest.approx([1.0, 2.0, 3.0, 4.0, 5.0], abs=1e-10)
+    assert res.details["errors"] == [None] * 5
+
+
+def test_illinois_needs_fewer_iterations_than_bisection():
+    intervals = [[1.0, 2.0], [0.5, 3.0]]
+    bisection = solve_bracket_sweep("x**3 - x - 2", intervals, "bisection", 1e-12, 200, verbosity="none")
+    illinois = solve_bracket_sweep("x**3 - x - 2", intervals, "illinois", 1e-12, 200, verbosity="none")
+    assert illinois.details["values"] == pytest.approx(bisection.details["values"], abs=1e-10)
+    assert max(illinois.details["iterations"]) < min(bisection.details["iterations"])
+
+
+def test_sweep_matches_the_standalone_solver():
+    standalone = solve_bisection("x**2 - 2", 0, 2, 1e-10, 200, verbosity="none")
+    sweep = solve_bracket_sweep("x**2 - 2", [[0, 2]], "bisection", 1e-10, 200, verbosity="none")
+    assert sweep.details["values"][0] == pytest.approx(standalone.vector[0], abs=1e-9)
+
+
+def test_sweep_reports_errors_per_interval():
+    res = solve_bracket_sweep("log(x) - 1", [[1, 3], [2, 2.5], [-1, 3], [math.e, 4]], "bisection", 1e-12, 200)
+    assert res.details["values"][0] == pytest.approx(math.e, abs=1e-10)
+    assert res.details["errors"][1:3] == ["same_sign", "math_error"]
+    assert res.details["values"][3] == math.e  # raíz exacta en un extremo
+
+
+def test_sweep_endpoint_rejects_malformed_intervals():
+    response = client.post("/numerical/batch/brackets", json={"expr": "x", "intervals": [[0, 1, 2]]})
+    assert response.json()["error"] == "invalid_interval"
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.budget import Budget, run_budgeted
+from core.common import StepResult
+from core.executor import ComputeExecutor, configure
+from core.responseCache import cache_key, response_cache
+
+CALLS = []
+
+
+def _pid() -> StepResult:
+    return StepResult(steps=[], vector=[float(os.getpid())])
+
+
+def _counted(value: float) -> StepResult:
+    CALLS.append(value)
+    return StepResult(steps=[], vector=[value])
+
+
+def _fails() -> StepResult:
+    raise KeyError("sin clave")
+
+
+def _sleeps(seconds: float) -> StepResult:
+    time.sleep(seconds)
+    return StepResult(steps=["terminado"])
+
+
+def test_inline_exception_becomes_internal_error():
+    configure("test_inline", mode="inline", cached=False)
+    res = asyncio.run(ComputeExecutor(workers=1).run("test_inline", _fails, (), 1.0))
+    assert res.error == "internal_error"
+    assert "KeyError" in res.steps[0]
+
+
+def test_isolated_always_runs_in_a_process_above_inline_cost():
+    # coste pequeño pero por encima de inline_cost: run_budgeted no lo ejecuta en el hilo
+    res = run_budgeted(_pid, (), 10.0)
+    assert res.vector[0] != os.getpid()
+
+
+def test_isolated_process_is_killed_at_the_deadline():
+    start = time.monotonic()
+    res = run_budgeted(_sleeps, (30.0,), 10.0, Budget(wall_time=0.5))
+    assert res.error == "budget_exceeded"
+    assert res.details["budget"]["reason"] == "time"
+    assert time.monotonic() - start < 5.0
+
+
+def test_estimated_cost_over_budget_is_rejected_without_running():
+    res = run_budgeted(_fails, (), 1e12, Budget(max_cost=1e6))
+    assert res.error == "budget_exceeded"
+    assert res.details["budget"]["reason"] == "estimated_cost"
+
+
+def test_admission_is_bounded():
+    executor = ComputeExecutor(workers=1, queue_per_worker=2)
+    assert executor.admit() and executor.admit()
+    assert not executor.admit()
+    executor.release(2)
+    assert executor.info()["pending"] == 0 and executor.info()["rejected"] == 1
+
+
+async def _concurrent(executor, endpoint, args_list):
+    return await asyncio.gather(*(executor.run(endpoint, _counted, args, 1.0) for args in args_list))
+
+
+def test_identical_concurrent_requests_are_computed_once():
+    configure("test_single_flight", mode="inline", cached=False)
+    executor = ComputeExecutor(workers=1)
+    CALLS.clear()
+    results = asyncio.run(_concurrent(executor, "test_single_flight", [(1.0,)] * 5 + [(2.0,)]))
+    assert sorted(CALLS) == [1.0, 2.0]
+    assert [r.vector[0] for r in results] == [1.0] * 5 + [2.0]
+    assert executor.info()["coalesced"] == 4 and executor.info()["in_flight"] == 0
+
+
+def test_transient_errors_are_not_cached():
+    configure("test_transient", mode="inline", cached=True)
+    asyncio.run(ComputeExecutor(workers=1).run("test_transient", _fails, (), 1.0))
+    assert response_cache.get("test_transient", cache_key("test_transient", _fails, ())) is None
@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.expressionCompiler import ExpressionError, compile_expression
+
+
+@pytest.mark.parametrize("expr, value", [("0.5**2000 + x", 1.0), ("1.0001**5000", 1.0001 ** 5000), ("(1/2)**2000 + x", 1.0)])
+def test_representable_constant_powers_are_accepted(expr, value):
+    assert compile_expression(expr)(1.0) == pytest.approx(value)
+
+
+@pytest.mark.parametrize("expr", ["9**9**9", "2**9**9**9", "10**400 + x", "2**-10**9", "(1/2)**100000"])
+def test_huge_constant_powers_are_rejected(expr):
+    with pytest.raises(ExpressionError, match="potencia demasiado grande"):
+        compile_expression(expr)
+
+
+def test_huge_integer_literal_is_rejected():
+    with pytest.raises(ExpressionError, match="constante demasiado grande"):
+        compile_expression("1" + "0" * 400)
+
+
+def test_power_of_x_overflows_at_evaluation_instead_of_building_a_huge_integer():
+    f = compile_expression("x**100000")
+    with pytest.raises(OverflowError):
+        f(10)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "__import__('os')",
+        "x.__class__",
+        "(lambda: 1)()",
+        "[x for x in ()]",
+        "open('f')",
+        "'texto'",
+        "x if x else 1",
+        "x < 1",
+        "y + 1",
+        "sin(x=1)",
+        "True + x",
+        "x +",
+    ],
+)
+def test_constructions_outside_the_whitelist_are_rejected(expr):
+    with pytest.raises(ExpressionError):
+        compile_expression(expr)
+
+
+@pytest.mark.parametrize(
+    "expr, x, value",
+    [
+        ("x^2 - 2*x + 1", 3.0, 4.0),
+        ("sin(pi*x) + e", 0.5, 1.0 + 2.718281828459045),
+        ("log10(x) + sqrt(x) - abs(-x)", 100.0, -88.0),
+        ("-x % 3", 1.0, 2.0),
+    ],
+)
+def test_whitelisted_expressions_evaluate(expr, x, value):
+    assert compile_expression(expr)(x) == pytest.approx(value)
+
+
+def test_compiled_expressions_are_cached_and_detect_polynomials():
+    f = compile_expression("3*x^2 + 2*x + 1")
+    assert compile_expression("3*x^2 + 2*x + 1") is f
+    assert f.coefficients == [1.0, 2.0, 3.0]
+    assert f.evaluate_many([0.0, 1.0, 2.0]) == [1.0, 6.0, 17.0]
+    assert compile_expression("sin(x)").coefficients is None
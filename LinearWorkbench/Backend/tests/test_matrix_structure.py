@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.common import StepLog
+from core.matrixStructure import classify_structure, structured_determinant, structured_solve
+
+TRIDIAGONAL = [
+    [4.0, 1.0, 0.0, 0.0, 0.0],
+    [1.0, 4.0, 1.0, 0.0, 0.0],
+    [0.0, 1.0, 4.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0, 4.0, 1.0],
+    [0.0, 0.0, 0.0, 1.0, 4.0],
+]
+
+
+def _dense_det(m):
+    a = [row[:] for row in m]
+    n, det = len(a), 1.0
+    for c in range(n):
+        p = max(range(c, n), key=lambda i: abs(a[i][c]))
+        if a[p][c] == 0.0:
+            return 0.0
+        if p != c:
+            a[c], a[p] = a[p], a[c]
+            det = -det
+        det *= a[c][c]
+        for i in range(c + 1, n):
+            f = a[i][c] / a[c][c]
+            a[i] = [x - f * y for x, y in zip(a[i], a[c])]
+    return det
+
+
+@pytest.mark.parametrize(
+    "m, kind",
+    [
+        ([[2, 0], [0, 3]], "diagonal"),
+        ([[0, 1, 0], [0, 0, 1], [1, 0, 0]], "permutation"),
+        ([[1, 2, 3], [0, 4, 5], [0, 0, 6]], "upper_triangular"),
+        ([[1, 0, 0], [2, 3, 0], [4, 5, 6]], "lower_triangular"),
+        (TRIDIAGONAL, "banded"),
+        ([[1, 2], [3, 4]], "general"),
+    ],
+)
+def test_classify_structure(m, kind):
+    assert classify_structure(m).kind == kind
+
+
+@pytest.mark.parametrize(
+    "m, det",
+    [
+        ([[2, 0, 0], [0, 3, 0], [0, 0, 4]], 24.0),
+        ([[0, 1, 0], [0, 0, 1], [1, 0, 0]], 1.0),
+        ([[0, 1, 0], [1, 0, 0], [0, 0, 1]], -1.0),
+        ([[1, 2, 3], [0, 4, 5], [0, 0, 6]], 24.0),
+        (TRIDIAGONAL, _dense_det(TRIDIAGONAL)),
+    ],
+)
+def test_structured_determinant_known_answers(m, det):
+    assert structured_determinant(m, classify_structure(m), StepLog()) == pytest.approx(det)
+
+
+def test_general_matrix_has_no_shortcut():
+    m = [[1, 2], [3, 4]]
+    assert structured_determinant(m, classify_structure(m), StepLog()) is None
+
+
+@pytest.mark.parametrize(
+    "m",
+    [
+        [[2, 0, 0], [0, 4, 0], [0, 0, 5]],
+        [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
+        [[1, 2, 3], [0, 4, 5], [0, 0, 6]],
+        [[1, 0, 0], [2, 3, 0], [4, 5, 6]],
+        TRIDIAGONAL,
+    ],
+)
+def test_structured_solve_satisfies_the_system(m):
+    b = [1.0, -2.0, 3.0, 0.5, 4.0][: len(m)]
+    x = structured_solve(m, b, classify_structure(m), StepLog())
+    assert [sum(a * xi for a, xi in zip(row, x)) for row in m] == pytest.approx(b)
+
+
+def test_singular_triangular_matrix_falls_back():
+    m = [[1, 2], [0, 0]]
+    assert structured_solve(m, [1.0, 0.0], classify_structure(m), StepLog()) is None
@@ -0,0 +1,102 @@
+import io
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.matrixTransport import (
+    MSGPACK_MEDIA_TYPE,
+    NPY_MEDIA_TYPE,
+    MatrixFormatError,
+    decode_matrix,
+    encode_matrix,
+    encode_npy,
+    read_npy,
+)
+
+client = TestClient(app)
+
+A = [[1.5, -2.0, 3.25], [4.0, 0.1, -6.0]]
+
+
+@pytest.mark.parametrize("as_text", [False, True])
+def test_encoded_matrix_round_trip(as_text):
+    assert decode_matrix(encode_matrix(A, as_text=as_text)) == A
+
+
+@pytest.mark.parametrize("value, shape", [(A, [2, 3]), ([1.0, 2.0, 3.0], [3]), (7.5, []), ([[]], [1, 0])])
+def test_npy_round_trip(value, shape):
+    body = encode_npy(value)
+    meta = read_npy(body)
+    assert (len(body) - len(meta["data"])) % 64 == 0  # cabecera alineada como en NumPy
+    assert meta["shape"] == shape and meta["dtype"] == "<f8"
+    if len(shape) == 2:
+        assert decode_matrix(meta) == value
+
+
+def test_npy_is_readable_by_numpy_and_back():
+    np = pytest.importorskip("numpy")
+    assert np.load(io.BytesIO(encode_npy(A))).tolist() == A
+    for arr in (np.array(A), np.asfortranarray(A), np.array(A, dtype=">f8"), np.array([[1, 2], [3, 4]], dtype="<i4")):
+        buffer = io.BytesIO()
+        np.save(buffer, arr)
+        assert decode_matrix(read_npy(buffer.getvalue())) == arr.astype(float).tolist()
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [
+        {"shape": [2], "data": ""},
+        {"shape": [2, 2], "dtype": "<c16", "data": b""},
+        {"shape": [2, 2], "data": b"\x00" * 8},
+        {"shape": [1, 1], "data": "no es base64!"},
+    ],
+)
+def test_malformed_encoded_matrices_are_rejected(encoded):
+    with pytest.raises(MatrixFormatError):
+        decode_matrix(encoded)
+
+
+def test_not_an_npy_body():
+    with pytest.raises(MatrixFormatError):
+        read_npy(b"\x93NUMPY\x09\x00" + struct.pack("<H", 0))
+
+
+def test_npy_request_and_response():
+    response = client.post(
+        "/matrix/operate?operation=transpose",
+        content=encode_npy(A),
+        headers={"Content-Type": NPY_MEDIA_TYPE, "Accept": NPY_MEDIA_TYPE},
+    )
+    assert response.headers["content-type"] == NPY_MEDIA_TYPE
+    assert decode_matrix(read_npy(response.content)) == [list(col) for col in zip(*A)]
+
+
+def test_base64_result_encoding():
+    body = client.post(
+        "/matrix/operate", json={"operation": "transpose", "a": {"data": A}, "matrix_encoding": "base64"}
+    ).json()
+    assert decode_matrix(body["result"]) == [list(col) for col in zip(*A)]
+
+
+def test_unsupported_content_type_is_415():
+    response = client.post("/determinants/calculate", content=b"x", headers={"Content-Type": "text/csv"})
+    assert response.status_code == 415
+
+
+def test_msgpack_round_trip():
+    msgpack = pytest.importorskip("msgpack")
+    request = {"operation": "multiply", "a": {"data": encode_matrix(A)}, "b": {"data": [[1.0], [1.0], [1.0]]}}
+    response = client.post(
+        "/matrix/operate",
+        content=msgpack.packb(request, use_bin_type=True),
+        headers={"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE},
+    )
+    body = msgpack.unpackb(response.content, raw=False)
+    assert decode_matrix(body["result"]) == [[2.75], [pytest.approx(-1.9)]]
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.nonlinearSystems import solve_nonlinear_system
+
+client = TestClient(app)
+
+# circunferencia x² + y² = 4 y la recta y = x: raíz (√2, √2) desde (1, 2)
+CIRCLE = ["x^2 + y^2 - 4", "x - y"]
+ROOT = [2 ** 0.5, 2 ** 0.5]
+
+
+@pytest.mark.parametrize("method", ["newton", "chord", "broyden"])
+def test_methods_converge_to_the_known_root(method):
+    res = solve_nonlinear_system(CIRCLE, [1.0, 2.0], method=method, tol=1e-12, max_iter=100, verbosity="none")
+    assert res.error is None
+    assert res.vector == pytest.approx(ROOT, abs=1e-10)
+
+
+def test_chord_and_broyden_factorize_less_than_newton():
+    runs = {
+        method: solve_nonlinear_system(CIRCLE, [1.0, 2.0], method=method, tol=1e-12, max_iter=100, verbosity="none")
+        for method in ("newton", "chord", "broyden")
+    }
+    newton = runs["newton"].details
+    assert newton["factorizations"] == newton["iterations"]
+    assert runs["broyden"].details["factorizations"] == 1
+    assert runs["broyden"].details["jacobian_evaluations"] == 1
+    assert runs["chord"].details["factorizations"] < runs["chord"].details["iterations"]
+
+
+def test_linear_system_is_solved_in_one_newton_step():
+    res = solve_nonlinear_system(["2*x + y - 3", "x - y"], [0.0, 0.0], tol=1e-12, verbosity="none")
+    assert res.vector == pytest.approx([1.0, 1.0])
+    assert res.details["iterations"] <= 2
+
+
+def test_singular_jacobian():
+    res = solve_nonlinear_system(["x + y - 1", "2*x + 2*y - 2"], [0.0, 0.0], verbosity="none")
+    assert res.error == "singular_jacobian"
+
+
+def test_shape_errors():
+    assert solve_nonlinear_system(["x"], [0.0, 0.0]).error == "not_square"
+    response = client.post("/numerical/nonlinear-system", json={"exprs": ["x +", "y"], "x0": [0, 0]})
+    assert response.json()["error"] == "parse_error"
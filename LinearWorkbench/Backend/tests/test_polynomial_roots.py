@@ -0,0 +1,49 @@
+import cmath
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.numericalConcepts import solve_polynomial_roots
+from core.polynomials import horner, polynomial_roots
+
+client = TestClient(app)
+
+
+def test_companion_matrix_roots_known_answer():
+    # (x − 1)(x − 2)(x − 3)
+    result = polynomial_roots([-6.0, 11.0, -6.0, 1.0])
+    assert sorted(result.real) == pytest.approx([1.0, 2.0, 3.0], abs=1e-10)
+    assert result.complex == []
+
+
+def test_complex_conjugate_roots():
+    res = solve_polynomial_roots("x^4 - 1", verbosity="none")
+    assert sorted(res.vector) == pytest.approx([-1.0, 1.0], abs=1e-12)
+    assert sorted(tuple(z) for z in res.details["complex_roots"]) == pytest.approx([(0.0, -1.0), (0.0, 1.0)], abs=1e-12)
+
+
+def test_roots_of_unity_of_high_degree():
+    n = 60
+    coefficients = [-1.0] + [0.0] * (n - 1) + [1.0]
+    roots = polynomial_roots(coefficients).roots
+    assert len(roots) == n
+    assert max(abs(horner(coefficients, z)) for z in roots) < 1e-10
+    assert all(abs(abs(z) - 1.0) < 1e-12 for z in roots)
+    assert sum(roots) == pytest.approx(0.0, abs=1e-10)
+    assert cmath.isclose(roots[0] ** n, 1.0, abs_tol=1e-10)
+
+
+@pytest.mark.parametrize(
+    "expr, error",
+    [("sin(x)", "not_polynomial"), ("x^200 - 1", "degree_too_large"), ("5", "constant_polynomial")],
+)
+def test_polynomial_roots_errors(expr, error):
+    response = client.post("/numerical/roots/polynomial", json={"expr": expr})
+    assert response.status_code == 200
+    assert response.json()["error"] == error
@@ -0,0 +1,31 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.responseCache import cache_key, response_cache
+from core.vectorLab import check_basis, check_independence
+
+client = TestClient(app)
+
+
+def test_routes_with_same_args_do_not_share_cache_entries():
+    response_cache.clear()
+    vectors = {"vectors": [[1, 0, 0], [0, 1, 0]]}
+    independence = client.post("/vectors/independence", json=vectors).json()
+    basis = client.post("/vectors/basis", json=vectors).json()
+
+    response_cache.clear()
+    fresh_basis = client.post("/vectors/basis", json=vectors).json()
+
+    assert independence["solution_type"] == "unique"
+    assert basis == fresh_basis
+    assert basis["solution_type"] is None
+
+
+def test_cache_key_includes_function():
+    args = ([[1.0, 0.0]], None, "full")
+    assert cache_key("vectors", check_independence, args) != cache_key("vectors", check_basis, args)
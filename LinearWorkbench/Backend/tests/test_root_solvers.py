@@ -0,0 +1,80 @@
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.numericalConcepts import (
+    solve_bisection,
+    solve_brent,
+    solve_false_position,
+    solve_newton_bisection,
+    solve_secant,
+)
+
+client = TestClient(app)
+
+ROOT = 1.5213797068045676  # x³ − x − 2
+
+
+@pytest.mark.parametrize("solver", [solve_brent, solve_newton_bisection, solve_bisection, solve_false_position])
+def test_bracketing_solvers_find_known_root(solver):
+    res = solver("x**3 - x - 2", 1, 2, 1e-10, 200, verbosity="none")
+    assert res.error is None
+    assert res.vector[0] == pytest.approx(ROOT, abs=1e-8)
+
+
+def test_brent_needs_fewer_iterations_than_bisection():
+    brent = solve_brent("cos(x) - x", 0, 1, 1e-12, 200, verbosity="none")
+    bisection = solve_bisection("cos(x) - x", 0, 1, 1e-12, 200, verbosity="none")
+    assert brent.vector[0] == pytest.approx(0.7390851332151607, abs=1e-10)
+    assert brent.details["iterations"] < bisection.details["iterations"]
+
+
+@pytest.mark.parametrize("solver", [solve_brent, solve_newton_bisection])
+def test_same_sign_bracket_is_rejected(solver):
+    assert solver("x**2 + 1", -1, 1, 1e-10, 50, verbosity="none").error == "same_sign"
+
+
+def test_newton_bisection_exact_endpoint():
+    res = solve_newton_bisection("x - 2", 2, 5, 1e-10, 50, verbosity="none")
+    assert res.vector == [2] and res.details["iterations"] == 0
+
+
+@pytest.mark.parametrize(
+    "solver, args",
+    [
+        (solve_brent, ("1/x", -1, 2)),
+        (solve_newton_bisection, ("log(x)", -1, 2)),
+        (solve_bisection, ("log(x)", -1, 2)),
+        (solve_false_position, ("log(x)", -1, 2)),
+        (solve_secant, ("log(x)", -1, 2)),
+        (solve_bisection, ("x**0.5 - 1", -1, 4)),
+    ],
+)
+def test_evaluation_outside_the_domain_is_a_math_error(solver, args):
+    res = solver(*args, 1e-10, 50, verbosity="full")
+    assert res.error == "math_error"
+    assert res.steps[-1].startswith("Error matemático al evaluar")
+
+
+def test_standalone_and_batch_agree_on_math_errors():
+    standalone = client.post("/numerical/brent", json={"expr": "1/x", "a": -1, "b": 2, "tol": 1e-10, "max_iter": 50})
+    assert standalone.status_code == 200
+    assert standalone.json()["error"] == "math_error"
+    batch = client.post("/numerical/batch", json={"jobs": [{"method": "brent", "expr": "1/x", "a": -1, "b": 2}]})
+    first = batch.text.splitlines()[0]
+    assert '"error": "math_error"' in first
+
+
+def test_false_position_zero_denominator():
+    # f(a) = f(b) = 0: no hay recta secante; se informa el extremo a
+    res = solve_false_position("x**2 - 1", -1, 1, 1e-10, 50, verbosity="summary")
+    assert res.error is None
+    assert math.isclose(res.vector[0], -1.0)
+    assert "Denominador cercano a cero" in res.steps[-3]
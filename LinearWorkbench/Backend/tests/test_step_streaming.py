@@ -0,0 +1,59 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+
+client = TestClient(app)
+
+MATRIX = {"matrix": [[2, 1], [1, 3]], "method": "cofactors"}
+
+
+def ndjson_events(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def test_ndjson_framing_ends_with_the_result():
+    response = client.post("/determinants/calculate/stream", json=MATRIX)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = ndjson_events(response)
+    steps = [e for e in events if e["type"] == "step"]
+    assert steps and [e["index"] for e in steps] == list(range(len(steps)))
+    assert events[-1]["type"] == "result" and events[-1]["determinant"] == 5
+    assert "steps" not in events[-1]
+
+
+def test_stream_steps_match_the_plain_endpoint():
+    plain = client.post("/determinants/calculate", json=MATRIX).json()
+    streamed = [e["text"] for e in ndjson_events(client.post("/determinants/calculate/stream", json=MATRIX)) if e["type"] == "step"]
+    assert streamed == plain["steps"]
+
+
+def test_sse_framing():
+    response = client.post("/determinants/calculate/stream", json=MATRIX, headers={"Accept": "text/event-stream"})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    blocks = [b for b in response.text.split("\n\n") if b]
+    for block in blocks:
+        event, data = block.split("\n")
+        assert event.startswith("event: ") and data.startswith("data: ")
+        assert json.loads(data[len("data: "):])["type"] == event[len("event: "):]
+    assert blocks[-1].startswith("event: result")
+
+
+def test_verbosity_none_streams_only_the_result():
+    events = ndjson_events(client.post("/determinants/calculate/stream", json={**MATRIX, "verbosity": "none"}))
+    assert [e["type"] for e in events] == ["result"]
+    assert events[0]["determinant"] == 5
+
+
+def test_exception_inside_the_stream_still_sends_the_result():
+    # las cabeceras 200 ya salieron: el error llega como evento final
+    response = client.post("/determinants/calculate/stream", json={"matrix": [[1, 2], [3]]})
+    assert response.status_code == 200
+    events = ndjson_events(response)
+    assert events[-1]["type"] == "result"
+    assert events[-1]["error"] == "internal_error"
@@ -0,0 +1,85 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.numericalRank import rank_revealing_qr
+from core.orthonormalization import householder_orthonormalize, modified_gram_schmidt
+from core.vectorLab import check_basis, check_independence
+
+client = TestClient(app)
+
+
+def test_pivoted_qr_rank_and_dependency_coefficients():
+    # v3 = 2·v1 + v2
+    analysis = rank_revealing_qr([[1, 0, 1], [0, 1, 1], [2, 1, 3]])
+    assert analysis.rank == 2
+    assert len(analysis.dependent) == 1
+    independent = analysis.independent
+    coefficients = dict(zip(independent, analysis.coefficients[0]))
+    vectors = [[1, 0, 1], [0, 1, 1], [2, 1, 3]]
+    target = vectors[analysis.dependent[0]]
+    combination = [sum(coefficients[j] * vectors[j][i] for j in independent) for i in range(3)]
+    assert combination == pytest.approx(target)
+
+
+def test_rank_ignores_perturbations_below_the_tolerance():
+    assert rank_revealing_qr([[1.0, 1.0], [1.0, 1.0 + 1e-17]]).rank == 1
+    assert rank_revealing_qr([[1.0, 1.0], [1.0, 1.0 + 1e-6]]).rank == 2
+
+
+def test_independence_and_basis_known_answers():
+    assert check_independence([[1, 0], [0, 1]]).solution_type == "unique"
+    assert check_independence([[1, 2], [2, 4]]).solution_type == "infinite"
+    assert check_basis([[1, 2], [2, 4]]).error == "not_basis"
+    assert check_basis([[1, 0, 0], [0, 1, 0]]).error == "wrong_cardinality"
+
+
+def test_echelon_trace_uses_the_qr_tolerance():
+    res = check_independence([[1, 2, 3], [4, 5, 6], [7, 8, 9]], show_steps=True)
+    assert res.details["rank"] == 2
+    # la forma escalonada tiene una fila nula: la misma conclusión que el QR
+    assert all(abs(x) < 1e-9 for x in res.matrix[2])
+    assert not any("solo ilustrativa" in s for s in res.steps)
+
+
+@pytest.mark.parametrize("route", ["/vectors/independence", "/vectors/basis"])
+def test_ragged_vectors_are_a_dimension_mismatch(route):
+    response = client.post(route, json={"vectors": [[1, 2], [3]]})
+    assert response.status_code == 200
+    assert response.json()["error"] == "dimension_mismatch"
+
+
+@pytest.mark.parametrize("method", ["mgs", "householder"])
+def test_orthonormalize_known_answer(method):
+    response = client.post("/vectors/orthonormalize", json={"vectors": [[3, 4, 0], [1, 0, 0], [4, 8, 0]], "method": method})
+    body = response.json()
+    assert body["error"] is None and body["rank"] == 2
+    q1, q2 = body["basis"]
+    assert [abs(x) for x in q1] == pytest.approx([0.6, 0.8, 0.0])
+    assert sum(a * b for a, b in zip(q1, q2)) == pytest.approx(0.0, abs=1e-12)
+    assert body["orthogonality_loss"] < 1e-12
+
+
+def test_mgs_keeps_orthogonality_on_an_ill_conditioned_set():
+    eps = 1e-8
+    vectors = [[1, eps, 0, 0], [1, 0, eps, 0], [1, 0, 0, eps]]
+    for method in ("mgs", "householder"):
+        body = client.post("/vectors/orthonormalize", json={"vectors": vectors, "method": method}).json()
+        assert body["rank"] == 3
+        assert body["orthogonality_loss"] < 1e-10
+
+
+def test_dependent_vectors_are_dropped_with_their_indices():
+    # v2 = 2·v1: MGS conserva el primero de cada grupo; Householder, los pivotes del QR
+    vectors = [[1, 1, 0], [2, 2, 0], [0, 0, 3]]
+    assert modified_gram_schmidt(vectors).indices == [0, 2]
+    result = householder_orthonormalize(vectors)
+    assert len(result.basis) == 2 and result.indices[-1] == 2
+    q1 = result.basis[0]
+    assert abs(q1[0]) == pytest.approx(2 ** -0.5) and q1[0] == pytest.approx(q1[1])
@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app import app
+from core.common import StepLog
+
+client = TestClient(app)
+
+MATRIX = [[2, 1, 0, 1], [1, 3, 1, 0], [0, 1, 4, 1], [1, 0, 1, 5]]
+
+
+def test_steplog_levels():
+    for verbosity, enabled, detailed in (("none", False, False), ("summary", True, False), ("full", True, True)):
+        log = StepLog(["a"], verbosity=verbosity)
+        log.append("b")
+        assert (log.enabled, log.detailed, log.verbosity) == (enabled, detailed, verbosity)
+        assert list(log) == (["a", "b"] if enabled else [])
+
+
+@pytest.mark.parametrize(
+    "route, payload, value",
+    [
+        ("/determinants/calculate", {"matrix": MATRIX, "method": "cofactors"}, "determinant"),
+        ("/numerical/bisection", {"expr": "x**2 - 2", "a": 0, "b": 2, "tol": 1e-10, "max_iter": 100}, "value"),
+    ],
+)
+def test_verbosity_changes_only_the_steps(route, payload, value):
+    bodies = {v: client.post(route, json={**payload, "verbosity": v}).json() for v in ("none", "summary", "full")}
+    assert bodies["none"][value] == bodies["summary"][value] == bodies["full"][value]
+    assert bodies["none"]["steps"] == []
+    assert 0 < len(bodies["summary"]["steps"]) < len(bodies["full"]["steps"])
+    assert set(bodies["summary"]["steps"]) <= set(bodies["full"]["steps"])
+
+
+def test_errors_are_reported_with_verbosity_none():
+    body = client.post("/numerical/bisection", json={"expr": "x**2 + 1", "a": 0, "b": 2, "tol": 1e-6, "max_iter": 10, "verbosity": "none"}).json()
+    assert body["error"] == "same_sign"
@@ -2,11 +2,16 @@
 # Lógica optimizada usando numpy — compatible con la GUI original (mismos nombres/métodos).
 # Mantiene logs paso-a-paso y comprobaciones tal como en tu jjj.py original.
 
-from typing import List, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 import numpy as np
 import sys
 
 EPS = 1e-12
+# por encima de este número de entradas (k·n) no se muestra la eliminación paso a paso por defecto
+PASOS_MAX_ENTRADAS = 100
+MAX_VECTORES_LISTADOS = 50
+# hasta este número de vectores la asociativa se comprueba sobre todas las k³ ternas
+MAX_VECTORES_TERNAS = 20
 
 def _fmt_row(row: np.ndarray) -> str:
     return "  ".join(f"{float(x):.4f}" for x in row)
@@ -15,6 +20,263 @@ def _fmt_matrix(mat: np.ndarray) -> str:
     return "\n".join(_fmt_row(mat[i, :]) for i in range(mat.shape[0]))
 
 
+# ============================
+# Eventos de los algoritmos paso a paso
+# ============================
+class EventoPaso:
+    """Un paso producido por un algoritmo paso a paso (iter_pasos).
+
+    tipo: "inicio" (encabezado y datos), "operacion" (operación de fila o término de una
+    expansión), "atajo" (resolución por estructura), "resultado" o "error" (entrada no válida).
+    Las operaciones de fila guardan el número de paso, la operación y una copia de la matriz
+    en ese momento; su texto solo se formatea si se lee, así que cortar o muestrear el
+    registro no paga el formateo de los pasos descartados.
+    """
+
+    __slots__ = ("tipo", "paso", "operacion", "matriz", "valor", "_texto", "_formato")
+
+    def __init__(self, tipo: str, texto: Optional[str] = None, paso: Optional[int] = None,
+                 operacion: Optional[str] = None, matriz: Optional[np.ndarray] = None,
+                 valor: Optional[float] = None,
+                 formato: Optional[Callable[[int, str, np.ndarray], str]] = None):
+        self.tipo = tipo
+        self.paso = paso
+        self.operacion = operacion
+        self.matriz = matriz
+        self.valor = valor
+        self._texto = texto
+        self._formato = formato
+
+    @property
+    def texto(self) -> str:
+        if self._texto is None:
+            self._texto = self._formato(self.paso, self.operacion, self.matriz)
+        return self._texto
+
+    def __str__(self) -> str:
+        return self.texto
+
+    def __repr__(self) -> str:
+        return f"EventoPaso({self.tipo!r}, paso={self.paso}, operacion={self.operacion!r})"
+
+
+def unir_pasos(eventos: Iterable[EventoPaso]) -> str:
+    """El registro completo en texto, tal como lo devolvían los métodos originales."""
+    return "".join(e.texto for e in eventos)
+
+
+# ============================
+# Detección de estructura
+# ============================
+class EstructuraMatriz:
+    """Resultado de clasificar una matriz cuadrada (se calcula una vez y se guarda en el objeto)."""
+
+    NOMBRES = {
+        "diagonal": "diagonal",
+        "permutacion": "de permutación",
+        "triangular_superior": "triangular superior",
+        "triangular_inferior": "triangular inferior",
+        "banda": "de banda",
+        "general": "general (densa)",
+    }
+
+    def __init__(self, tipo: str, ancho_inferior: int, ancho_superior: int,
+                 simetrica: bool, permutacion: np.ndarray = None):
+        self.tipo = tipo
+        self.ancho_inferior = ancho_inferior
+        self.ancho_superior = ancho_superior
+        self.simetrica = simetrica
+        # permutación como arreglo de índices: A[i, permutacion[i]] = 1
+        self.permutacion = permutacion
+
+    def __str__(self) -> str:
+        texto = EstructuraMatriz.NOMBRES.get(self.tipo, self.tipo)
+        if self.tipo == "banda":
+            texto += f" (p={self.ancho_inferior}, q={self.ancho_superior})"
+        if self.simetrica and self.tipo != "diagonal":
+            texto += ", simétrica"
+        return texto
+
+    def es_especial(self) -> bool:
+        return self.tipo != "general"
+
+
+def clasificar_estructura(A: np.ndarray, tol: float = EPS) -> EstructuraMatriz:
+    """Clasifica una matriz cuadrada: diagonal, permutación, triangular, banda o general.
+
+    Usa los anchos de banda inferior (p) y superior (q): diagonal ⇔ p = q = 0,
+    triangular superior ⇔ p = 0, triangular inferior ⇔ q = 0, banda ⇔ p + q + 1 < n.
+    """
+    n = A.shape[0]
+    if A.ndim != 2 or n == 0 or A.shape[1] != n:
+        return EstructuraMatriz("general", max(n - 1, 0), max(n - 1, 0), False)
+
+    filas, cols = np.nonzero(np.abs(A) > tol)
+    diferencia = filas - cols
+    p = int(diferencia.max()) if diferencia.size and diferencia.max() > 0 else 0
+    q = int(-diferencia.min()) if diferencia.size and diferencia.min() < 0 else 0
+    simetrica = bool(np.allclose(A, A.T, atol=tol, rtol=0.0))
+
+    if p == 0 and q == 0:
+        return EstructuraMatriz("diagonal", 0, 0, True)
+
+    # permutación: exactamente un 1 por fila y por columna, el resto ceros
+    if filas.size == n and np.array_equal(filas, np.arange(n)) and np.all(np.abs(A[filas, cols] - 1.0) < tol):
+        if np.unique(cols).size == n:
+            return EstructuraMatriz("permutacion", p, q, simetrica, permutacion=cols.astype(np.intp))
+
+    if p == 0:
+        return EstructuraMatriz("triangular_superior", p, q, simetrica)
+    if q == 0:
+        return EstructuraMatriz("triangular_inferior", p, q, simetrica)
+    if p + q + 1 < n:
+        return EstructuraMatriz("banda", p, q, simetrica)
+    return EstructuraMatriz("general", p, q, simetrica)
+
+
+def _signo_permutacion(perm: np.ndarray) -> int:
+    """Signo de la permutación por descomposición en ciclos (O(n))."""
+    visitado = np.zeros(perm.size, dtype=bool)
+    signo = 1
+    for inicio in range(perm.size):
+        if visitado[inicio]:
+            continue
+        largo = 0
+        j = inicio
+        while not visitado[j]:
+            visitado[j] = True
+            j = int(perm[j])
+            largo += 1
+        if largo % 2 == 0:
+            signo = -signo
+    return signo
+
+
+def _eliminacion_banda(A: np.ndarray, b: np.ndarray, p: int, q: int) -> Tuple[np.ndarray, float]:
+    """Eliminación gaussiana de banda con pivoteo parcial en O(n·p·(p+q)).
+
+    Devuelve (x, det). Con pivoteo el ancho superior crece a lo sumo hasta p + q.
+    Si b es None solo se calcula el determinante. Lanza ZeroDivisionError si es singular.
+    """
+    U = A.astype(float, copy=True)
+    y = None if b is None else b.astype(float, copy=True)
+    n = U.shape[0]
+    q_ext = p + q
+    det = 1.0
+    for k in range(n):
+        fin_fila = min(n, k + p + 1)
+        fin_col = min(n, k + q_ext + 1)
+        piv = k + int(np.argmax(np.abs(U[k:fin_fila, k])))
+        if abs(U[piv, k]) < EPS:
+            raise ZeroDivisionError("pivote nulo")
+        if piv != k:
+            U[[k, piv], k:fin_col] = U[[piv, k], k:fin_col]
+            if y is not None:
+                y[[k, piv]] = y[[piv, k]]
+            det = -det
+        det *= U[k, k]
+        if fin_fila > k + 1:
+            factores = U[k + 1:fin_fila, k] / U[k, k]
+            U[k + 1:fin_fila, k:fin_col] -= factores[:, None] * U[k, None, k:fin_col]
+            if y is not None:
+                y[k + 1:fin_fila] -= factores * y[k]
+    if y is None:
+        return None, det
+    x = np.zeros(n, dtype=float)
+    for k in range(n - 1, -1, -1):
+        fin_col = min(n, k + q_ext + 1)
+        x[k] = (y[k] - U[k, k + 1:fin_col].dot(x[k + 1:fin_col])) / U[k, k]
+    return x, det
+
+
+def determinante_estructurado(A: np.ndarray, est: EstructuraMatriz) -> Tuple[float, str]:
+    """Determinante por el atajo que corresponde a la estructura (None si no hay atajo)."""
+    if est.tipo in ("diagonal", "triangular_superior", "triangular_inferior"):
+        diag = np.diag(A)
+        return float(np.prod(diag)), (
+            f"Atajo: matriz {est} → det(A) = producto de la diagonal (O(n)).\n"
+            f"  det(A) = {' × '.join(f'{float(d):.4f}' for d in diag)}\n")
+    if est.tipo == "permutacion":
+        signo = _signo_permutacion(est.permutacion)
+        return float(signo), (
+            f"Atajo: matriz {est} → det(A) = signo de la permutación (O(n)).\n"
+            f"  Permutación (índices de columna): {', '.join(str(int(c) + 1) for c in est.permutacion)}\n"
+            f"  Signo = {signo:+d}\n")
+    if est.tipo == "banda":
+        try:
+            _, det = _eliminacion_banda(A, None, est.ancho_inferior, est.ancho_superior)
+        except ZeroDivisionError:
+            det = 0.0
+        return float(det), (
+            f"Atajo: matriz {est} → eliminación de banda O(n·p·(p+q)); "
+            f"det(A) = ± producto de los pivotes.\n")
+    return None, ""
+
+
+def resolver_estructurado(A: np.ndarray, b: np.ndarray, est: EstructuraMatriz) -> Tuple[np.ndarray, str]:
+    """Resuelve Ax = b con el núcleo especializado. Devuelve (None, "") si no aplica o es singular."""
+    n = A.shape[0]
+    diag = np.diag(A)
+    if est.tipo in ("diagonal", "triangular_superior", "triangular_inferior") and np.any(np.abs(diag) < EPS):
+        return None, ""
+
+    if est.tipo == "diagonal":
+        x = b / diag
+        log = f"Atajo: matriz de coeficientes {est} → xᵢ = bᵢ / aᵢᵢ (O(n)).\n"
+        log += "".join(f"  x{i + 1} = {b[i]:.4f} / {diag[i]:.4f} = {x[i]:.4f}\n" for i in range(n))
+        return x, log
+
+    if est.tipo == "permutacion":
+        x = np.empty(n, dtype=float)
+        x[est.permutacion] = b
+        log = f"Atajo: matriz de coeficientes {est} → x[π(i)] = bᵢ (O(n), sin aritmética).\n"
+        log += "".join(f"  x{int(est.permutacion[i]) + 1} = b{i + 1} = {b[i]:.4f}\n" for i in range(n))
+        return x, log
+
+    if est.tipo == "triangular_superior":
+        x = np.zeros(n, dtype=float)
+        log = f"Atajo: matriz de coeficientes {est} → sustitución regresiva (O(n²)).\n"
+        for i in range(n - 1, -1, -1):
+            x[i] = (b[i] - A[i, i + 1:].dot(x[i + 1:])) / A[i, i]
+            log += f"  x{i + 1} = ({b[i]:.4f} − Σ a{i + 1}ⱼxⱼ) / {A[i, i]:.4f} = {x[i]:.4f}\n"
+        return x, log
+
+    if est.tipo == "triangular_inferior":
+        x = np.zeros(n, dtype=float)
+        log = f"Atajo: matriz de coeficientes {est} → sustitución progresiva (O(n²)).\n"
+        for i in range(n):
+            x[i] = (b[i] - A[i, :i].dot(x[:i])) / A[i, i]
+            log += f"  x{i + 1} = ({b[i]:.4f} − Σ a{i + 1}ⱼxⱼ) / {A[i, i]:.4f} = {x[i]:.4f}\n"
+        return x, log
+
+    if est.tipo == "banda":
+        try:
+            x, _ = _eliminacion_banda(A, b, est.ancho_inferior, est.ancho_superior)
+        except ZeroDivisionError:
+            return None, ""
+        log = f"Atajo: matriz de coeficientes {est} → eliminación de banda O(n·p·(p+q)).\n"
+        log += "".join(f"  x{i + 1} = {x[i]:.4f}\n" for i in range(n))
+        return x, log
+
+    if est.simetrica:
+        # simétrica: intentamos Cholesky (n³/3); si no es definida positiva seguimos con Gauss-Jordan
+        try:
+            L = np.linalg.cholesky(A)
+        except np.linalg.LinAlgError:
+            return None, ""
+        y = np.zeros(n, dtype=float)
+        for i in range(n):
+            y[i] = (b[i] - L[i, :i].dot(y[:i])) / L[i, i]
+        x = np.zeros(n, dtype=float)
+        for i in range(n - 1, -1, -1):
+            x[i] = (y[i] - L[i + 1:, i].dot(x[i + 1:])) / L[i, i]
+        log = "Atajo: matriz de coeficientes simétrica definida positiva → Cholesky A = LLᵀ (n³/3).\n"
+        log += "".join(f"  x{i + 1} = {x[i]:.4f}\n" for i in range(n))
+        return x, log
+
+    return None, ""
+
+
 # ============================
 # Núcleo de cálculo (modelo)
 # ============================
@@ -27,14 +289,49 @@ class SistemaLineal:
             self.homogeneo = True
         else:
             self.homogeneo = bool(np.all(np.abs(self.matriz[:, -1]) < EPS))
+        self._estructura = None
+
+    def estructura(self) -> EstructuraMatriz:
+        """Estructura de la matriz de coeficientes (se clasifica una sola vez)."""
+        if self._estructura is None:
+            self._estructura = clasificar_estructura(self.matriz[:, :-1])
+        return self._estructura
+
+    def _atajo_estructurado(self) -> str:
+        """Si A es cuadrada con estructura especial y no singular, resuelve sin Gauss-Jordan.
+
+        Deja self.matriz en la forma reducida [I | x] para que la interpretación
+        y columnas_pivote funcionen igual que tras la eliminación completa.
+        """
+        m, n_tot = self.matriz.shape
+        if m != n_tot - 1:
+            return None
+        est = self.estructura()
+        if not est.es_especial() and not est.simetrica:
+            return None
+        x, log_atajo = resolver_estructurado(self.matriz[:, :-1], self.matriz[:, -1], est)
+        if x is None:
+            return None
+        self.matriz = np.hstack([np.eye(m), x.reshape(-1, 1)])
+        log = f"Estructura detectada: matriz {est}.\n" + log_atajo + "\n"
+        log += self._imprimir_matriz(1, "Forma reducida [I | x] obtenida por el atajo")
+        return log
 
     def _imprimir_matriz(self, paso: int, operacion: str) -> str:
+        return SistemaLineal._texto_paso(paso, operacion, self.matriz)
+
+    @staticmethod
+    def _texto_paso(paso: int, operacion: str, matriz: np.ndarray) -> str:
         texto = f"Paso {paso} ({operacion}):\n"
         # formateamos cada fila a 4 decimales como en original
-        for fila in self.matriz:
+        for fila in matriz:
             texto += "  ".join(f"{valor:.4f}" for valor in fila) + "\n"
         return texto + "\n"
 
+    def _evento_fila(self, paso: int, operacion: str) -> EventoPaso:
+        return EventoPaso("operacion", paso=paso, operacion=operacion, matriz=self.matriz.copy(),
+                          formato=SistemaLineal._texto_paso)
+
     def eliminacion_gaussiana(self) -> str:
         """Gauss-Jordan completo con logs e interpretación final (compatibilidad con jjj.py)."""
         return self._gauss_jordan(log_interpretar=True)
@@ -44,15 +341,30 @@ class SistemaLineal:
         return self._gauss_jordan(log_interpretar=False)
 
     def _gauss_jordan(self, log_interpretar: bool) -> str:
+        return unir_pasos(self.iter_pasos(log_interpretar))
+
+    def iter_pasos(self, log_interpretar: bool = True) -> Iterator[EventoPaso]:
+        """Gauss-Jordan como generador: cada operación de fila se produce al hacerla.
+
+        La eliminación avanza solo mientras se consume; si se deja a medias, self.matriz
+        queda en el estado del último paso producido.
+        """
         if self.matriz.size == 0 or self.matriz.shape[1] == 0:
-            return "Matriz no válida."
+            yield EventoPaso("error", "Matriz no válida.")
+            return
+
+        log = self._atajo_estructurado()
+        if log is not None:
+            yield EventoPaso("atajo", log)
+            if log_interpretar:
+                yield EventoPaso("resultado", self._interpretar_resultado())
+            return
 
         A = self.matriz  # view to work with
         m, n_tot = A.shape
         n_vars = n_tot - 1
 
         paso = 1
-        log = ""
         fila_actual = 0
 
         # Iterar columnas de variables
@@ -72,14 +384,14 @@ class SistemaLineal:
             # intercambio si necesario
             if fila_actual != max_rel_idx:
                 A[[fila_actual, max_rel_idx], :] = A[[max_rel_idx, fila_actual], :]
-                log += self._imprimir_matriz(paso, f"Intercambio f{fila_actual + 1} ↔ f{max_rel_idx + 1}")
+                yield self._evento_fila(paso, f"Intercambio f{fila_actual + 1} ↔ f{max_rel_idx + 1}")
                 paso += 1
 
             pivote = A[fila_actual, col]
             if abs(pivote) > EPS:
                 # normalizar fila de pivote
                 A[fila_actual, :] = A[fila_actual, :] / pivote
-                log += self._imprimir_matriz(paso, f"f{fila_actual + 1} ← (1/{pivote:.4f}) · f{fila_actual + 1}")
+                yield self._evento_fila(paso, f"f{fila_actual + 1} ← (1/{pivote:.4f}) · f{fila_actual + 1}")
                 paso += 1
 
             # eliminar en forma vectorizada: hacer cero columna 'col' en todas las otras filas
@@ -89,21 +401,23 @@ class SistemaLineal:
                 # A[mask, :] -= factors[mask, None] * A[fila_actual, None, :]
                 A[mask, :] = A[mask, :] - factors[mask, None] * A[fila_actual, None, :]
                 # Para mantener log estilo original: un paso por fila modificada
+                # (todos muestran la misma matriz, así que comparten la copia)
+                instantanea = A.copy()
                 for i in np.nonzero(mask)[0]:
                     factor = factors[i]
-                    log += self._imprimir_matriz(paso, f"f{i + 1} ← f{i + 1} − ({factor:.4f}) · f{fila_actual + 1}")
+                    yield EventoPaso("operacion", paso=paso, matriz=instantanea,
+                                     operacion=f"f{i + 1} ← f{i + 1} − ({factor:.4f}) · f{fila_actual + 1}",
+                                     formato=SistemaLineal._texto_paso)
                     paso += 1
 
             fila_actual += 1
 
         if log_interpretar:
-            log += self._interpretar_resultado()
+            yield EventoPaso("resultado", self._interpretar_resultado())
         else:
             # si solo pasos, actualizamos la matriz interna
             self.matriz = A
 
-        return log
-
     def _interpretar_resultado(self) -> str:
         """Interpretación tipo jjj.py: pivotes, libres, inconsistencia, homogeneidad, columnas pivote."""
         if self.matriz.size == 0:
@@ -221,25 +535,40 @@ class SistemaLineal:
 # Clases para Vectores
 # ============================
 class Vector:
-    def __init__(self, componentes: List[float]):
-        self.arr = np.array(componentes, dtype=float).copy()
+    # __slots__: sin __dict__ por instancia; los lotes crean cientos de miles de vectores pequeños
+    __slots__ = ("arr", "dimension")
+
+    def __init__(self, componentes: List[float], dtype=np.float64):
+        self.arr = np.array(componentes, dtype=dtype)
         self.dimension = self.arr.size
 
+    @classmethod
+    def _de_arreglo(cls, arr: np.ndarray) -> 'Vector':
+        """Envuelve un arreglo ya calculado sin copiarlo ni pasar por listas."""
+        v = cls.__new__(cls)
+        v.arr = arr
+        v.dimension = arr.size
+        return v
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.arr.dtype
+
     def __str__(self) -> str:
         return f"({', '.join(f'{float(x):.4f}' for x in self.arr)})"
 
     def __add__(self, other: 'Vector') -> 'Vector':
         if self.dimension != other.dimension:
             raise ValueError("Los vectores deben tener la misma dimensión")
-        return Vector((self.arr + other.arr).tolist())
+        return Vector._de_arreglo(self.arr + other.arr)
 
     def __sub__(self, other: 'Vector') -> 'Vector':
         if self.dimension != other.dimension:
             raise ValueError("Los vectores deben tener la misma dimensión")
-        return Vector((self.arr - other.arr).tolist())
+        return Vector._de_arreglo(self.arr - other.arr)
 
     def __mul__(self, escalar: float) -> 'Vector':
-        return Vector((self.arr * escalar).tolist())
+        return Vector._de_arreglo((self.arr * escalar).astype(self.arr.dtype, copy=False))
 
     def __rmul__(self, escalar: float) -> 'Vector':
         return self.__mul__(escalar)
@@ -256,21 +585,454 @@ class Vector:
         return bool(np.all(np.abs(self.arr) < 1e-10))
 
     def opuesto(self) -> 'Vector':
-        return Vector((-self.arr).tolist())
+        return Vector._de_arreglo(-self.arr)
+
+
+class VectorSet:
+    """Conjunto de k vectores de ℝⁿ guardado como una sola matriz contigua k × n (un vector por fila).
+
+    Rango, base del espacio generado e independencia se calculan una sola vez y
+    quedan en caché en el propio conjunto. Se puede usar donde antes iba List[Vector]:
+    admite len, índices (devuelven Vector), rebanadas (devuelven VectorSet) e iteración.
+    """
+
+    __slots__ = ("datos", "k", "dimension", "_cache")
+
+    def __init__(self, vectores, dtype=np.float64):
+        if isinstance(vectores, VectorSet):
+            datos = vectores.datos.astype(dtype, copy=True)
+        elif isinstance(vectores, np.ndarray):
+            datos = np.array(vectores, dtype=dtype, ndmin=2)
+        else:
+            vectores = list(vectores)
+            if vectores and isinstance(vectores[0], Vector):
+                dims = {v.dimension for v in vectores}
+                if len(dims) > 1:
+                    raise ValueError(f"Los vectores tienen dimensiones diferentes ({', '.join(map(str, sorted(dims)))})")
+                datos = np.array([v.arr for v in vectores], dtype=dtype)
+            elif not vectores:
+                datos = np.zeros((0, 0), dtype=dtype)
+            else:
+                datos = np.array(vectores, dtype=dtype)
+            if datos.ndim == 1:
+                datos = datos.reshape(len(vectores), -1)
+        if datos.ndim != 2:
+            raise ValueError("Los vectores tienen dimensiones diferentes")
+        self.datos = np.ascontiguousarray(datos)
+        self.k, self.dimension = self.datos.shape
+        self._cache = {}
+
+    # --- protocolo de secuencia (compatibilidad con List[Vector]) ---
+    def __len__(self) -> int:
+        return self.k
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return VectorSet(self.datos[i])
+        return Vector._de_arreglo(self.datos[i])
+
+    def __iter__(self):
+        for fila in self.datos:
+            yield Vector._de_arreglo(fila)
+
+    def como_columnas(self) -> np.ndarray:
+        """Matriz n × k con los vectores como columnas (vista, sin copiar)."""
+        return self.datos.T
+
+    # --- consultas con caché ---
+    def _svd(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """SVD reducida de los datos (k × n) = U·diag(s)·Vᵀ, calculada una sola vez."""
+        if "svd" not in self._cache:
+            if self.k == 0 or self.dimension == 0:
+                self._cache["svd"] = (np.zeros((self.k, 0)), np.zeros(0), np.zeros((0, self.dimension)))
+            else:
+                self._cache["svd"] = np.linalg.svd(self.datos, full_matrices=False)
+        return self._cache["svd"]
+
+    def _valores_singulares(self) -> Tuple[np.ndarray, np.ndarray]:
+        _, s, vt = self._svd()
+        return s, vt
+
+    def tolerancia(self) -> float:
+        s, _ = self._valores_singulares()
+        return float(s[0]) * max(self.k, self.dimension) * np.finfo(float).eps if s.size else 0.0
+
+    def rango(self) -> int:
+        if "rango" not in self._cache:
+            s, _ = self._valores_singulares()
+            self._cache["rango"] = int(np.sum(s > self.tolerancia()))
+        return self._cache["rango"]
+
+    def es_independiente(self) -> bool:
+        return self.rango() == self.k
+
+    def analisis_rango(self) -> 'AnalisisRango':
+        """QR con pivoteo sobre los vectores como columnas (subconjunto independiente y coeficientes)."""
+        if "qr" not in self._cache:
+            self._cache["qr"] = analisis_rango(self.como_columnas())
+        return self._cache["qr"]
+
+    def base_span(self) -> np.ndarray:
+        """Base ortonormal (r × n, por filas) del espacio generado."""
+        _, vt = self._valores_singulares()
+        return vt[:self.rango()]
+
+    def pertenece_al_span(self, b) -> bool:
+        """True si b ∈ span(v₁, ..., v_k), por residuo de la proyección sobre la base cacheada."""
+        b = b.arr if isinstance(b, Vector) else np.asarray(b, dtype=float)
+        Q = self.base_span()
+        residuo = b - Q.T.dot(Q.dot(b))
+        return bool(np.linalg.norm(residuo) <= 1e-10 * max(1.0, float(np.linalg.norm(b))))
+
+    def combinacion_lote(self, objetivos, tol: float = 1e-10) -> 'ResultadoLote':
+        """Pertenencia al span y coeficientes para muchos vectores b a la vez.
+
+        Reutiliza la SVD cacheada (V·c = b con V = Uᵣ·Σᵣ·Vᵣᵀ por columnas): para la
+        matriz de objetivos B (t × n) basta H = B·Vᵣᵀ, C = (H / Σᵣ)·Uᵣᵀ y el residuo
+        B − H·Vᵣ, tres productos matriciales en lugar de una eliminación por objetivo.
+        Los coeficientes son la solución de norma mínima.
+        """
+        if isinstance(objetivos, VectorSet):
+            B = objetivos.datos
+        else:
+            B = np.array([b.arr if isinstance(b, Vector) else b for b in objetivos], dtype=float)
+        B = B.reshape(-1, self.dimension) if B.size else np.zeros((0, self.dimension))
+        if B.ndim != 2 or B.shape[1] != self.dimension:
+            raise ValueError("Los vectores objetivo deben tener la misma dimensión que el conjunto")
+        u, s, vt = self._svd()
+        r = self.rango()
+        H = B.dot(vt[:r].T)
+        coeficientes = (H / s[:r]).dot(u[:, :r].T)
+        residuos = np.linalg.norm(B - H.dot(vt[:r]), axis=1)
+        pertenece = residuos <= tol * np.maximum(1.0, np.linalg.norm(B, axis=1))
+        return ResultadoLote(pertenece, coeficientes, residuos, r)
+
+    def ortonormalizar(self, metodo: str = "mgs", reortogonalizar: bool = True,
+                       tol: float = 1e-10) -> 'ResultadoOrtonormalizacion':
+        """Base ortonormal del espacio generado (cacheada por método).
+
+        "mgs": Gram-Schmidt modificado orientado por filas; al normalizar qⱼ se resta
+        su componente de todos los vectores restantes en una sola actualización de
+        rango 1, y con reortogonalizar se repite la proyección de wⱼ sobre la base ya
+        construida ("twice is enough"). Los vectores con ‖wⱼ‖ ≤ tol·‖vⱼ‖ se descartan.
+        "householder": QR de Householder (LAPACK) sobre el subconjunto independiente
+        que da el QR con pivoteo; con los signos de R ajustados coincide con Gram-Schmidt.
+        """
+        clave = ("ortonormal", metodo, reortogonalizar)
+        if clave in self._cache:
+            return self._cache[clave]
+        if metodo == "mgs":
+            Q, indices = self._gram_schmidt_modificado(reortogonalizar, tol)
+        elif metodo == "householder":
+            indices = np.sort(self.analisis_rango().independientes)
+            if indices.size:
+                q, r = np.linalg.qr(self.datos[indices].T)
+                signos = np.where(np.diag(r) < 0, -1.0, 1.0)
+                Q = (q * signos).T
+            else:
+                Q = np.zeros((0, self.dimension))
+        else:
+            raise ValueError(f"Método de ortonormalización desconocido: {metodo}")
+        perdida = float(np.linalg.norm(Q.dot(Q.T) - np.eye(Q.shape[0]))) if Q.size else 0.0
+        self._cache[clave] = ResultadoOrtonormalizacion(Q, indices, metodo, perdida)
+        return self._cache[clave]
+
+    def _gram_schmidt_modificado(self, reortogonalizar: bool, tol: float) -> Tuple[np.ndarray, np.ndarray]:
+        W = self.datos.astype(float, copy=True)
+        normas = np.linalg.norm(W, axis=1)
+        Q = np.zeros((min(self.k, self.dimension), self.dimension))
+        indices: List[int] = []
+        r = 0
+        for j in range(self.k):
+            if r == Q.shape[0]:
+                break  # la base ya genera todo ℝⁿ: los vectores restantes son dependientes
+            w = W[j]
+            if reortogonalizar and r:
+                w -= Q[:r].T.dot(Q[:r].dot(w))
+            nw = float(np.linalg.norm(w))
+            if nw <= tol * normas[j] or nw == 0.0:
+                continue
+            q = w / nw
+            Q[r] = q
+            r += 1
+            indices.append(j)
+            if j + 1 < self.k:
+                W[j + 1:] -= np.outer(W[j + 1:].dot(q), q)
+        return Q[:r], np.array(indices, dtype=int)
+
+    # --- propiedades del espacio vectorial sobre todo el conjunto (broadcasting) ---
+    # máximo de elementos temporales por bloque en las comprobaciones por parejas/ternas
+    _ELEMENTOS_POR_BLOQUE = 1 << 22
+
+    def _bloque(self, por_fila: int) -> int:
+        return max(1, VectorSet._ELEMENTOS_POR_BLOQUE // max(1, por_fila))
+
+    def verificar_conmutativa(self) -> bool:
+        """vᵢ + vⱼ = vⱼ + vᵢ para todas las k² parejas (por bloques de i para acotar memoria)."""
+        X = self.datos
+        bloque = self._bloque(self.k * self.dimension)
+        for ini in range(0, self.k, bloque):
+            Xi = X[ini:ini + bloque]
+            if not np.allclose(Xi[:, None, :] + X[None, :, :], X[None, :, :] + Xi[:, None, :]):
+                return False
+        return True
+
+    def verificar_asociativa(self, todas: Optional[bool] = None) -> bool:
+        """(vᵢ + vⱼ) + vₗ = vᵢ + (vⱼ + vₗ).
+
+        Con todas, sobre las k³ ternas (por bloques de i); si no, sobre una muestra de k
+        ternas consecutivas (vᵢ, vᵢ₊₁, vᵢ₊₂) con índices cíclicos, que no prueba la propiedad
+        para el resto. Por defecto todas solo si k ≤ MAX_VECTORES_TERNAS.
+        """
+        X = self.datos
+        if todas is None:
+            todas = self.k <= MAX_VECTORES_TERNAS
+        if not todas:
+            Y, Z = np.roll(X, -1, axis=0), np.roll(X, -2, axis=0)
+            return bool(np.allclose((X + Y) + Z, X + (Y + Z)))
+        bloque = self._bloque(self.k * self.k * self.dimension)
+        for ini in range(0, self.k, bloque):
+            Xi = X[ini:ini + bloque]
+            izq = (Xi[:, None, None, :] + X[None, :, None, :]) + X[None, None, :, :]
+            der = Xi[:, None, None, :] + (X[None, :, None, :] + X[None, None, :, :])
+            if not np.allclose(izq, der):
+                return False
+        return True
+
+    def verificar_opuestos(self) -> bool:
+        """v + (−v) = 0 para cada vector del conjunto."""
+        return bool(np.all(np.abs(self.datos + (-self.datos)) < 1e-10))
+
+    def verificar_escalares(self, a: float = 2.0, b: float = 3.0) -> Tuple[bool, bool]:
+        """(α + β)v = αv + βv y α(βv) = (αβ)v para cada vector del conjunto."""
+        X = self.datos
+        distributiva = bool(np.allclose((a + b) * X, a * X + b * X))
+        asociativa = bool(np.allclose(a * (b * X), (a * b) * X))
+        return distributiva, asociativa
+
+
+class AnalisisRango:
+    """Resultado del QR con pivoteo de columnas: rango, subconjunto independiente y coeficientes."""
+
+    __slots__ = ("rango", "tolerancia", "independientes", "dependientes", "coeficientes", "R")
+
+    def __init__(self, rango: int, tolerancia: float, independientes: np.ndarray,
+                 dependientes: np.ndarray, coeficientes: np.ndarray, R: np.ndarray):
+        self.rango = rango
+        self.tolerancia = tolerancia
+        self.independientes = independientes  # índices 0-based de columnas independientes
+        self.dependientes = dependientes
+        # coeficientes[:, i]: combinación de las independientes que reproduce dependientes[i]
+        self.coeficientes = coeficientes
+        self.R = R
+
+    def relacion(self, i: int) -> str:
+        """Texto 'v_d = c₁·v_a + c₂·v_b ...' para el i-ésimo vector dependiente."""
+        expr = ""
+        for c, j in zip(self.coeficientes[:, i], self.independientes):
+            if abs(c) < 1e-10:
+                continue
+            termino = f"{abs(c):.4f}·v{int(j) + 1}"
+            expr = (termino if c > 0 else f"-{termino}") if not expr else expr + f" {'+' if c > 0 else '-'} {termino}"
+        return f"v{int(self.dependientes[i]) + 1} = {expr or '0'}"
+
+
+def analisis_rango(M: np.ndarray, tol: float = None) -> AnalisisRango:
+    """Rango numérico por QR de Householder con pivoteo de columnas (Businger–Golub).
+
+    Tolerancia relativa por defecto: max(n, k) · eps · |R₀₀|. Las columnas pivote
+    forman un subconjunto independiente maximal; R₁₁·C = R₁₂ da los coeficientes
+    de dependencia de las demás. Cada paso es una actualización vectorizada de rango 1.
+    """
+    A = np.array(M, dtype=float)
+    n, k = A.shape
+    perm = np.arange(k)
+    normas = np.einsum("ij,ij->j", A, A)
+    normas_ref = normas.copy()
+    rango = 0
+    for j in range(min(n, k)):
+        p = j + int(np.argmax(normas[j:]))
+        if p != j:
+            A[:, [j, p]] = A[:, [p, j]]
+            normas[[j, p]] = normas[[p, j]]
+            normas_ref[[j, p]] = normas_ref[[p, j]]
+            perm[[j, p]] = perm[[p, j]]
+        x = A[j:, j]
+        alfa = float(np.linalg.norm(x))
+        if j == 0 and tol is None:
+            tol = max(n, k) * np.finfo(float).eps * alfa
+        if alfa <= tol:
+            break
+        if x[0] > 0:
+            alfa = -alfa
+        v = x.copy()
+        v[0] -= alfa
+        vv = float(v.dot(v))
+        A[j:, j] = 0.0
+        A[j, j] = alfa
+        rango += 1
+        if vv > 0.0 and j + 1 < k:
+            A[j:, j + 1:] -= np.outer(v, (2.0 / vv) * v.dot(A[j:, j + 1:]))
+            normas[j + 1:] -= A[j, j + 1:] ** 2
+            recalcular = normas[j + 1:] < 1e-6 * normas_ref[j + 1:]
+            if np.any(recalcular):
+                idx = np.nonzero(recalcular)[0] + j + 1
+                normas[idx] = np.einsum("ij,ij->j", A[j + 1:, idx], A[j + 1:, idx])
+                normas_ref[idx] = normas[idx]
+    R = np.triu(A[:rango, :])
+    if rango:
+        coef = np.linalg.solve(R[:, :rango], R[:, rango:]) if rango < k else np.zeros((rango, 0))
+    else:
+        coef = np.zeros((0, k))
+    return AnalisisRango(rango, float(tol or 0.0), perm[:rango], perm[rango:], coef, R)
+
+
+class ResultadoLote:
+    """Resultado de VectorSet.combinacion_lote para t vectores objetivo."""
+
+    __slots__ = ("pertenece", "coeficientes", "residuos", "rango")
+
+    def __init__(self, pertenece: np.ndarray, coeficientes: np.ndarray, residuos: np.ndarray, rango: int):
+        self.pertenece = pertenece  # (t,) bool
+        self.coeficientes = coeficientes  # (t × k): fila i = coeficientes de bᵢ sobre v₁..v_k
+        self.residuos = residuos  # (t,) norma de bᵢ − proyección sobre el span
+        self.rango = rango
+
+    def __len__(self) -> int:
+        return self.pertenece.size
+
+
+class ResultadoOrtonormalizacion:
+    """Resultado de VectorSet.ortonormalizar."""
+
+    __slots__ = ("Q", "indices", "metodo", "perdida_ortogonalidad")
+
+    def __init__(self, Q: np.ndarray, indices: np.ndarray, metodo: str, perdida_ortogonalidad: float):
+        self.Q = Q  # (r × n) base ortonormal por filas
+        self.indices = indices  # vector original (0-based) que origina cada qⱼ
+        self.metodo = metodo
+        self.perdida_ortogonalidad = perdida_ortogonalidad  # ‖Q·Qᵀ − I‖_F
+
+    @property
+    def rango(self) -> int:
+        return self.Q.shape[0]
+
+
+class ResultadoPertenencia:
+    """Resultado de agregar un vector a una BaseIncremental."""
+
+    __slots__ = ("indice", "independiente", "coeficientes", "residuo")
+
+    def __init__(self, indice: int, independiente: bool, coeficientes: np.ndarray, residuo: float):
+        self.indice = indice  # posición (0-based) del vector en el flujo
+        self.independiente = independiente
+        # si es dependiente: coeficientes sobre los vectores aceptados (BaseIncremental.aceptados)
+        self.coeficientes = coeficientes
+        self.residuo = residuo
+
+
+class BaseIncremental:
+    """Base que se mantiene mientras llegan vectores, sin re-eliminar el conjunto completo.
+
+    Guarda una base ortonormal Q (r × n, por filas) y el factor triangular R tal que
+    los vectores aceptados son V = Qᵀ·R. Cada vector nuevo se proyecta sobre Q
+    (Gram-Schmidt modificado con una reortogonalización), O(n·r): si el residuo es
+    despreciable es dependiente y R·c = Q·v da sus coeficientes en O(r²); si no,
+    se agrega a la base.
+    """
+
+    __slots__ = ("dimension", "tol", "Q", "R", "rango", "aceptados", "total")
+
+    def __init__(self, dimension: int, tol: float = 1e-10):
+        self.dimension = dimension
+        self.tol = tol
+        self.Q = np.zeros((dimension, dimension), dtype=float)
+        self.R = np.zeros((dimension, dimension), dtype=float)
+        self.rango = 0
+        self.aceptados: List[int] = []
+        self.total = 0
+
+    def base(self) -> np.ndarray:
+        """Base ortonormal actual (r × n)."""
+        return self.Q[:self.rango]
+
+    def coordenadas(self, v) -> Tuple[np.ndarray, float]:
+        """Coeficientes de v sobre los vectores aceptados y norma del residuo (no modifica la base)."""
+        c, residuo, _, _ = self._proyectar(v.arr if isinstance(v, Vector) else np.asarray(v, dtype=float))
+        return c, residuo
+
+    def _proyectar(self, x: np.ndarray):
+        if x.size != self.dimension:
+            raise ValueError("Los vectores deben tener la misma dimensión")
+        r = self.rango
+        Q = self.Q[:r]
+        h = Q.dot(x)
+        w = x - Q.T.dot(h)
+        h2 = Q.dot(w)  # reortogonalización ("twice is enough")
+        w -= Q.T.dot(h2)
+        h += h2
+        residuo = float(np.linalg.norm(w))
+        c = np.zeros(r)
+        for i in range(r - 1, -1, -1):
+            c[i] = (h[i] - self.R[i, i + 1:r].dot(c[i + 1:r])) / self.R[i, i]
+        return c, residuo, h, w
+
+    def agregar(self, v) -> ResultadoPertenencia:
+        x = v.arr if isinstance(v, Vector) else np.asarray(v, dtype=float)
+        c, residuo, h, w = self._proyectar(x)
+        indice = self.total
+        self.total += 1
+        if residuo <= self.tol * max(1.0, float(np.linalg.norm(x))) or self.rango == self.dimension:
+            return ResultadoPertenencia(indice, False, c, residuo)
+        r = self.rango
+        self.Q[r] = w / residuo
+        self.R[:r, r] = h
+        self.R[r, r] = residuo
+        self.rango += 1
+        self.aceptados.append(indice)
+        return ResultadoPertenencia(indice, True, np.zeros(0), residuo)
+
+    def agregar_flujo(self, vectores):
+        """Procesa un iterable/generador de vectores y entrega un ResultadoPertenencia por cada uno."""
+        for v in vectores:
+            yield self.agregar(v)
+
+    def relacion(self, res: ResultadoPertenencia) -> str:
+        if res.independiente:
+            return f"v{res.indice + 1}: independiente → se agrega a la base (residuo {res.residuo:.4e})"
+        expr = ""
+        for i, c in enumerate(res.coeficientes):
+            if abs(c) < 1e-10:
+                continue
+            termino = f"{abs(c):.4f}·v{self.aceptados[i] + 1}"
+            expr = (termino if c > 0 else f"-{termino}") if not expr else expr + f" {'+' if c > 0 else '-'} {termino}"
+        return f"v{res.indice + 1}: dependiente → v{res.indice + 1} = {expr or '0'}"
+
+
+def _como_conjunto(vectores) -> VectorSet:
+    """Normaliza List[Vector] / VectorSet a VectorSet (reutiliza el mismo objeto y su caché)."""
+    return vectores if isinstance(vectores, VectorSet) else VectorSet(vectores)
 
 
 class OperacionesVectoriales:
     @staticmethod
-    def verificar_propiedades_espacio_vectorial(vectores: List[Vector]) -> str:
-        """Verifica las propiedades del espacio vectorial ℝⁿ manteniendo logs similares al original."""
+    def verificar_propiedades_espacio_vectorial(vectores) -> str:
+        """Verifica las propiedades del espacio vectorial ℝⁿ manteniendo logs similares al original.
+
+        Los ejemplos se muestran con v₁, v₂, v₃; cada propiedad se comprueba además
+        sobre todas las parejas/ternas del conjunto de forma vectorizada (con más de
+        MAX_VECTORES_TERNAS vectores, la asociativa solo sobre una muestra de ternas).
+        """
         if not vectores:
             return "No hay vectores para verificar."
 
         resultado = "=== Verificación de Propiedades del Espacio Vectorial ℝⁿ ===\n\n"
-        dim = vectores[0].dimension
-        for v in vectores[1:]:
-            if v.dimension != dim:
-                return f"Error: Los vectores tienen dimensiones diferentes ({dim} vs {v.dimension})"
+        try:
+            conjunto = _como_conjunto(vectores)
+        except ValueError as e:
+            return f"Error: {e}"
+        vectores = conjunto
+        dim = conjunto.dimension
         resultado += f"Dimensión del espacio: ℝ^{dim}\n"
         resultado += f"Número de vectores: {len(vectores)}\n\n"
 
@@ -282,7 +1044,8 @@ class OperacionesVectoriales:
             resultado += f"1. Conmutativa (v₁ + v₂ = v₂ + v₁):\n"
             resultado += f"    v₁ + v₂ = {suma1}\n"
             resultado += f"    v₂ + v₁ = {suma2}\n"
-            resultado += f"    ✓ Cumple: {np.allclose(suma1.arr, suma2.arr)}\n\n"
+            resultado += f"    ✓ Cumple: {np.allclose(suma1.arr, suma2.arr)}\n"
+            resultado += f"    Todas las parejas ({len(vectores)}² = {len(vectores) ** 2}): ✓ {conjunto.verificar_conmutativa()}\n\n"
 
         # 2. Asociativa
         if len(vectores) >= 3:
@@ -292,7 +1055,15 @@ class OperacionesVectoriales:
             resultado += f"2. Asociativa ((v₁ + v₂) + v₃ = v₁ + (v₂ + v₃)):\n"
             resultado += f"    (v₁ + v₂) + v₃ = {suma1}\n"
             resultado += f"    v₁ + (v₂ + v₃) = {suma2}\n"
-            resultado += f"    ✓ Cumple: {np.allclose(suma1.arr, suma2.arr)}\n\n"
+            resultado += f"    ✓ Cumple: {np.allclose(suma1.arr, suma2.arr)}\n"
+            if len(vectores) <= MAX_VECTORES_TERNAS:
+                resultado += f"    Todas las ternas ({len(vectores)}³ = {len(vectores) ** 3}): ✓ {conjunto.verificar_asociativa(True)}\n\n"
+            else:
+                resultado += (
+                    f"    Muestra de {len(vectores)} ternas consecutivas (vᵢ, vᵢ₊₁, vᵢ₊₂) de {len(vectores) ** 3}: "
+                    f"✓ {conjunto.verificar_asociativa(False)}\n"
+                    f"    (comprobación parcial: con más de {MAX_VECTORES_TERNAS} vectores no se recorren todas las ternas)\n\n"
+                )
 
         # 3. Vector cero y 4. opuesto
         vector_cero = Vector([0.0] * dim)
@@ -306,7 +1077,8 @@ class OperacionesVectoriales:
             resultado += f"4. Vector opuesto para v₁ = {v}:\n"
             resultado += f"    -v₁ = {opuesto}\n"
             resultado += f"    v₁ + (-v₁) = {suma_cero}\n"
-            resultado += f"    ✓ Es vector cero: {suma_cero.es_cero()}\n\n"
+            resultado += f"    ✓ Es vector cero: {suma_cero.es_cero()}\n"
+            resultado += f"    Para todos los vectores del conjunto: ✓ {conjunto.verificar_opuestos()}\n\n"
 
         # 5. Propiedades escalares
         if vectores:
@@ -319,13 +1091,19 @@ class OperacionesVectoriales:
             resultado += f"5. Propiedades de multiplicación por escalar:\n"
             resultado += f"    (α + β)v = αv + βv: ✓ {np.allclose(prop1.arr, prop2.arr)}\n"
             resultado += f"    α(βv) = (αβ)v: ✓ {np.allclose(prop3.arr, prop4.arr)}\n"
+            distributiva, asociativa = conjunto.verificar_escalares(a, b)
+            resultado += f"    Para todos los vectores del conjunto: ✓ {distributiva and asociativa}\n"
         return resultado
 
     @staticmethod
-    def combinacion_lineal(vectores: List[Vector], vector_objetivo: Vector) -> str:
+    def combinacion_lineal(vectores, vector_objetivo: Vector) -> str:
         """Determina si vector_objetivo es combinación lineal de los vectores (con logs)."""
         if not vectores:
             return "No hay vectores para la combinación lineal."
+        try:
+            conjunto = _como_conjunto(vectores)
+        except ValueError:
+            return "Error: Los vectores tienen dimensiones diferentes"
 
         resultado = "=== Combinación Lineal de Vectores ===\n\n"
         resultado += f"Vectores dados: {len(vectores)}\n"
@@ -333,22 +1111,15 @@ class OperacionesVectoriales:
             resultado += f"v{i+1} = {v}\n"
         resultado += f"\nVector objetivo: {vector_objetivo}\n\n"
 
-        dim = vectores[0].dimension
-        for v in vectores + [vector_objetivo]:
-            if v.dimension != dim:
-                return "Error: Los vectores tienen dimensiones diferentes"
+        dim = conjunto.dimension
+        if vector_objetivo.dimension != dim:
+            return "Error: Los vectores tienen dimensiones diferentes"
 
         resultado += "Planteo del sistema:\n"
         resultado += f"c₁v₁ + c₂v₂ + ... + c{len(vectores)}v{len(vectores)} = b\n\n"
 
         # construir matriz aumentada (n filas, k+1 cols)
-        matriz_aumentada = []
-        for i in range(dim):
-            fila = [v.componentes[i] if isinstance(v, Vector) else float(v) for v in vectores]
-            # ABOVE: vectores are Vector objects; ensure we get floats
-            # simpler: use the .arr values
-        # Build using numpy for clarity
-        M = np.column_stack([v.arr for v in vectores])  # shape (dim, k)
+        M = conjunto.como_columnas()  # shape (dim, k)
         b = vector_objetivo.arr.reshape(-1, 1)  # shape (dim,1)
         aug = np.hstack([M, b])  # shape (dim, k+1)
         # log matriz aumentada
@@ -362,7 +1133,32 @@ class OperacionesVectoriales:
         return resultado
 
     @staticmethod
-    def ecuacion_vectorial(vectores: List[Vector], vector_objetivo: Vector) -> str:
+    def combinacion_lineal_lote(vectores, objetivos) -> str:
+        """combinacion_lineal para muchos vectores objetivo con una sola factorización del conjunto."""
+        if not vectores:
+            return "No hay vectores para la combinación lineal."
+        try:
+            conjunto = _como_conjunto(vectores)
+            lote = conjunto.combinacion_lote(objetivos)
+        except ValueError as e:
+            return f"Error: {e}"
+
+        resultado = "=== Combinación Lineal por Lotes ===\n\n"
+        resultado += f"Vectores generadores: {conjunto.k} en ℝ^{conjunto.dimension} (rango {lote.rango})\n"
+        resultado += f"Vectores objetivo: {len(lote)}\n\n"
+        for i in range(min(len(lote), MAX_VECTORES_LISTADOS)):
+            if lote.pertenece[i]:
+                terminos = " + ".join(f"({c:.4f})v{j + 1}" for j, c in enumerate(lote.coeficientes[i]) if abs(c) > 1e-10)
+                resultado += f"b{i + 1} = {terminos or '0'}  (residuo {lote.residuos[i]:.3e})\n"
+            else:
+                resultado += f"b{i + 1} ∉ span (residuo {lote.residuos[i]:.3e})\n"
+        if len(lote) > MAX_VECTORES_LISTADOS:
+            resultado += f"… y {len(lote) - MAX_VECTORES_LISTADOS} objetivos más\n"
+        resultado += f"\n{int(lote.pertenece.sum())} de {len(lote)} objetivos son combinación lineal de los vectores.\n"
+        return resultado
+
+    @staticmethod
+    def ecuacion_vectorial(vectores, vector_objetivo: Vector) -> str:
         if not vectores:
             return "No hay vectores para la ecuación."
         resultado = "=== Ecuación Vectorial ===\n\n"
@@ -373,17 +1169,28 @@ class OperacionesVectoriales:
         return resultado + OperacionesVectoriales.combinacion_lineal(vectores, vector_objetivo)
 
     @staticmethod
-    def dependencia_independencia(vectores: List['Vector']) -> str:
-        """Usa SistemaLineal para mostrar pasos y concluir independencia/dependencia."""
+    def dependencia_independencia(vectores, mostrar_pasos: bool = None) -> str:
+        """Concluye independencia/dependencia.
+
+        Con mostrar_pasos usa SistemaLineal para mostrar la eliminación completa; sin
+        pasos usa el QR con pivoteo de columnas (rango, subconjunto independiente y
+        coeficientes de dependencia). Por defecto solo se muestran pasos en conjuntos
+        pequeños (k·n ≤ PASOS_MAX_ENTRADAS).
+        """
         if not vectores:
             return "No hay vectores para verificar independencia."
 
-        n = vectores[0].dimension
-        for v in vectores:
-            if v.dimension != n:
-                return "Error: los vectores tienen dimensiones diferentes."
+        try:
+            vectores = _como_conjunto(vectores)
+        except ValueError:
+            return "Error: los vectores tienen dimensiones diferentes."
+        n = vectores.dimension
 
         k = len(vectores)
+        if mostrar_pasos is None:
+            mostrar_pasos = k * n <= PASOS_MAX_ENTRADAS
+        if not mostrar_pasos:
+            return OperacionesVectoriales._independencia_por_qr(vectores)
         if k == 1:
             return ("=== Verificación de Independencia Lineal ===\n\n"
                     f"Conjunto de 1 vector en ℝ^{n}.\n"
@@ -394,7 +1201,7 @@ class OperacionesVectoriales:
                     "Motivo: hay más vectores que la dimensión del espacio.\n")
 
         # construir M (n x k) con vectores como columnas
-        M = np.column_stack([v.arr for v in vectores])  # shape (n, k)
+        M = vectores.como_columnas()  # shape (n, k)
         # construir aumentada [M | 0]
         aug = np.hstack([M, np.zeros((n, 1))])
         header = "=== Verificación de Independencia Lineal (usando pasos de Gauss del módulo de sistemas) ===\n\n"
@@ -419,15 +1226,140 @@ class OperacionesVectoriales:
                        f"Hay {libres} variable(s) libre(s); existen soluciones no triviales c ≠ 0 con M·c = 0.\n")
         return "".join(out)
 
+    @staticmethod
+    def ortonormalizar(vectores, metodo: str = "mgs", reortogonalizar: bool = True,
+                       mostrar_pasos: bool = None) -> str:
+        """Base ortonormal del espacio generado; con pasos en conjuntos pequeños (k·n ≤ PASOS_MAX_ENTRADAS)."""
+        if not vectores:
+            return "No hay vectores para ortonormalizar."
+        try:
+            conjunto = _como_conjunto(vectores)
+            res = conjunto.ortonormalizar(metodo, reortogonalizar)
+        except ValueError as e:
+            return f"Error: {e}"
+        k, n = conjunto.k, conjunto.dimension
+        if mostrar_pasos is None:
+            mostrar_pasos = k * n <= PASOS_MAX_ENTRADAS
+
+        nombre = "Gram-Schmidt modificado" + (" con reortogonalización" if reortogonalizar else "") \
+            if metodo == "mgs" else "QR de Householder"
+        out = [f"=== Ortonormalización ({nombre}) ===\n\n"]
+        out.append(f"Vectores: {k} en ℝ^{n}\n\n")
+        if mostrar_pasos:
+            # rᵢⱼ = ⟨vⱼ, qᵢ⟩ y ‖wⱼ‖ = rⱼⱼ se reconstruyen de la base final
+            for t, j in enumerate(res.indices):
+                v = conjunto.datos[j]
+                proy = res.Q[:t].dot(v)
+                out.append(f"v{j + 1} = {_fmt_row(v)}\n")
+                if t:
+                    terminos = " − ".join(f"({c:.4f})q{i + 1}" for i, c in enumerate(proy))
+                    out.append(f"  w{t + 1} = v{j + 1} − {terminos}\n")
+                else:
+                    out.append(f"  w{t + 1} = v{j + 1}\n")
+                nw = float(res.Q[t].dot(v))
+                out.append(f"  ‖w{t + 1}‖ = {nw:.4f}\n")
+                out.append(f"  q{t + 1} = w{t + 1} / ‖w{t + 1}‖ = {_fmt_row(res.Q[t])}\n\n")
+            descartados = sorted(set(range(k)) - set(int(i) for i in res.indices))
+            if descartados:
+                motivo = "de los anteriores" if metodo == "mgs" else "del subconjunto pivote"
+                out.append(f"Descartados (dependientes {motivo}): "
+                           f"{', '.join(f'v{i + 1}' for i in descartados)}\n\n")
+        elif res.rango <= MAX_VECTORES_LISTADOS:
+            for t in range(res.rango):
+                out.append(f"q{t + 1} = {_fmt_row(res.Q[t])}\n")
+            out.append("\n")
+        out.append(f"Dimensión del espacio generado: {res.rango}\n")
+        out.append(f"Pérdida de ortogonalidad ‖QQᵀ − I‖ = {res.perdida_ortogonalidad:.3e}\n")
+        return "".join(out)
+
+    @staticmethod
+    def reporte_base_incremental(base: 'BaseIncremental', resultados: List['ResultadoPertenencia']) -> str:
+        """Informe de independencia a partir del estado de una BaseIncremental.
+
+        Relación de cada vector procesado (coeficientes de los dependientes sobre los
+        aceptados), rango, subconjunto independiente maximal y conclusión; no vuelve a
+        eliminar el conjunto completo.
+        """
+        out = ["=== Análisis Incremental de Independencia ===\n\n"]
+        if len(resultados) <= MAX_VECTORES_LISTADOS:
+            out.extend(f"{base.relacion(res)}\n" for res in resultados)
+        else:
+            out.extend(f"{base.relacion(res)}\n" for res in resultados[:MAX_VECTORES_LISTADOS])
+            out.append(f"… y {len(resultados) - MAX_VECTORES_LISTADOS} vectores más\n")
+        out.append("\n=== Conclusión ===\n")
+        out.append(f"Dimensión del espacio: ℝ^{base.dimension}\n")
+        out.append(f"Número de vectores (k): {base.total}\n")
+        out.append(f"Rango: {base.rango}\n")
+        if base.rango <= MAX_VECTORES_LISTADOS:
+            out.append(f"Subconjunto independiente maximal: {', '.join(f'v{i + 1}' for i in base.aceptados) or '—'}\n\n")
+        else:
+            out.append(f"Subconjunto independiente maximal: {base.rango} vectores\n\n")
+        if base.rango == base.total:
+            out.append("r = k ⇒ Conjunto **INDEPENDIENTE**.\n"
+                       "El sistema homogéneo M·c = 0 solo admite la solución trivial c = 0.\n")
+        else:
+            libres = base.total - base.rango
+            out.append("r < k ⇒ Conjunto **DEPENDIENTE**.\n"
+                       f"Hay {libres} vector(es) dependiente(s) de los anteriores; "
+                       "existen soluciones no triviales c ≠ 0 con M·c = 0.\n")
+        return "".join(out)
+
+    @staticmethod
+    def _independencia_por_qr(conjunto: VectorSet) -> str:
+        analisis = conjunto.analisis_rango()
+        k, n = conjunto.k, conjunto.dimension
+        out = ["=== Verificación de Independencia Lineal (QR con pivoteo de columnas) ===\n\n"]
+        out.append(f"Dimensión del espacio: ℝ^{n}\n")
+        out.append(f"Número de vectores (k): {k}\n")
+        out.append(f"Rango numérico: {analisis.rango} (tolerancia relativa {analisis.tolerancia:.3e})\n")
+        indep = np.sort(analisis.independientes)
+        if indep.size <= MAX_VECTORES_LISTADOS:
+            out.append(f"Subconjunto independiente maximal: {', '.join(f'v{int(i) + 1}' for i in indep) or '—'}\n\n")
+        else:
+            out.append(f"Subconjunto independiente maximal: {indep.size} vectores\n\n")
+        if analisis.rango == k:
+            out.append("r = k ⇒ Conjunto **INDEPENDIENTE**.\n"
+                       "El sistema homogéneo M·c = 0 solo admite la solución trivial c = 0.\n")
+        else:
+            out.append("r < k ⇒ Conjunto **DEPENDIENTE**.\n"
+                       "Relaciones de dependencia:\n")
+            for i in range(min(analisis.dependientes.size, MAX_VECTORES_LISTADOS)):
+                out.append(f"  {analisis.relacion(i)}\n")
+            if analisis.dependientes.size > MAX_VECTORES_LISTADOS:
+                out.append(f"  … y {analisis.dependientes.size - MAX_VECTORES_LISTADOS} vectores dependientes más\n")
+        return "".join(out)
+
 
 # ============================
 # Clases para Matrices
 # ============================
 class Matriz:
-    def __init__(self, filas: List[List[float]]):
+    __slots__ = ("filas", "m", "n", "_estructura")
+
+    def __init__(self, filas: List[List[float]], dtype=np.float64):
         # almacenamos como numpy array internamente para operaciones
-        self.filas = np.array([row[:] for row in filas], dtype=float) if filas else np.zeros((0, 0), dtype=float)
+        self.filas = np.array(filas, dtype=dtype) if len(filas) else np.zeros((0, 0), dtype=dtype)
         self.m, self.n = self.filas.shape if self.filas.size else (0, 0)
+        self._estructura = None
+
+    @classmethod
+    def _de_arreglo(cls, arr: np.ndarray) -> 'Matriz':
+        """Envuelve un arreglo 2-D ya calculado sin copiarlo ni pasar por listas."""
+        mat = cls.__new__(cls)
+        mat.filas = arr
+        mat.m, mat.n = arr.shape if arr.size else (0, 0)
+        mat._estructura = None
+        return mat
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.filas.dtype
+
+    def estructura(self) -> EstructuraMatriz:
+        """Clasificación estructural (diagonal, triangular, banda, ...), calculada una sola vez."""
+        if self._estructura is None:
+            self._estructura = clasificar_estructura(self.filas)
+        return self._estructura
 
     def __str__(self) -> str:
         if self.m == 0 or self.n == 0:
@@ -437,23 +1369,20 @@ class Matriz:
     def __add__(self, other: 'Matriz') -> 'Matriz':
         if (self.m, self.n) != (other.m, other.n):
             raise ValueError(f"Las matrices deben tener las mismas dimensiones para sumar ({self.m}×{self.n} y {other.m}×{other.n})")
-        res = self.filas + other.filas
-        return Matriz(res.tolist())
+        return Matriz._de_arreglo(self.filas + other.filas)
 
     def __sub__(self, other: 'Matriz') -> 'Matriz':
         if (self.m, self.n) != (other.m, other.n):
             raise ValueError(f"Las matrices deben tener las mismas dimensiones para restar ({self.m}×{self.n} y {other.m}×{other.n})")
-        res = self.filas - other.filas
-        return Matriz(res.tolist())
+        return Matriz._de_arreglo(self.filas - other.filas)
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return Matriz((self.filas * float(other)).tolist())
+            return Matriz._de_arreglo((self.filas * float(other)).astype(self.filas.dtype, copy=False))
         if isinstance(other, Matriz):
             if self.n != other.m:
                 raise ValueError(f"No se pueden multiplicar matrices {self.m}×{self.n} y {other.m}×{other.n}")
-            prod = self.filas.dot(other.filas)
-            return Matriz(prod.tolist())
+            return Matriz._de_arreglo(self.filas.dot(other.filas))
         raise TypeError(f"La multiplicación no está definida para Matriz y {type(other)}")
 
     def __rmul__(self, other):
@@ -462,7 +1391,7 @@ class Matriz:
         raise TypeError(f"La multiplicación no está definida para {type(other)} y Matriz")
 
     def transpuesta(self) -> 'Matriz':
-        return Matriz(self.filas.T.tolist())
+        return Matriz._de_arreglo(self.filas.T.copy())
 
     def es_cuadrada(self) -> bool:
         return self.m == self.n
@@ -646,17 +1575,29 @@ class OperacionesMatriciales:
     @staticmethod
     def inversa_gauss_jordan(matriz_a: Matriz) -> str:
         """Calcula la inversa por Gauss-Jordan mostrando pasos (preserva logs)."""
+        return unir_pasos(OperacionesMatriciales.iter_pasos_inversa(matriz_a))
+
+    @staticmethod
+    def iter_pasos_inversa(matriz_a: Matriz) -> Iterator[EventoPaso]:
+        """Inversa por Gauss-Jordan como generador de eventos (ver inversa_gauss_jordan)."""
         if not matriz_a.es_cuadrada():
-            return "Error: La matriz A debe ser cuadrada para calcular su inversa."
+            yield EventoPaso("error", "Error: La matriz A debe ser cuadrada para calcular su inversa.")
+            return
 
         n = matriz_a.m
-        pasos_str = "=== Cálculo de Inversa A⁻¹ por Método de Gauss-Jordan ===\n\n"
+
+        def formato(paso: int, operacion: str, matriz: np.ndarray) -> str:
+            return OperacionesMatriciales._imprimir_matriz_aug(matriz.tolist(), paso, operacion, n)
+
+        def evento(paso: int, operacion: str, matriz: np.ndarray) -> EventoPaso:
+            return EventoPaso("operacion", paso=paso, operacion=operacion, matriz=matriz, formato=formato)
+
+        yield EventoPaso("inicio", "=== Cálculo de Inversa A⁻¹ por Método de Gauss-Jordan ===\n\n")
         identidad = np.eye(n)
         aug = np.hstack([matriz_a.filas.copy(), identidad])
-        pasos_str += OperacionesMatriciales._imprimir_matriz_aug(aug.tolist(), 0, "Construir [A | I]", n)
+        yield evento(0, "Construir [A | I]", aug.copy())
         paso = 1
         filas = n
-        columnas_totales = 2 * n
         fila_actual = 0
         columnas_pivote = []
 
@@ -671,36 +1612,37 @@ class OperacionesMatriciales:
                 continue
             if fila_actual != max_rel:
                 aug[[fila_actual, max_rel], :] = aug[[max_rel, fila_actual], :]
-                pasos_str += OperacionesMatriciales._imprimir_matriz_aug(aug.tolist(), paso, f"Intercambio f{fila_actual + 1} ↔ f{max_rel + 1}", n)
+                yield evento(paso, f"Intercambio f{fila_actual + 1} ↔ f{max_rel + 1}", aug.copy())
                 paso += 1
             pivote = aug[fila_actual, col]
             if abs(pivote) > EPS:
                 aug[fila_actual, :] = aug[fila_actual, :] / pivote
-                pasos_str += OperacionesMatriciales._imprimir_matriz_aug(aug.tolist(), paso, f"f{fila_actual + 1} ← (1/{pivote:.4f}) · f{fila_actual + 1}", n)
+                yield evento(paso, f"f{fila_actual + 1} ← (1/{pivote:.4f}) · f{fila_actual + 1}", aug.copy())
                 paso += 1
             factors = aug[:, col].copy()
             mask = (np.arange(filas) != fila_actual) & (np.abs(factors) > EPS)
             if np.any(mask):
                 aug[mask, :] = aug[mask, :] - factors[mask, None] * aug[fila_actual, None, :]
+                instantanea = aug.copy()
                 for i in np.nonzero(mask)[0]:
                     factor = factors[i]
-                    pasos_str += OperacionesMatriciales._imprimir_matriz_aug(aug.tolist(), paso, f"f{i + 1} ← f{i + 1} − ({factor:.4f}) · f{fila_actual + 1}", n)
+                    yield evento(paso, f"f{i + 1} ← f{i + 1} − ({factor:.4f}) · f{fila_actual + 1}", instantanea)
                     paso += 1
             columnas_pivote.append(col)
             fila_actual += 1
 
         num_pivotes = len(columnas_pivote)
-        pasos_str += f"\n--- Proceso de Reducción Finalizado ---\n"
-        pasos_str += OperacionesMatriciales._imprimir_matriz_aug(aug.tolist(), paso, "Matriz Reducida", n)
+        yield EventoPaso("resultado", f"\n--- Proceso de Reducción Finalizado ---\n")
+        yield evento(paso, "Matriz Reducida", aug.copy())
         parte_A_reducida = Matriz(aug[:, :n].tolist())
         if num_pivotes < n or not parte_A_reducida.es_identidad():
-            pasos_str += "La matriz no es invertible porque no tiene pivote en cada fila/columna (no se redujo a la identidad).\n"
-            pasos_str += f"Se encontraron {num_pivotes} pivotes, pero se necesitan {n}.\n"
+            texto = "La matriz no es invertible porque no tiene pivote en cada fila/columna (no se redujo a la identidad).\n"
+            texto += f"Se encontraron {num_pivotes} pivotes, pero se necesitan {n}.\n"
+            yield EventoPaso("resultado", texto)
         else:
             inversa = Matriz(aug[:, n:].tolist())
-            pasos_str += f"La matriz es invertible. La inversa A⁻¹ es:\n{inversa}\n"
-        pasos_str += OperacionesMatriciales._verificar_propiedades_invertibilidad(n, num_pivotes)
-        return pasos_str
+            yield EventoPaso("resultado", f"La matriz es invertible. La inversa A⁻¹ es:\n{inversa}\n", matriz=inversa.filas)
+        yield EventoPaso("resultado", OperacionesMatriciales._verificar_propiedades_invertibilidad(n, num_pivotes))
 
     @staticmethod
     def _submatriz(matriz: List[List[float]], i: int, j: int) -> List[List[float]]:
@@ -736,43 +1678,57 @@ class OperacionesMatriciales:
 
     @staticmethod
     def determinante_cofactores(matriz_a: Matriz) -> str:
+        return unir_pasos(OperacionesMatriciales.iter_pasos_cofactores(matriz_a))
+
+    @staticmethod
+    def iter_pasos_cofactores(matriz_a: Matriz) -> Iterator[EventoPaso]:
+        """Expansión por cofactores como generador: cada término se produce según se calcula.
+
+        El último evento ("resultado") lleva el determinante en `valor`.
+        """
         if not matriz_a.es_cuadrada():
-            return "Error: La matriz debe ser cuadrada para calcular su determinante."
+            yield EventoPaso("error", "Error: La matriz debe ser cuadrada para calcular su determinante.")
+            return
         A = matriz_a.filas.tolist()
-        resultado = "=== Cálculo del Determinante por Expansión por Cofactores ===\n\n"
-        resultado += f"Matriz A ({matriz_a.m}×{matriz_a.n}):\n{matriz_a}\n\n"
-        def det_rec(mat: List[List[float]], nivel: int = 0) -> Tuple[float, str]:
-            n = len(mat)
-            indent = '  ' * nivel
-            if n == 1:
-                val = mat[0][0]
-                return val, f"{indent}det = {val:.4f}\n"
-            if n == 2:
-                det_val = mat[0][0]*mat[1][1] - mat[0][1]*mat[1][0]
-                log = f"{indent}Matriz 2×2:\n{indent}[{mat[0][0]:.4f}  {mat[0][1]:.4f}]\n{indent}[{mat[1][0]:.4f}  {mat[1][1]:.4f}]\n"
-                log += f"{indent}det = {mat[0][0]:.4f} × {mat[1][1]:.4f} - {mat[0][1]:.4f} × {mat[1][0]:.4f} = {det_val:.4f}\n"
-                return det_val, log
-            det_val = 0.0
-            log = f"{indent}Expansión por la fila 1:\n"
-            for j in range(n):
-                signo = (-1) ** (1 + j + 1)
-                menor = OperacionesMatriciales._submatriz(mat, 0, j)
-                det_m, log_m = det_rec(menor, nivel + 1)
-                cofactor = signo * det_m
-                det_val += mat[0][j] * cofactor
-                signo_str = "+" if signo > 0 else "-"
-                log += f"{indent}Cofactor de A[1,{j+1}]:\n{indent}  Signo: {signo_str}\n"
-                log += f"{indent}  Menor (eliminando fila 1 y columna {j+1}):\n"
-                log += log_m
-                log += f"{indent}  Cofactor = {signo:.0f} × {det_m:.4f} = {cofactor:.4f}\n"
-                log += f"{indent}  Término: A[1,{j+1}] × cofactor = {mat[0][j]:.4f} × {cofactor:.4f} = {mat[0][j] * cofactor:.4f}\n\n"
-            log += f"{indent}det = suma de términos = {det_val:.4f}\n"
-            return det_val, log
-        det_value, det_log = det_rec(A)
-        resultado += det_log
-        resultado += f"\n=== Resultado Final ===\n det(A) = {det_value:.4f}\n\n"
-        resultado += "✓ El determinante es distinto de cero, por lo tanto A es invertible.\n" if abs(det_value) > 1e-10 else "✓ El determinante es cero, la matriz NO tiene inversa (es singular).\n"
-        return resultado
+        yield EventoPaso("inicio", "=== Cálculo del Determinante por Expansión por Cofactores ===\n\n"
+                                   f"Matriz A ({matriz_a.m}×{matriz_a.n}):\n{matriz_a}\n\n")
+        if matriz_a.m > 2 and matriz_a.estructura().es_especial():
+            det_value, det_log = determinante_estructurado(matriz_a.filas, matriz_a.estructura())
+            yield EventoPaso("atajo", f"Estructura detectada: matriz {matriz_a.estructura()}.\n" + det_log)
+        else:
+            def det_rec(mat: List[List[float]], nivel: int = 0) -> Iterator[EventoPaso]:
+                n = len(mat)
+                indent = '  ' * nivel
+                if n == 1:
+                    val = mat[0][0]
+                    yield EventoPaso("operacion", f"{indent}det = {val:.4f}\n")
+                    return val
+                if n == 2:
+                    det_val = mat[0][0]*mat[1][1] - mat[0][1]*mat[1][0]
+                    log = f"{indent}Matriz 2×2:\n{indent}[{mat[0][0]:.4f}  {mat[0][1]:.4f}]\n{indent}[{mat[1][0]:.4f}  {mat[1][1]:.4f}]\n"
+                    log += f"{indent}det = {mat[0][0]:.4f} × {mat[1][1]:.4f} - {mat[0][1]:.4f} × {mat[1][0]:.4f} = {det_val:.4f}\n"
+                    yield EventoPaso("operacion", log)
+                    return det_val
+                det_val = 0.0
+                yield EventoPaso("operacion", f"{indent}Expansión por la fila 1:\n")
+                for j in range(n):
+                    signo = (-1) ** (1 + j + 1)
+                    menor = OperacionesMatriciales._submatriz(mat, 0, j)
+                    signo_str = "+" if signo > 0 else "-"
+                    yield EventoPaso("operacion", f"{indent}Cofactor de A[1,{j+1}]:\n{indent}  Signo: {signo_str}\n"
+                                                  f"{indent}  Menor (eliminando fila 1 y columna {j+1}):\n")
+                    det_m = yield from det_rec(menor, nivel + 1)
+                    cofactor = signo * det_m
+                    det_val += mat[0][j] * cofactor
+                    log = f"{indent}  Cofactor = {signo:.0f} × {det_m:.4f} = {cofactor:.4f}\n"
+                    log += f"{indent}  Término: A[1,{j+1}] × cofactor = {mat[0][j]:.4f} × {cofactor:.4f} = {mat[0][j] * cofactor:.4f}\n\n"
+                    yield EventoPaso("operacion", log)
+                yield EventoPaso("operacion", f"{indent}det = suma de términos = {det_val:.4f}\n")
+                return det_val
+            det_value = yield from det_rec(A)
+        texto = f"\n=== Resultado Final ===\n det(A) = {det_value:.4f}\n\n"
+        texto += "✓ El determinante es distinto de cero, por lo tanto A es invertible.\n" if abs(det_value) > 1e-10 else "✓ El determinante es cero, la matriz NO tiene inversa (es singular).\n"
+        yield EventoPaso("resultado", texto, valor=float(det_value))
 
     @staticmethod
     def determinante_cramer(matriz_a: Matriz) -> str:
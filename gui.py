@@ -14,6 +14,7 @@ try:
     from core import (
         SistemaLineal,
         Vector,
+        BaseIncremental,
         OperacionesVectoriales,
         Matriz,
         OperacionesMatriciales,
@@ -179,7 +180,8 @@ class AlgebraLinealGUI(ttk.Frame):
     def _check_linear_independence(self):
         try:
             vectores = self._read_vectors()
-            resultado = OperacionesVectoriales.dependencia_independencia(vectores)
+            self._actualizar_base_incremental(vectores)
+            resultado = OperacionesVectoriales.reporte_base_incremental(self._base_incremental, self._resultados_base)
             self.txt_vectores.delete("1.0", tk.END)
             self.txt_vectores.insert(tk.END, resultado)
             self._status("Verificación de independencia lineal completada.")
@@ -188,6 +190,17 @@ class AlgebraLinealGUI(ttk.Frame):
             self._status("Error en verificación de independencia lineal.")
     
     
+    def _orthonormalize(self):
+        try:
+            vectores = self._read_vectors()
+            resultado = OperacionesVectoriales.ortonormalizar(vectores)
+            self.txt_vectores.delete("1.0", tk.END)
+            self.txt_vectores.insert(tk.END, resultado)
+            self._status("Base ortonormal calculada.")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            self._status("Error en ortonormalización.")
+
     def _build_vectores_tab(self):
         vectores_frame = ttk.Frame(self.notebook)
         self.notebook.add(vectores_frame, text="Vectores")
@@ -227,6 +240,7 @@ class AlgebraLinealGUI(ttk.Frame):
         ttk.Button(ops_buttons, text="Combinación lineal", command=self._linear_combination).pack(side=tk.LEFT, padx=(0,8))
         ttk.Button(ops_buttons, text="Ecuación vectorial", command=self._vector_equation).pack(side=tk.LEFT, padx=(0,8))
         ttk.Button(ops_buttons, text="Independencia lineal", command=self._check_linear_independence).pack(side=tk.LEFT, padx=(0,8))
+        ttk.Button(ops_buttons, text="Base ortonormal", command=self._orthonormalize).pack(side=tk.LEFT, padx=(0,8))
 
         
         card_input = ttk.Frame(vectores_frame, style="Card.TFrame")
@@ -525,6 +539,7 @@ class AlgebraLinealGUI(ttk.Frame):
     def _render_vector_grid(self, dimension: int, num_vectores: int):
         for child in self.vector_frame.winfo_children():
             child.destroy()
+        self._reset_base_incremental()
         self.vector_entries: List[List[ttk.Entry]] = []
         
         for j in range(dimension):
@@ -544,6 +559,22 @@ class AlgebraLinealGUI(ttk.Frame):
         for j in range(dimension + 1):
             self.vector_frame.columnconfigure(j, weight=1)
     
+    def _reset_base_incremental(self):
+        self._base_incremental = None
+        self._vectores_base: List[Tuple[float, ...]] = []
+        self._resultados_base = []
+
+    def _actualizar_base_incremental(self, vectores: List[Vector]):
+        """Solo procesa los vectores nuevos si los anteriores no cambiaron (O(n·r) por vector)."""
+        actuales = [tuple(v.arr.tolist()) for v in vectores]
+        previos = self._vectores_base
+        if self._base_incremental is None or actuales[:len(previos)] != previos:
+            self._reset_base_incremental()
+            self._base_incremental = BaseIncremental(vectores[0].dimension)
+        nuevos = vectores[len(self._vectores_base):]
+        self._resultados_base.extend(self._base_incremental.agregar_flujo(nuevos))
+        self._vectores_base = actuales
+
     def _apply_vector_size(self):
         dim = max(2, int(self.var_dimension.get() or 2))
         num = max(1, int(self.var_num_vectores.get() or 1))
@@ -682,6 +713,7 @@ class AlgebraLinealGUI(ttk.Frame):
             for e in fila:
                 e.delete(0, tk.END)
                 e.insert(0, "0")
+        self._reset_base_incremental()
         self.txt_vectores.delete("1.0", tk.END)
         self._status("Campos de vectores limpiados.")
     
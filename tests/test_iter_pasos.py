@@ -0,0 +1,50 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import Matriz, OperacionesMatriciales, SistemaLineal
+
+# salida de los métodos de texto antes de reescribirlos como generadores (iter_pasos)
+with open(os.path.join(os.path.dirname(__file__), "data", "pasos_originales.json"), encoding="utf-8") as f:
+    ORIGINALES = json.load(f)
+SISTEMAS = ORIGINALES["sistemas"]
+MATRICES = ORIGINALES["matrices"]
+SALIDAS = ORIGINALES["salidas"]
+
+
+@pytest.mark.parametrize("nombre", sorted(SISTEMAS))
+def test_gauss_jordan_sin_cambios(nombre):
+    m = SISTEMAS[nombre]
+    assert SistemaLineal(m).eliminacion_gaussiana() == SALIDAS[f"gauss/{nombre}"]
+    assert SistemaLineal(m).eliminacion_gaussiana_solo_pasos() == SALIDAS[f"gauss_solo_pasos/{nombre}"]
+    assert "".join(e.texto for e in SistemaLineal(m).iter_pasos()) == SALIDAS[f"gauss/{nombre}"]
+
+
+@pytest.mark.parametrize("nombre", sorted(MATRICES))
+def test_inversa_y_cofactores_sin_cambios(nombre):
+    m = Matriz(MATRICES[nombre])
+    assert OperacionesMatriciales.inversa_gauss_jordan(m) == SALIDAS[f"inversa/{nombre}"]
+    assert OperacionesMatriciales.determinante_cofactores(m) == SALIDAS[f"cofactores/{nombre}"]
+    eventos = list(OperacionesMatriciales.iter_pasos_inversa(m))
+    assert "".join(e.texto for e in eventos) == SALIDAS[f"inversa/{nombre}"]
+
+
+def test_cofactores_entrega_el_determinante():
+    eventos = list(OperacionesMatriciales.iter_pasos_cofactores(Matriz(MATRICES["4x4"])))
+    assert eventos[-1].tipo == "resultado"
+    assert eventos[-1].valor == pytest.approx(np.linalg.det(np.array(MATRICES["4x4"], dtype=float)))
+
+
+def test_la_eliminacion_avanza_solo_al_consumir():
+    sistema = SistemaLineal(SISTEMAS["unica"])
+    original = sistema.matriz.copy()
+    pasos = sistema.iter_pasos()
+    assert np.array_equal(sistema.matriz, original)
+    primero = next(e for e in pasos if e.tipo == "operacion")
+    assert np.array_equal(sistema.matriz, primero.matriz)
+    assert not np.array_equal(sistema.matriz, original)